@@ -0,0 +1,58 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Compares the pyparsing grammar with the hand-written parser and the cached conversion of filter strings.
+
+Run from the python directory with: PYTHONPATH=. python benchmarks/expression_parser_benchmark.py
+"""
+
+import timeit
+
+from iceberg.api.expressions import Expressions
+from iceberg.api.expressions.expression_parser import parse_expr_string, parse_expr_string_pyparsing
+
+FILTERS = ["col_a=1",
+           "col_a=1 and col_b=2 and col_c=3",
+           "(a=1 and b=2 and c<>3) or d is null",
+           "ts between 1577836800000 and 1577923200000 and (region = 'us' or region = 'eu') and id is not null"]
+EXPR_MAP = {"and": (Expressions.and_,),
+            "eq": (Expressions.equal,),
+            "exists": (Expressions.not_null,),
+            "gt": (Expressions.greater_than,),
+            "gte": (Expressions.greater_than_or_equal,),
+            "lt": (Expressions.less_than,),
+            "lte": (Expressions.less_than_or_equal,),
+            "missing": (Expressions.is_null,),
+            "neq": (Expressions.not_equal,),
+            "not": (Expressions.not_,),
+            "or": (Expressions.or_,)}
+
+
+def bench(name, func, number):
+    for predicate_string in FILTERS:
+        per_call = timeit.timeit(lambda: func(predicate_string), number=number) / number
+        print("%-12s %8.1f us  %s" % (name, per_call * 1e6, predicate_string))
+
+
+if __name__ == "__main__":
+    for predicate_string in FILTERS:
+        assert parse_expr_string(predicate_string, EXPR_MAP) == parse_expr_string_pyparsing(predicate_string, EXPR_MAP)
+
+    bench("pyparsing", lambda s: parse_expr_string_pyparsing(s, EXPR_MAP), 200)
+    bench("hand-written", lambda s: parse_expr_string(s, EXPR_MAP), 2000)
+    bench("cached", Expressions.convert_string_to_expr, 20000)
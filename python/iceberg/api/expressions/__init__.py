@@ -54,6 +54,7 @@ __all__ = ["ABOVE_MAX",
            "Predicate",
            "Reference",
            "ResidualEvaluator",
+           "SetLiteral",
            "strict",
            "StrictMetricsEvaluator",
            "StrictProjection",
@@ -93,6 +94,7 @@ from .literals import (ABOVE_MAX,
                        IntegerLiteral,
                        Literal,
                        Literals,
+                       SetLiteral,
                        StringLiteral,
                        UUIDLiteral)
 from .predicate import (BoundPredicate,
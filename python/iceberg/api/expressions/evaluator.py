@@ -86,7 +86,11 @@ class Evaluator(object):
             return ref.get(self.struct) != lit.value
 
         def in_(self, ref, lit):
-            raise NotImplementedError()
+            return ref.get(self.struct) in lit.value
 
         def not_in(self, ref, lit):
-            return not self.in_(ref, lit.value)
+            return not self.in_(ref, lit)
+
+        def starts_with(self, ref, lit):
+            value = ref.get(self.struct)
+            return value is not None and value.startswith(lit.value)
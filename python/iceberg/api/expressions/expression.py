@@ -16,15 +16,61 @@
 # under the License.
 
 from enum import Enum
+import threading
+import weakref
 
 
 class Expression(object):
+    """
+    Expressions are immutable: attributes are set by the constructor and the hash is computed once.
+
+    Expression.intern returns a shared instance for equal expressions, so rebuilt trees reuse the
+    subexpressions that did not change.
+    """
+    _hash = None
+    _frozen = False
+    _interned = weakref.WeakValueDictionary()
+    _interned_lock = threading.Lock()
+
     def __init__(self):
         pass
 
     def negate(self):
         raise RuntimeError("%s cannot be negated" % self)
 
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError("Cannot set %s, expressions are immutable: %s" % (name, self))
+
+        object.__setattr__(self, name, value)
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self.key()))
+
+        return self._hash
+
+    def freeze(self):
+        object.__setattr__(self, "_frozen", True)
+
+    def key(self):
+        return type(self),
+
+    def intern_key(self):
+        # children are interned before their parents, so parents are keyed by the identity of their children
+        return self.key()
+
+    @staticmethod
+    def intern(expr):
+        key = expr.intern_key()
+        with Expression._interned_lock:
+            interned = Expression._interned.get(key)
+            if interned is None:
+                Expression._interned[key] = expr
+                return expr
+
+        return interned
+
 
 class Operation(Enum):
     TRUE = "TRUE"
@@ -39,6 +85,7 @@ class Operation(Enum):
     NOT_EQ = "NOT_EQ"
     IN = "IN"
     NOT_IN = "NOT_IN"
+    STARTS_WITH = "STARTS_WITH"
     NOT = "NOT"
     AND = "AND"
     OR = "OR"
@@ -96,6 +143,7 @@ class And(Expression):
     def __init__(self, left, right):
         self.left = left
         self.right = right
+        self.freeze()
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -108,6 +156,15 @@ class And(Expression):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return super(And, self).__hash__()
+
+    def key(self):
+        return And, self.left, self.right
+
+    def intern_key(self):
+        return And, id(self.left), id(self.right)
+
     def op(self):
         return Operation.AND
 
@@ -145,12 +202,16 @@ class FalseExp(Expression):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return super(FalseExp, self).__hash__()
+
 
 class Or(Expression):
 
     def __init__(self, left, right):
         self.left = left
         self.right = right
+        self.freeze()
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -163,6 +224,15 @@ class Or(Expression):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return super(Or, self).__hash__()
+
+    def key(self):
+        return Or, self.left, self.right
+
+    def intern_key(self):
+        return Or, id(self.left), id(self.right)
+
     def op(self):
         return Operation.OR
 
@@ -181,6 +251,7 @@ class Not(Expression):
 
     def __init__(self, child):
         self.child = child
+        self.freeze()
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -193,6 +264,15 @@ class Not(Expression):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return super(Not, self).__hash__()
+
+    def key(self):
+        return Not, self.child
+
+    def intern_key(self):
+        return Not, id(self.child)
+
     def op(self):
         return Operation.NOT
 
@@ -212,7 +292,7 @@ class TrueExp(Expression):
         return Operation.TRUE
 
     def negate(self):
-        return False
+        return FALSE
 
     def __repr__(self):
         return "true"
@@ -229,6 +309,9 @@ class TrueExp(Expression):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return super(TrueExp, self).__hash__()
+
 
 TRUE = TrueExp()
 FALSE = FalseExp()
@@ -18,6 +18,7 @@
 # https://github.com/pyparsing/pyparsing/blob/master/examples/simpleSQL.py
 
 import logging
+import re
 
 from pyparsing import (
     alphanums,
@@ -84,6 +85,9 @@ op_map = {"=": "eq",
           "!=": "neq",
           "<>": "neq",
           "neq": "neq",
+          "ne": "neq",
+          "le": "lte",
+          "ge": "gte",
           "||": "or",
           "or": "or",
           "&&": "and",
@@ -94,7 +98,7 @@ op_map = {"=": "eq",
 
 
 def get_expr_tree(tokens):
-    if isinstance(tokens, (str, int)):
+    if isinstance(tokens, (str, int, float)):
         return tokens
     if len(tokens) > 1:
         if (tokens[0] == "not"):
@@ -150,6 +154,10 @@ def get_expr(node, expr_map):
 
 
 def parse_expr_string(predicate_string, expr_map):
+    return get_expr(ExpressionStringParser(predicate_string).parse(), expr_map)
+
+
+def parse_expr_string_pyparsing(predicate_string, expr_map):
     from pyparsing import ParseException
 
     try:
@@ -159,3 +167,172 @@ def parse_expr_string(predicate_string, expr_map):
     except ParseException as pe:
         _logger.error("Error parsing string expression into iceberg expression: %s" % str(pe))
         raise
+
+
+class ExpressionStringParser(object):
+    """
+    Recursive-descent parser for the where clause grammar above, producing the same trees as get_expr_tree.
+
+    NOT binds tighter than AND, which binds tighter than OR, and both AND and OR nest to the right.
+    """
+
+    TOKEN_PATTERN = re.compile(r"""\s*(?:
+                                  (?P<string>"(?:[^"\n\r\\]|""|\\.)*"|'(?:[^'\n\r\\]|''|\\.)*')
+                                  |(?P<real>[+-]?(?:\d+\.\d*|\.\d+))
+                                  |(?P<int>[+-]?\d+)
+                                  |(?P<op>==|!=|<=|>=|<>|=|<|>)
+                                  |(?P<word>[A-Za-z][A-Za-z0-9_$]*(?:\.[A-Za-z][A-Za-z0-9_$]*)*)
+                                  |(?P<punct>[(),]))""", re.VERBOSE)
+    WORD_OPS = ("eq", "ne", "lt", "le", "gt", "ge")
+    CONDITION_KEYWORDS = ("in", "is", "between")
+
+    def __init__(self, predicate_string):
+        self.predicate_string = predicate_string
+        self.tokens = ExpressionStringParser.tokenize(predicate_string)
+        self.pos = 0
+
+    @staticmethod
+    def tokenize(predicate_string):
+        tokens = list()
+        pos = 0
+        end = len(predicate_string.rstrip())
+        while pos < end:
+            match = ExpressionStringParser.TOKEN_PATTERN.match(predicate_string, pos)
+            if match is None:
+                ExpressionStringParser.fail(predicate_string, pos, "Unexpected character")
+            tokens.append((match.lastgroup, match.group(match.lastgroup), match.start(match.lastgroup)))
+            pos = match.end()
+
+        return tokens
+
+    @staticmethod
+    def fail(predicate_string, loc, msg):
+        from pyparsing import ParseException
+        _logger.error("Error parsing string expression into iceberg expression: %s (at char %s)" % (msg, loc))
+        raise ParseException(predicate_string, loc, msg)
+
+    def parse(self):
+        tree = self.or_expr()
+        if self.pos < len(self.tokens):
+            self.error("Expected end of text")
+
+        return tree
+
+    def error(self, msg):
+        loc = self.tokens[self.pos][2] if self.pos < len(self.tokens) else len(self.predicate_string)
+        ExpressionStringParser.fail(self.predicate_string, loc, msg)
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            self.error("Unexpected end of text")
+        self.pos += 1
+        return token
+
+    def is_keyword(self, keyword):
+        kind, value, _ = self.peek()
+        return kind == "word" and value.lower() == keyword
+
+    def expect(self, kind, value=None):
+        token = self.next()
+        if token[0] != kind or (value is not None and token[1].lower() != value):
+            self.pos -= 1
+            self.error("Expected %s" % (value or kind))
+        return token[1]
+
+    def or_expr(self):
+        return self.binary("or", self.and_expr)
+
+    def and_expr(self):
+        return self.binary("and", self.unary)
+
+    def binary(self, keyword, operand):
+        operands = [operand()]
+        while self.is_keyword(keyword):
+            self.pos += 1
+            operands.append(operand())
+
+        tree = operands[-1]
+        for left in reversed(operands[:-1]):
+            tree = {keyword: [left, tree]}
+        return tree
+
+    def unary(self):
+        if not self.is_keyword("not"):
+            return self.primary()
+
+        self.pos += 1
+        if self.peek()[1] == "(":
+            return {"not": self.primary()}
+
+        column = self.expect("word")
+        if self.at_condition():
+            return {"not": self.condition(column)}
+
+        return {"not": column}
+
+    def primary(self):
+        if self.peek()[1] == "(":
+            self.pos += 1
+            tree = self.or_expr()
+            self.expect("punct", ")")
+            return tree
+
+        return self.condition(self.expect("word"))
+
+    def at_condition(self):
+        kind, value, _ = self.peek()
+        if kind == "word":
+            return value in ExpressionStringParser.WORD_OPS or value.lower() in ExpressionStringParser.CONDITION_KEYWORDS
+
+        return kind == "op"
+
+    def condition(self, column):
+        if not self.at_condition():
+            self.error("Expected a comparison")
+
+        kind, value, _ = self.next()
+        keyword = value.lower() if kind == "word" else None
+        if keyword == "in":
+            return {"in": [column, self.values()]}
+        elif keyword == "is":
+            return self.null_check(column)
+        elif keyword == "between":
+            lower = self.value()
+            self.expect("word", "and")
+            return {"and": [{"gte": [column, lower]}, {"lte": [column, self.value()]}]}
+
+        return {op_map[value]: [column, self.value()]}
+
+    def null_check(self, column):
+        if self.is_keyword("not"):
+            self.pos += 1
+            self.expect("word", "null")
+            return {"exists": column}
+
+        self.expect("word", "null")
+        return {"missing": column}
+
+    def values(self):
+        self.expect("punct", "(")
+        values = [self.value()]
+        while self.peek()[1] == ",":
+            self.pos += 1
+            values.append(self.value())
+        self.expect("punct", ")")
+        return values
+
+    def value(self):
+        kind, value, _ = self.next()
+        if kind == "real":
+            return float(value)
+        elif kind == "int":
+            return int(value)
+        elif kind in ("string", "word"):
+            return value
+
+        self.pos -= 1
+        self.error("Expected a value")
@@ -18,20 +18,25 @@
 import logging
 
 from .expression import (And,
+                         Expression,
                          FALSE,
                          Not,
                          Operation,
                          Or,
                          TRUE)
 from .expression_parser import parse_expr_string
+from .literals import Literals, SetLiteral
 from .predicate import (Predicate,
                         UnboundPredicate)
 from .reference import NamedReference
+from ..util import LRUCache
 
 _logger = logging.getLogger(__name__)
 
 
 class Expressions(object):
+    PARSE_CACHE_SIZE = 1024
+    _parsed = LRUCache(PARSE_CACHE_SIZE)
 
     @staticmethod
     def and_(left, right):
@@ -42,7 +47,7 @@ class Expressions(object):
         elif right == Expressions.always_true():
             return left
 
-        return And(left, right)
+        return Expression.intern(And(left, right))
 
     @staticmethod
     def or_(left, right):
@@ -53,7 +58,7 @@ class Expressions(object):
         elif right == Expressions.always_false():
             return left
 
-        return Or(left, right)
+        return Expression.intern(Or(left, right))
 
     @staticmethod
     def not_(child):
@@ -64,50 +69,76 @@ class Expressions(object):
         elif isinstance(child, Not):
             return child.child
 
-        return Not(child)
+        return Expression.intern(Not(child))
 
     @staticmethod
     def is_null(name):
-        return UnboundPredicate(Operation.IS_NULL, Expressions.ref(name))
+        return Expression.intern(UnboundPredicate(Operation.IS_NULL, Expressions.ref(name)))
 
     @staticmethod
     def not_null(name):
-        return UnboundPredicate(Operation.NOT_NULL, Expressions.ref(name))
+        return Expression.intern(UnboundPredicate(Operation.NOT_NULL, Expressions.ref(name)))
 
     @staticmethod
     def less_than(name, value):
-        return UnboundPredicate(Operation.LT, Expressions.ref(name), value)
+        return Expression.intern(UnboundPredicate(Operation.LT, Expressions.ref(name), value))
 
     @staticmethod
     def less_than_or_equal(name, value):
-        return UnboundPredicate(Operation.LT_EQ, Expressions.ref(name), value)
+        return Expression.intern(UnboundPredicate(Operation.LT_EQ, Expressions.ref(name), value))
 
     @staticmethod
     def greater_than(name, value):
-        return UnboundPredicate(Operation.GT, Expressions.ref(name), value)
+        return Expression.intern(UnboundPredicate(Operation.GT, Expressions.ref(name), value))
 
     @staticmethod
     def greater_than_or_equal(name, value):
-        return UnboundPredicate(Operation.GT_EQ, Expressions.ref(name), value)
+        return Expression.intern(UnboundPredicate(Operation.GT_EQ, Expressions.ref(name), value))
 
     @staticmethod
     def equal(name, value):
-        return UnboundPredicate(Operation.EQ, Expressions.ref(name), value)
+        return Expression.intern(UnboundPredicate(Operation.EQ, Expressions.ref(name), value))
 
     @staticmethod
     def not_equal(name, value):
-        return UnboundPredicate(Operation.NOT_EQ, Expressions.ref(name), value)
+        return Expression.intern(UnboundPredicate(Operation.NOT_EQ, Expressions.ref(name), value))
+
+    @staticmethod
+    def in_(name, values):
+        values = list(values)
+        if not values:
+            return Expressions.always_false()
+        elif len(values) == 1:
+            return Expressions.equal(name, values[0])
+
+        return Expression.intern(UnboundPredicate(Operation.IN, Expressions.ref(name),
+                                                  lit=SetLiteral(Literals.from_(value) for value in values)))
+
+    @staticmethod
+    def not_in(name, values):
+        values = list(values)
+        if not values:
+            return Expressions.always_true()
+        elif len(values) == 1:
+            return Expressions.not_equal(name, values[0])
+
+        return Expression.intern(UnboundPredicate(Operation.NOT_IN, Expressions.ref(name),
+                                                  lit=SetLiteral(Literals.from_(value) for value in values)))
+
+    @staticmethod
+    def starts_with(name, value):
+        return Expression.intern(UnboundPredicate(Operation.STARTS_WITH, Expressions.ref(name), value))
 
     @staticmethod
     def predicate(op, name, value=None, lit=None):
         if value is not None and op not in (Operation.IS_NULL, Operation.NOT_NULL):
-            return UnboundPredicate(op, Expressions.ref(name), value)
+            return Expression.intern(UnboundPredicate(op, Expressions.ref(name), value))
         elif lit is not None and op not in (Operation.IS_NULL, Operation.NOT_NULL):
-            return UnboundPredicate(op, Expressions.ref(name), value)
+            return Expression.intern(UnboundPredicate(op, Expressions.ref(name), lit=lit))
         elif op in (Operation.IS_NULL, Operation.NOT_NULL):
             if value is not None or lit is not None:
                 raise RuntimeError("Cannot create {} predicate inclusive a value".format(op))
-            return UnboundPredicate(op, Expressions.ref(name))
+            return Expression.intern(UnboundPredicate(op, Expressions.ref(name)))
         else:
             raise RuntimeError("Cannot create {} predicate without a value".format(op))
 
@@ -123,12 +154,31 @@ class Expressions(object):
     def rewrite_not(expr):
         return ExpressionVisitors.visit(expr, RewriteNot.get()) # noqa
 
+    @staticmethod
+    def normalize(expr, struct=None, case_sensitive=True):
+        from .normalizer import Normalizer
+        return Normalizer.normalize(expr, struct, case_sensitive)
+
+    @staticmethod
+    def normalize_filter(expr, struct, case_sensitive=True):
+        from .normalizer import Normalizer
+        return Normalizer.normalize_filter(expr, struct, case_sensitive)
+
     @staticmethod
     def ref(name):
         return NamedReference(name)
 
     @staticmethod
     def convert_string_to_expr(predicate_string):
+        # expressions are immutable, so the parsed expression for a filter string is shared
+        return Expressions._parsed.get(predicate_string, lambda: Expressions.parse(predicate_string))
+
+    @staticmethod
+    def clear_cache():
+        Expressions._parsed.clear()
+
+    @staticmethod
+    def parse(predicate_string):
         expr_map = {"and": (Expressions.and_,),
                     "eq": (Expressions.equal,),
                     "exists": (Expressions.not_null,),
@@ -221,6 +271,9 @@ class ExpressionVisitors(object):
         def not_in(self, ref, lit):
             return None
 
+        def starts_with(self, ref, lit):
+            return None
+
         def predicate(self, pred): # noqa
 
             if isinstance(pred, UnboundPredicate):
@@ -246,6 +299,8 @@ class ExpressionVisitors(object):
                 return self.in_(pred.ref, pred.lit)
             elif pred.op == Operation.NOT_IN:
                 return self.not_in(pred.ref, pred.lit)
+            elif pred.op == Operation.STARTS_WITH:
+                return self.starts_with(pred.ref, pred.lit)
             else:
                 raise RuntimeError("Unknown operation for Predicate: {}".format(pred.op))
 
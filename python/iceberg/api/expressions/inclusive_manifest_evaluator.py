@@ -155,7 +155,44 @@ class ManifestEvalVisitor(ExpressionVisitors.BoundExpressionVisitor):
         return ROWS_MIGHT_MATCH
 
     def in_(self, ref, lit):
+        field_stats = self.stats[ref.pos]
+        if field_stats.lower_bound() is None:
+            return ROWS_CANNOT_MATCH
+
+        lower = Conversions.from_byte_buffer(ref.type, field_stats.lower_bound())
+        upper = Conversions.from_byte_buffer(ref.type, field_stats.upper_bound())
+
+        if not lit.contains_between(lower, upper):
+            return ROWS_CANNOT_MATCH
+
         return ROWS_MIGHT_MATCH
 
     def not_in(self, ref, lit):
+        field_stats = self.stats[ref.pos]
+        if field_stats.contains_null() or field_stats.lower_bound() is None:
+            return ROWS_MIGHT_MATCH
+
+        lower = Conversions.from_byte_buffer(ref.type, field_stats.lower_bound())
+        upper = Conversions.from_byte_buffer(ref.type, field_stats.upper_bound())
+
+        if lower == upper and lower in lit.value:
+            return ROWS_CANNOT_MATCH
+
+        return ROWS_MIGHT_MATCH
+
+    def starts_with(self, ref, lit):
+        field_stats = self.stats[ref.pos]
+        if field_stats.lower_bound() is None:
+            return ROWS_CANNOT_MATCH
+
+        # bounds are compared after truncating them to the length of the prefix
+        prefix = lit.value
+        lower = Conversions.from_byte_buffer(ref.type, field_stats.lower_bound())
+        if lower[:len(prefix)] > prefix:
+            return ROWS_CANNOT_MATCH
+
+        upper = Conversions.from_byte_buffer(ref.type, field_stats.upper_bound())
+        if upper[:len(prefix)] < prefix:
+            return ROWS_CANNOT_MATCH
+
         return ROWS_MIGHT_MATCH
@@ -182,7 +182,62 @@ class MetricsEvalVisitor(ExpressionVisitors.BoundExpressionVisitor):
         return MetricsEvalVisitor.ROWS_MIGHT_MATCH
 
     def in_(self, ref, lit):
+        id = ref.field_id
+        field = self.struct.field(id=id)
+
+        if field is None:
+            raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
+
+        lower = None
+        if self.lower_bounds is not None and id in self.lower_bounds:
+            lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
+
+        upper = None
+        if self.upper_bounds is not None and id in self.upper_bounds:
+            upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
+
+        if not lit.contains_between(lower, upper):
+            return MetricsEvalVisitor.ROWS_CANNOT_MATCH
+
         return MetricsEvalVisitor.ROWS_MIGHT_MATCH
 
     def not_in(self, ref, lit):
+        id = ref.field_id
+        field = self.struct.field(id=id)
+
+        if field is None:
+            raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
+
+        # null values are not in the set, so only a file of one excluded value cannot match
+        if self.null_counts is None or self.null_counts.get(id, -1) != 0:
+            return MetricsEvalVisitor.ROWS_MIGHT_MATCH
+
+        if self.lower_bounds is not None and id in self.lower_bounds \
+                and self.upper_bounds is not None and id in self.upper_bounds:
+            lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
+            upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
+            if lower == upper and lower in lit.value:
+                return MetricsEvalVisitor.ROWS_CANNOT_MATCH
+
+        return MetricsEvalVisitor.ROWS_MIGHT_MATCH
+
+    def starts_with(self, ref, lit):
+        id = ref.field_id
+        field = self.struct.field(id=id)
+
+        if field is None:
+            raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
+
+        # bounds are compared after truncating them to the length of the prefix
+        prefix = lit.value
+        if self.lower_bounds is not None and id in self.lower_bounds:
+            lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
+            if lower[:len(prefix)] > prefix:
+                return MetricsEvalVisitor.ROWS_CANNOT_MATCH
+
+        if self.upper_bounds is not None and id in self.upper_bounds:
+            upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
+            if upper[:len(prefix)] < prefix:
+                return MetricsEvalVisitor.ROWS_CANNOT_MATCH
+
         return MetricsEvalVisitor.ROWS_MIGHT_MATCH
@@ -15,10 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from bisect import bisect_left
 import datetime
 from decimal import (Decimal,
                      ROUND_HALF_UP)
+import math
+import re
+import threading
 import uuid
+import weakref
 
 import pytz
 
@@ -28,15 +33,44 @@ from .expression import (FALSE,
 from .java_variables import (JAVA_MAX_FLOAT,
                              JAVA_MIN_FLOAT)
 from ..types.type import TypeID
+from ..util import LRUCache
 
 
 class Literals(object):
 
     EPOCH = datetime.datetime.utcfromtimestamp(0)
     EPOCH_DAY = EPOCH.date()
+    EPOCH_ORDINAL = EPOCH_DAY.toordinal()
+    MICROS_IN_SECOND = 1000000
+    MICROS_IN_DAY = 86400 * MICROS_IN_SECOND
 
-    @staticmethod  # noqa: C901
+    ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})$")
+    ISO_TIME = re.compile(r"(\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?$")
+    ISO_TIMESTAMP = re.compile(r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?"
+                               r"(Z|[+-]\d{2}(?::?\d{2})?)?$")
+
+    CONVERSION_CACHE_SIZE = 4096
+    _conversions = LRUCache(CONVERSION_CACHE_SIZE)
+    _interned = weakref.WeakValueDictionary()
+    _interned_lock = threading.Lock()
+
+    @staticmethod
     def from_(value):
+        """Returns the literal for a value, equal values share one literal while it is in use."""
+        key = Literals.value_key(value)
+        if key is None:
+            return Literals.create(value)
+
+        with Literals._interned_lock:
+            literal = Literals._interned.get(key)
+            if literal is None:
+                literal = Literals.create(value)
+                Literals._interned[key] = literal
+
+        return literal
+
+    @staticmethod  # noqa: C901
+    def create(value):
         if value is None:
             raise RuntimeError("Cannot create an expression literal from None")
         if isinstance(value, bool):
@@ -62,6 +96,106 @@ class Literals(object):
         else:
             raise RuntimeError("Unimplemented Type Literal")
 
+    @staticmethod
+    def value_key(value):
+        # True equals 1, -0.0 equals 0.0 and Decimal("1.0") equals Decimal("1.00"), but their literals differ
+        if isinstance(value, Decimal):
+            return Decimal, value.as_tuple()
+        elif isinstance(value, float):
+            return float, value, math.copysign(1.0, value)
+
+        try:
+            hash(value)
+        except TypeError:
+            return None
+
+        return type(value), value
+
+    @staticmethod
+    def literal_key(literal):
+        """Returns a key that only matches literals of the same classes, values and decimal scales."""
+        if literal is None:
+            return None
+        elif isinstance(literal, SetLiteral):
+            return SetLiteral, frozenset(Literals.literal_key(lit) for lit in literal.literals)
+
+        value_key = Literals.value_key(literal.value)
+        return type(literal), literal if value_key is None else value_key
+
+    @staticmethod
+    def convert(literal, type_var):
+        """Converts a literal to a type, reusing the result of earlier conversions of an equal literal."""
+        key = None
+        if not isinstance(literal, SetLiteral) and type_var is not None and type_var.is_primitive_type():
+            value_key = Literals.value_key(literal.value)
+            key = None if value_key is None else (type(literal), value_key, type_var)
+
+        if key is None:
+            return literal.convert_to(type_var)
+
+        return Literals._conversions.get(key, lambda: literal.convert_to(type_var))
+
+    @staticmethod
+    def parse_date(value):
+        """Parses an ISO-8601 date to days from the epoch, other formats are left to dateutil."""
+        match = Literals.ISO_DATE.match(value)
+        if match is None:
+            import dateutil.parser
+            return (dateutil.parser.parse(value) - Literals.EPOCH).days
+
+        return Literals.epoch_days(*match.groups())
+
+    @staticmethod
+    def parse_time(value):
+        """Parses an ISO-8601 time to microseconds from midnight, other formats are left to dateutil."""
+        match = Literals.ISO_TIME.match(value)
+        if match is None:
+            import dateutil.parser
+            return (dateutil.parser.parse(Literals.EPOCH.strftime("%Y-%m-%d ") + value) - Literals.EPOCH) \
+                // datetime.timedelta(microseconds=1)
+
+        return Literals.micros_of_day(*match.groups())
+
+    @staticmethod
+    def parse_timestamp(value):
+        """Parses an ISO-8601 timestamp to microseconds from the epoch in UTC and whether it had a zone offset.
+
+        Other formats are left to dateutil."""
+        match = Literals.ISO_TIMESTAMP.match(value)
+        if match is None:
+            import dateutil.parser
+            timestamp = dateutil.parser.parse(value)
+            epoch = Literals.EPOCH if timestamp.tzinfo is None else Literals.EPOCH.replace(tzinfo=pytz.UTC)
+            return (timestamp - epoch) // datetime.timedelta(microseconds=1), timestamp.tzinfo is not None
+
+        year, month, day, hour, minute, second, fraction, zone = match.groups()
+        micros = Literals.epoch_days(year, month, day) * Literals.MICROS_IN_DAY \
+            + Literals.micros_of_day(hour, minute, second, fraction)
+        if zone is None:
+            return micros, False
+
+        return micros - Literals.zone_offset_minutes(zone) * 60 * Literals.MICROS_IN_SECOND, True
+
+    @staticmethod
+    def epoch_days(year, month, day):
+        return datetime.date(int(year), int(month), int(day)).toordinal() - Literals.EPOCH_ORDINAL
+
+    @staticmethod
+    def micros_of_day(hour, minute, second=None, fraction=None):
+        # validates the fields like dateutil, which raises ValueError for an hour of 24
+        time = datetime.time(int(hour), int(minute), int(second or 0))
+        micros = ((time.hour * 60 + time.minute) * 60 + time.second) * Literals.MICROS_IN_SECOND
+        return micros + (int(fraction.ljust(6, "0")) if fraction else 0)
+
+    @staticmethod
+    def zone_offset_minutes(zone):
+        if zone == "Z":
+            return 0
+
+        digits = zone[1:].replace(":", "")
+        minutes = int(digits[:2]) * 60 + int(digits[2:] or 0)
+        return -minutes if zone[0] == "-" else minutes
+
     @staticmethod
     def above_max():
         return ABOVE_MAX
@@ -101,7 +235,10 @@ class Literal(object):
         elif isinstance(value, Decimal):
             return DecimalLiteral(value)
 
-    def to(self, type):
+    def to(self, type_var):
+        return Literals.convert(self, type_var)
+
+    def convert_to(self, type_var):
         raise NotImplementedError()
 
 
@@ -109,7 +246,7 @@ class BaseLiteral(Literal):
     def __init__(self, value):
         self.value = value
 
-    def to(self, type):
+    def convert_to(self, type_var):
         raise NotImplementedError()
 
     def __eq__(self, other):
@@ -123,6 +260,9 @@ class BaseLiteral(Literal):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.value)
+
     def __repr__(self):
         return "BaseLiteral(%s)" % str(self.value)
 
@@ -135,7 +275,7 @@ class ComparableLiteral(BaseLiteral):
     def __init__(self, value):
         super(ComparableLiteral, self).__init__(value)
 
-    def to(self, type):
+    def convert_to(self, type_var):
         raise NotImplementedError()
 
     def __eq__(self, other):
@@ -144,6 +284,9 @@ class ComparableLiteral(BaseLiteral):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.value)
+
     def __lt__(self, other):
         if self.value is None:
             return True
@@ -188,7 +331,7 @@ class AboveMax(Literal):
     def value(self):
         raise RuntimeError("AboveMax has no value")
 
-    def to(self, type):
+    def to(self, type_var):
         raise RuntimeError("Cannot change the type of AboveMax")
 
     def __str__(self):
@@ -202,7 +345,7 @@ class BelowMin(Literal):
     def value(self):
         raise RuntimeError("BelowMin has no value")
 
-    def to(self, type):
+    def to(self, type_var):
         raise RuntimeError("Cannot change the type of BelowMin")
 
     def __str__(self):
@@ -214,7 +357,7 @@ class BooleanLiteral(ComparableLiteral):
     def __init__(self, value):
         super(BooleanLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.BOOLEAN:
             return self
 
@@ -224,7 +367,7 @@ class IntegerLiteral(ComparableLiteral):
     def __init__(self, value):
         super(IntegerLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.INTEGER:
             return self
         elif type_var.type_id == TypeID.LONG:
@@ -249,7 +392,7 @@ class LongLiteral(ComparableLiteral):
     def __init__(self, value):
         super(LongLiteral, self).__init__(value)
 
-    def to(self, type_var):  # noqa: C901
+    def convert_to(self, type_var):  # noqa: C901
         if type_var.type_id == TypeID.INTEGER:
             if Literal.JAVA_MAX_INT < self.value:
                 return ABOVE_MAX
@@ -281,7 +424,7 @@ class FloatLiteral(ComparableLiteral):
     def __init__(self, value):
         super(FloatLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.FLOAT:
             return self
         elif type_var.type_id == TypeID.DOUBLE:
@@ -302,7 +445,7 @@ class DoubleLiteral(ComparableLiteral):
     def __init__(self, value):
         super(DoubleLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.FLOAT:
             if JAVA_MAX_FLOAT < self.value:
                 return ABOVE_MAX
@@ -328,7 +471,7 @@ class DateLiteral(ComparableLiteral):
     def __init__(self, value):
         super(DateLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.DATE:
             return self
 
@@ -338,7 +481,7 @@ class TimeLiteral(ComparableLiteral):
     def __init__(self, value):
         super(TimeLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.TIME:
             return self
 
@@ -348,11 +491,11 @@ class TimestampLiteral(ComparableLiteral):
     def __init__(self, value):
         super(TimestampLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.TIMESTAMP:
             return self
         elif type_var.type_id == TypeID.DATE:
-            return DateLiteral((datetime.datetime.fromtimestamp(self.value / 1000000) - Literals.EPOCH).days)
+            return DateLiteral(self.value // Literals.MICROS_IN_DAY)
 
 
 class DecimalLiteral(ComparableLiteral):
@@ -360,7 +503,7 @@ class DecimalLiteral(ComparableLiteral):
     def __init__(self, value):
         super(DecimalLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.DECIMAL and type_var.scale == abs(self.value.as_tuple().exponent):
             return self
 
@@ -369,24 +512,17 @@ class StringLiteral(BaseLiteral):
     def __init__(self, value):
         super(StringLiteral, self).__init__(value)
 
-    def to(self, type_var):  # noqa: C901
-        import dateutil.parser
+    def convert_to(self, type_var):  # noqa: C901
         if type_var.type_id == TypeID.DATE:
-            return DateLiteral((dateutil.parser.parse(self.value) - Literals.EPOCH).days)
+            return DateLiteral(Literals.parse_date(self.value))
         elif type_var.type_id == TypeID.TIME:
-            return TimeLiteral(
-                int((dateutil.parser.parse(Literals.EPOCH.strftime("%Y-%m-%d ") + self.value) - Literals.EPOCH)
-                    .total_seconds() * 1000000))
+            return TimeLiteral(Literals.parse_time(self.value))
         elif type_var.type_id == TypeID.TIMESTAMP:
-            timestamp = dateutil.parser.parse(self.value)
-            EPOCH = Literals.EPOCH
-            if bool(timestamp.tzinfo) != bool(type_var.adjust_to_utc):
+            micros, has_zone = Literals.parse_timestamp(self.value)
+            if has_zone != bool(type_var.adjust_to_utc):
                 raise RuntimeError("Cannot convert to %s when string is: %s" % (type_var, self.value))
 
-            if timestamp.tzinfo is not None:
-                EPOCH = EPOCH.replace(tzinfo=pytz.UTC)
-
-            return TimestampLiteral(int((timestamp - EPOCH).total_seconds() * 1000000))
+            return TimestampLiteral(micros)
         elif type_var.type_id == TypeID.STRING:
             return self
         elif type_var.type_id == TypeID.UUID:
@@ -415,6 +551,9 @@ class StringLiteral(BaseLiteral):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.value)
+
     def __lt__(self, other):
         if other is None:
             return False
@@ -447,7 +586,7 @@ class UUIDLiteral(ComparableLiteral):
     def __init__(self, value):
         super(UUIDLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.UUID:
             return self
 
@@ -456,7 +595,7 @@ class FixedLiteral(BaseLiteral):
     def __init__(self, value):
         super(FixedLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.FIXED:
             if len(self.value) == type_var.length:
                 return self
@@ -472,6 +611,9 @@ class FixedLiteral(BaseLiteral):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(bytes(self.value))
+
     def __lt__(self, other):
         if other is None:
             return False
@@ -501,7 +643,7 @@ class BinaryLiteral(BaseLiteral):
     def __init__(self, value):
         super(BinaryLiteral, self).__init__(value)
 
-    def to(self, type_var):
+    def convert_to(self, type_var):
         if type_var.type_id == TypeID.FIXED:
             if type_var.length == len(self.value):
                 return FixedLiteral(self.value)
@@ -518,6 +660,9 @@ class BinaryLiteral(BaseLiteral):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(bytes(self.value))
+
     def __lt__(self, other):
         if other is None:
             return False
@@ -543,6 +688,49 @@ class BinaryLiteral(BaseLiteral):
         return self.value >= other.value
 
 
+class SetLiteral(BaseLiteral):
+    """The literals of an IN or NOT_IN predicate, value is the set of their values."""
+
+    def __init__(self, literals):
+        self.literals = tuple(literals)
+        super(SetLiteral, self).__init__(frozenset(lit.value for lit in self.literals))
+        self._sorted_values = None
+
+    @property
+    def sorted_values(self):
+        if self._sorted_values is None:
+            self._sorted_values = tuple(sorted(self.value))
+
+        return self._sorted_values
+
+    def contains_between(self, lower, upper):
+        """Returns whether any value falls between the inclusive bounds, a None bound is unbounded."""
+        values = self.sorted_values
+        start = 0 if lower is None else bisect_left(values, lower)
+
+        return start < len(values) and (upper is None or values[start] <= upper)
+
+    @property
+    def literal_type(self):
+        # the literal class shared by every element, None when the elements differ
+        types = {type(lit) for lit in self.literals}
+        return types.pop() if len(types) == 1 else None
+
+    def convert_to(self, type_var):
+        converted = [lit.to(type_var) for lit in self.literals]
+        if any(lit is None for lit in converted):
+            return None
+
+        # values outside the range of the type can never match
+        return SetLiteral(lit for lit in converted if not isinstance(lit, (AboveMax, BelowMin)))
+
+    def __repr__(self):
+        return "SetLiteral(%s)" % self
+
+    def __str__(self):
+        return "{%s}" % ", ".join(sorted(str(lit) for lit in self.literals))
+
+
 class FixedLiteralProxy(object):
 
     def __init__(self, buffer=None):
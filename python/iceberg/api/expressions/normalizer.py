@@ -0,0 +1,244 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from functools import reduce
+
+from .binder import Binder
+from .expression import And, Expression, FALSE, Operation, Or, TRUE
+from .expressions import Expressions
+from .literals import SetLiteral
+from .predicate import BoundPredicate, Predicate
+from .reference import BoundReference
+
+RANGE_OPS = (Operation.LT, Operation.LT_EQ, Operation.GT, Operation.GT_EQ)
+LOWER_OPS = (Operation.GT, Operation.GT_EQ)
+UPPER_OPS = (Operation.LT, Operation.LT_EQ)
+
+
+class Normalizer(object):
+    """
+    Rewrites an expression into an equivalent one that is cheaper to evaluate.
+
+    Negations are pushed down to predicates, constants are folded, duplicate terms are removed, range
+    predicates on the same reference are merged into the tightest bounds of a conjunction or the loosest
+    bounds of a disjunction, and equality predicates on the same reference in a disjunction become IN.
+
+    Only bound predicates are merged, because an unbound literal may not order like the column: the
+    string "2020-01-01T00:00:00-05:00" sorts before "2020-01-01T01:00:00+00:00" but is the later
+    timestamp. Pass the struct to bind the expression before it is normalized.
+    """
+
+    @staticmethod
+    def normalize(expr, struct=None, case_sensitive=True):
+        if struct is not None:
+            expr = Binder.bind(struct, expr, case_sensitive)
+
+        return Normalizer.visit(Expressions.rewrite_not(expr))
+
+    @staticmethod
+    def normalize_filter(expr, struct, case_sensitive=True):
+        """Normalizes a row filter bound to the struct and returns it unbound, for evaluators that bind it."""
+        return Normalizer.unbind(Normalizer.normalize(expr, struct, case_sensitive), struct)
+
+    @staticmethod
+    def unbind(expr, struct):
+        if isinstance(expr, And):
+            return Expressions.and_(Normalizer.unbind(expr.left, struct), Normalizer.unbind(expr.right, struct))
+        elif isinstance(expr, Or):
+            return Expressions.or_(Normalizer.unbind(expr.left, struct), Normalizer.unbind(expr.right, struct))
+        elif isinstance(expr, BoundPredicate):
+            return Expressions.predicate(expr.op, struct.fields[expr.ref.pos].name, lit=expr.lit)
+
+        return expr
+
+    @staticmethod
+    def visit(expr):
+        if isinstance(expr, And):
+            return Normalizer.simplify_and([Normalizer.visit(term) for term in Normalizer.flatten(expr, And)])
+        elif isinstance(expr, Or):
+            return Normalizer.simplify_or([Normalizer.visit(term) for term in Normalizer.flatten(expr, Or)])
+
+        return expr
+
+    @staticmethod
+    def flatten(expr, cls):
+        if isinstance(expr, cls):
+            return Normalizer.flatten(expr.left, cls) + Normalizer.flatten(expr.right, cls)
+
+        return [expr]
+
+    @staticmethod
+    def simplify_and(terms):
+        terms = Normalizer.dedupe(term for child in terms for term in Normalizer.flatten(child, And)
+                                  if term != TRUE)
+        if FALSE in terms:
+            return FALSE
+
+        others, groups = Normalizer.group_predicates(terms)
+        merged = list()
+        for group in groups.values():
+            merged.extend(Normalizer.intersect(group))
+
+        if FALSE in merged or Normalizer.has_null_conflict(others + merged):
+            return FALSE
+
+        return reduce(Expressions.and_, others + merged, TRUE)
+
+    @staticmethod
+    def simplify_or(terms):
+        terms = Normalizer.dedupe(term for child in terms for term in Normalizer.flatten(child, Or)
+                                  if term != FALSE)
+        if TRUE in terms or Normalizer.has_null_conflict(terms):
+            return TRUE
+
+        others, groups = Normalizer.group_predicates(terms)
+        merged = list()
+        for group in groups.values():
+            merged.extend(Normalizer.union(group))
+
+        return reduce(Expressions.or_, others + merged, FALSE)
+
+    @staticmethod
+    def dedupe(terms):
+        unique = list()
+        for term in terms:
+            if term not in unique:
+                unique.append(term)
+
+        return unique
+
+    @staticmethod
+    def has_null_conflict(terms):
+        # is_null and not_null of the same reference: a conjunction is false and a disjunction is true
+        null_refs = [Normalizer.ref_key(term.ref) for term in terms
+                     if isinstance(term, Predicate) and term.op == Operation.IS_NULL]
+        return any(isinstance(term, Predicate) and term.op == Operation.NOT_NULL
+                   and Normalizer.ref_key(term.ref) in null_refs for term in terms)
+
+    @staticmethod
+    def group_predicates(terms):
+        """Splits out the comparisons that can be merged, grouped by reference and literal class."""
+        others = list()
+        groups = dict()
+        for term in terms:
+            key = Normalizer.group_key(term)
+            if key is None:
+                others.append(term)
+            else:
+                groups.setdefault(key, list()).append(term)
+
+        return others, groups
+
+    @staticmethod
+    def group_key(term):
+        if not isinstance(term, BoundPredicate) or term.op not in RANGE_OPS + (Operation.EQ, Operation.IN):
+            return None
+
+        literal_type = term.lit.literal_type if isinstance(term.lit, SetLiteral) else type(term.lit)
+        if literal_type is None:
+            return None
+
+        return Normalizer.ref_key(term.ref), literal_type
+
+    @staticmethod
+    def ref_key(ref):
+        return ref.field_id if isinstance(ref, BoundReference) else ref.name
+
+    @staticmethod
+    def intersect(group):
+        lower = Normalizer.tightest([pred for pred in group if pred.op in LOWER_OPS])
+        upper = Normalizer.tightest([pred for pred in group if pred.op in UPPER_OPS])
+
+        values = None
+        for pred in group:
+            if pred.op in (Operation.EQ, Operation.IN):
+                pred_values = Normalizer.literals(pred)
+                values = pred_values if values is None else [lit for lit in values if lit in pred_values]
+
+        if values is not None:
+            values = [lit for lit in values if Normalizer.in_range(lit, lower, upper)]
+            return [Normalizer.values_predicate(group[0], values)] if values else [FALSE]
+
+        return Normalizer.range_predicates(lower, upper)
+
+    @staticmethod
+    def range_predicates(lower, upper):
+        if lower is None or upper is None or lower.lit < upper.lit:
+            return [pred for pred in (lower, upper) if pred is not None]
+        elif lower.lit == upper.lit and lower.op == Operation.GT_EQ and upper.op == Operation.LT_EQ:
+            return [Normalizer.copy(lower, Operation.EQ, lower.lit)]
+
+        return [FALSE]
+
+    @staticmethod
+    def union(group):
+        lower = Normalizer.tightest([pred for pred in group if pred.op in LOWER_OPS], most_selective=False)
+        upper = Normalizer.tightest([pred for pred in group if pred.op in UPPER_OPS], most_selective=False)
+
+        values = list()
+        for pred in group:
+            if pred.op in (Operation.EQ, Operation.IN):
+                values.extend(lit for lit in Normalizer.literals(pred) if lit not in values)
+
+        # values already matched by one of the remaining ranges are redundant
+        values = [lit for lit in values
+                  if not (lower is not None and Normalizer.in_range(lit, lower, None))
+                  and not (upper is not None and Normalizer.in_range(lit, None, upper))]
+
+        merged = [Normalizer.values_predicate(group[0], values)] if values else list()
+        return merged + [pred for pred in (lower, upper) if pred is not None]
+
+    @staticmethod
+    def tightest(preds, most_selective=True):
+        """Returns the bound that excludes the most values, or the fewest when most_selective is False."""
+        best = None
+        for pred in preds:
+            if best is None or Normalizer.excludes_more(pred, best) == most_selective:
+                best = pred
+
+        return best
+
+    @staticmethod
+    def excludes_more(pred, other):
+        if pred.lit == other.lit:
+            return pred.op in (Operation.GT, Operation.LT) and other.op in (Operation.GT_EQ, Operation.LT_EQ)
+
+        return pred.lit > other.lit if pred.op in LOWER_OPS else pred.lit < other.lit
+
+    @staticmethod
+    def in_range(lit, lower, upper):
+        if lower is not None and (lit < lower.lit or lit == lower.lit and lower.op == Operation.GT):
+            return False
+        if upper is not None and (lit > upper.lit or lit == upper.lit and upper.op == Operation.LT):
+            return False
+
+        return True
+
+    @staticmethod
+    def literals(pred):
+        return list(pred.lit.literals) if isinstance(pred.lit, SetLiteral) else [pred.lit]
+
+    @staticmethod
+    def values_predicate(template, values):
+        if len(values) == 1:
+            return Normalizer.copy(template, Operation.EQ, values[0])
+
+        return Normalizer.copy(template, Operation.IN, SetLiteral(values))
+
+    @staticmethod
+    def copy(template, op, lit):
+        return Expression.intern(BoundPredicate(op, template.ref, lit))
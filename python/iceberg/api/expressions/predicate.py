@@ -22,8 +22,10 @@ from .expression import (Expression,
                          Operation,
                          TRUE)
 from .literals import (Literal,
-                       Literals)
+                       Literals,
+                       SetLiteral)
 from .reference import BoundReference
+from ..types import TypeID
 
 
 class Predicate(Expression):
@@ -32,6 +34,7 @@ class Predicate(Expression):
         self.op = op
         self.ref = ref
         self.lit = lit
+        self.freeze()
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -44,10 +47,20 @@ class Predicate(Expression):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return super(Predicate, self).__hash__()
+
+    def key(self):
+        return Predicate, self.op, self.ref, self.lit
+
+    def intern_key(self):
+        # equal literals of different types or scales bind differently, so they are not shared
+        return type(self), self.op, self.ref, Literals.literal_key(self.lit)
+
     def __repr__(self):
         return "Predicate({},{},{})".format(self.op, self.ref, self.lit)
 
-    def __str__(self):
+    def __str__(self):  # noqa: C901
         if self.op == Operation.IS_NULL:
             return "is_null({})".format(self.ref)
         elif self.op == Operation.NOT_NULL:
@@ -64,6 +77,12 @@ class Predicate(Expression):
             return "equal({})".format(self.ref)
         elif self.op == Operation.NOT_EQ:
             return "not_equal({})".format(self.ref)
+        elif self.op == Operation.IN:
+            return "in({}, {})".format(self.ref, self.lit)
+        elif self.op == Operation.NOT_IN:
+            return "not_in({}, {})".format(self.ref, self.lit)
+        elif self.op == Operation.STARTS_WITH:
+            return "starts_with({}, {})".format(self.ref, self.lit)
         else:
             return "invalid predicate: operation = {}".format(self.op)
 
@@ -74,7 +93,7 @@ class BoundPredicate(Predicate):
         super(BoundPredicate, self).__init__(op, ref, lit)
 
     def negate(self):
-        return BoundPredicate(self.op.negate(), self.ref, self.lit)
+        return Expression.intern(BoundPredicate(self.op.negate(), self.ref, self.lit))
 
 
 class UnboundPredicate(Predicate):
@@ -91,7 +110,7 @@ class UnboundPredicate(Predicate):
             super(UnboundPredicate, self).__init__(op, named_ref, lit)
 
     def negate(self):
-        return UnboundPredicate(self.op.negate(), self.ref, self.lit)
+        return Expression.intern(UnboundPredicate(self.op.negate(), self.ref, self.lit))
 
     def bind(self, struct, case_sensitive=True):  # noqa: C901
         if case_sensitive:
@@ -106,18 +125,23 @@ class UnboundPredicate(Predicate):
             if self.op == Operation.IS_NULL:
                 if field.is_required:
                     return FALSE
-                return BoundPredicate(Operation.IS_NULL, BoundReference(struct, field.field_id))
+                return Expression.intern(BoundPredicate(Operation.IS_NULL, BoundReference(struct, field.field_id)))
             elif self.op == Operation.NOT_NULL:
                 if field.is_required:
                     return TRUE
-                return BoundPredicate(Operation.NOT_NULL, BoundReference(struct, field.field_id))
+                return Expression.intern(BoundPredicate(Operation.NOT_NULL, BoundReference(struct, field.field_id)))
             else:
                 raise ValidationException("Operation must be IS_NULL or NOT_NULL", None)
 
+        ValidationException.check(self.op != Operation.STARTS_WITH or field.type.type_id == TypeID.STRING,
+                                  "Cannot use starts_with on non-string field '%s': %s", (self.ref.name, field.type))
+
         literal = self.lit.to(field.type)
         if literal is None:
             raise ValidationException("Invalid value for comparison inclusive type %s: %s (%s)",
                                       (field.type, self.lit.value, type(self.lit.value)))
+        elif isinstance(literal, SetLiteral) and not literal.value:
+            return FALSE if self.op == Operation.IN else TRUE
         elif literal == Literals.above_max():
             if self.op in (Operation.LT,
                            Operation.LT_EQ,
@@ -138,4 +162,4 @@ class UnboundPredicate(Predicate):
                              Operation.EQ):
                 return TRUE
 
-        return BoundPredicate(self.op, BoundReference(struct, field.field_id), literal)
+        return Expression.intern(BoundPredicate(self.op, BoundReference(struct, field.field_id), literal))
@@ -101,6 +101,9 @@ class StrictProjection(BaseProjectionEvaluator):
         super(StrictProjection, self).__init__(spec)
 
     def predicate(self, pred):
+        if isinstance(pred, UnboundPredicate):
+            return super(StrictProjection, self).predicate(pred)
+
         part = self.spec.get_field_by_source_id(pred.ref.field_id)
 
         if part is None:
@@ -44,6 +44,9 @@ class BoundReference(Reference):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash((self.field_id, self.pos))
+
     def find(self, field_id, struct):
         fields = struct.fields
         for i, field in enumerate(fields):
@@ -81,6 +84,9 @@ class NamedReference(Reference):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.name)
+
     def __repr__(self):
         return "NamedReference({})".format(self.name)
 
@@ -15,22 +15,25 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
+
 from .expressions import Expressions, ExpressionVisitors
 from .predicate import BoundPredicate, Predicate, UnboundPredicate
 
 
 class ResidualEvaluator(object):
 
-    def __init__(self, spec, expr):
+    def __init__(self, spec, expr, case_sensitive=True):
         self._spec = spec
         self._expr = expr
-        self.__visitor = None
+        self._case_sensitive = case_sensitive
+        self.thread_local_data = threading.local()
 
     def _visitor(self):
-        if self.__visitor is None:
-            self.__visitor = ResidualVisitor()
+        if not hasattr(self.thread_local_data, "visitors"):
+            self.thread_local_data.visitors = ResidualVisitor(self._spec, self._expr, self._case_sensitive)
 
-        return self.__visitor
+        return self.thread_local_data.visitors
 
     def residual_for(self, partition_data):
         return self._visitor().eval(partition_data)
@@ -38,11 +41,15 @@ class ResidualEvaluator(object):
 
 class ResidualVisitor(ExpressionVisitors.BoundExpressionVisitor):
 
-    def __init__(self):
+    def __init__(self, spec, expr, case_sensitive=True):
+        self.spec = spec
+        self.expr = expr
+        self.case_sensitive = case_sensitive
         self.struct = None
 
     def eval(self, struct):
         self.struct = struct
+        return ExpressionVisitors.visit(self.expr, self)
 
     def always_true(self):
         return Expressions.always_true()
@@ -57,16 +64,20 @@ class ResidualVisitor(ExpressionVisitors.BoundExpressionVisitor):
         return self.always_true() if ref.get(self.struct) is not None else self.always_false()
 
     def lt(self, ref, lit):
-        return self.always_true() if ref.get(self.struct) < lit.value else self.always_false()
+        value = ref.get(self.struct)
+        return self.always_true() if value is not None and value < lit.value else self.always_false()
 
     def lt_eq(self, ref, lit):
-        return self.always_true() if ref.get(self.struct) <= lit.value else self.always_false()
+        value = ref.get(self.struct)
+        return self.always_true() if value is not None and value <= lit.value else self.always_false()
 
     def gt(self, ref, lit):
-        return self.always_true() if ref.get(self.struct) > lit.value else self.always_false()
+        value = ref.get(self.struct)
+        return self.always_true() if value is not None and value > lit.value else self.always_false()
 
     def gt_eq(self, ref, lit):
-        return self.always_true() if ref.get(self.struct) >= lit.value else self.always_false()
+        value = ref.get(self.struct)
+        return self.always_true() if value is not None and value >= lit.value else self.always_false()
 
     def eq(self, ref, lit):
         return self.always_true() if ref.get(self.struct) == lit.value else self.always_false()
@@ -74,6 +85,16 @@ class ResidualVisitor(ExpressionVisitors.BoundExpressionVisitor):
     def not_eq(self, ref, lit):
         return self.always_true() if ref.get(self.struct) != lit.value else self.always_false()
 
+    def in_(self, ref, lit):
+        return self.always_true() if ref.get(self.struct) in lit.value else self.always_false()
+
+    def not_in(self, ref, lit):
+        return self.always_true() if ref.get(self.struct) not in lit.value else self.always_false()
+
+    def starts_with(self, ref, lit):
+        value = ref.get(self.struct)
+        return self.always_true() if value is not None and value.startswith(lit.value) else self.always_false()
+
     def not_(self, result):
         return Expressions.not_(result)
 
@@ -96,17 +117,27 @@ class ResidualVisitor(ExpressionVisitors.BoundExpressionVisitor):
         if part is None:
             return pred
 
+        # if the strict projection holds for the partition, all rows in the file match
         strict_projection = part.transform.project_strict(part.name, pred)
-        if strict_projection is None:
-            bound = strict_projection.bind(self.spec.partition_type())
-            if isinstance(bound, BoundPredicate):
-                return super(ResidualVisitor, self).predicate(bound)
-            return bound
+        if strict_projection is not None and self.eval_projection(strict_projection) == self.always_true():
+            return self.always_true()
+
+        # if the inclusive projection fails for the partition, no rows in the file can match
+        inclusive_projection = part.transform.project(part.name, pred)
+        if inclusive_projection is not None and self.eval_projection(inclusive_projection) == self.always_false():
+            return self.always_false()
 
         return pred
 
+    def eval_projection(self, projection):
+        bound = projection.bind(self.spec.partition_type())
+        if isinstance(bound, BoundPredicate):
+            return super(ResidualVisitor, self).predicate(bound)
+
+        return bound
+
     def unbound_predicate(self, pred):
-        bound = pred.bind(self.spec.schema.as_struct())
+        bound = pred.bind(self.spec.schema.as_struct(), case_sensitive=self.case_sensitive)
 
         if isinstance(bound, BoundPredicate):
             bound_residual = self.predicate(bound)
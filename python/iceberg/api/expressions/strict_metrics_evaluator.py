@@ -24,10 +24,11 @@ from ..types import Conversions
 
 class StrictMetricsEvaluator(object):
 
-    def __init__(self, schema, unbound):
+    def __init__(self, schema, unbound, case_sensitive=True):
         self.schema = schema
         self.struct = schema.as_struct()
-        self.expr = Binder.bind(self.struct, Expressions.rewrite_not(unbound))
+        self.case_sensitive = case_sensitive
+        self.expr = Binder.bind(self.struct, Expressions.rewrite_not(unbound), case_sensitive)
         self.thread_local_data = threading.local()
 
     def _visitor(self):
@@ -67,6 +68,10 @@ class StrictMetricsEvaluator(object):
 
             return ExpressionVisitors.visit(self.expr, self)
 
+        def can_contain_nulls(self, id):
+            # null values never satisfy a comparison
+            return self.null_counts is not None and self.null_counts.get(id, 0) > 0
+
         def always_true(self):
             return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MUST_MATCH
 
@@ -113,6 +118,9 @@ class StrictMetricsEvaluator(object):
             if field is None:
                 raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
 
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
             if self.upper_bounds is not None and id in self.upper_bounds:
                 upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
                 if upper < lit.value:
@@ -129,6 +137,9 @@ class StrictMetricsEvaluator(object):
             if field is None:
                 raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
 
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
             if self.upper_bounds is not None and id in self.upper_bounds:
                 upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
                 if upper <= lit.value:
@@ -145,6 +156,9 @@ class StrictMetricsEvaluator(object):
             if field is None:
                 raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
 
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
             if self.lower_bounds is not None and id in self.lower_bounds:
                 lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
                 if lower > lit.value:
@@ -161,6 +175,9 @@ class StrictMetricsEvaluator(object):
             if field is None:
                 raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
 
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
             if self.lower_bounds is not None and id in self.lower_bounds:
                 lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
                 if lower >= lit.value:
@@ -177,6 +194,9 @@ class StrictMetricsEvaluator(object):
             if field is None:
                 raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
 
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
             if self.lower_bounds is not None and id in self.lower_bounds \
                     and self.upper_bounds is not None and id in self.upper_bounds:
                 lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
@@ -215,7 +235,64 @@ class StrictMetricsEvaluator(object):
             return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
 
         def in_(self, ref, lit):
+            # Rows must match when Min == Max and the value is in the set
+            id = ref.field_id
+
+            field = self.struct.field(id=id)
+
+            if field is None:
+                raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
+
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
+            if self.lower_bounds is not None and id in self.lower_bounds \
+                    and self.upper_bounds is not None and id in self.upper_bounds:
+                lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
+                upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
+
+                if lower == upper and lower in lit.value:
+                    return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MUST_MATCH
+
             return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
 
         def not_in(self, ref, lit):
+            # Rows must match when no value of the set is in [Min, Max]
+            id = ref.field_id
+
+            field = self.struct.field(id=id)
+
+            if field is None:
+                raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
+
+            if self.lower_bounds is not None and id in self.lower_bounds \
+                    and self.upper_bounds is not None and id in self.upper_bounds:
+                lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
+                upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
+
+                if not lit.contains_between(lower, upper):
+                    return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MUST_MATCH
+
+            return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
+        def starts_with(self, ref, lit):
+            # Rows must match when Min and Max start with X, as every value between them does too
+            id = ref.field_id
+
+            field = self.struct.field(id=id)
+
+            if field is None:
+                raise RuntimeError("Cannot filter by nested column: %s" % self.schema.find_field(id))
+
+            if self.can_contain_nulls(id):
+                return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
+
+            if self.lower_bounds is not None and id in self.lower_bounds \
+                    and self.upper_bounds is not None and id in self.upper_bounds:
+                lower = Conversions.from_byte_buffer(field.type, self.lower_bounds.get(id))
+                upper = Conversions.from_byte_buffer(field.type, self.upper_bounds.get(id))
+
+                if lower.startswith(lit.value) and upper.startswith(lit.value):
+                    return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MUST_MATCH
+
             return StrictMetricsEvaluator.MetricsEvalVisitor.ROWS_MIGHT_NOT_MATCH
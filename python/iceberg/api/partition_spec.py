@@ -88,10 +88,8 @@ class PartitionSpec(object):
 
     def partition_to_path(self, data):
         sb = list()
-        java_classes = self.java_classes
-        for i, jclass in enumerate(java_classes):
-            field = self.__fields[i]
-            value_string = field.transform().to_human_string(self.get(data, i, jclass))
+        for i, field in enumerate(self.__fields):
+            value_string = field.transform.to_human_string(data.get(i))
 
             if i > 0:
                 sb.append("/")
@@ -127,8 +125,8 @@ class PartitionSpec(object):
         source_ids = set()
         fields = self.fields
         for field in fields:
-            if "identity" == str(field.transform()):
-                source_ids.add(field)
+            if "identity" == str(field.transform):
+                source_ids.add(field.source_id)
 
         return source_ids
 
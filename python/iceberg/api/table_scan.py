@@ -31,6 +31,9 @@ class TableScan(object):
     def as_of_time(self, timestamp_millis):
         raise NotImplementedError()
 
+    def incremental_scan(self, from_snapshot_id, to_snapshot_id=None):
+        raise NotImplementedError()
+
     def project(self, schema):
         raise NotImplementedError()
 
@@ -43,9 +46,15 @@ class TableScan(object):
     def filter(self, expr):
         raise NotImplementedError()
 
+    def limit(self, num_rows):
+        raise NotImplementedError()
+
     def plan_files(self):
         raise NotImplementedError()
 
+    def plan_files_for_snapshots(self, snapshot_ids):
+        raise NotImplementedError()
+
     def plan_tasks(self):
         raise NotImplementedError()
 
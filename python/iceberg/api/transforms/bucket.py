@@ -18,9 +18,12 @@
 import math
 import struct
 import sys
+import uuid
 
 import mmh3
+import numpy as np
 
+from .projection_util import ProjectionUtil
 from .transform import Transform
 from .transform_util import TransformUtil
 from ..expressions import (Expressions,
@@ -77,16 +80,33 @@ class Bucket(Transform):
     def apply(self, value):
         return (self.hash(value) & JAVA_MAX_INT) % self.n
 
+    def apply_batch(self, values):
+        """Returns the bucket of every value in a NumPy or Arrow array, with nulls kept for Arrow input."""
+        array, mask = TransformUtil.to_numpy(values)
+        buckets = (self.hash_batch(array) & np.int32(JAVA_MAX_INT)) % np.int32(self.n)
+        return TransformUtil.from_numpy(buckets.astype(np.int32), mask, values)
+
+    def apply_array(self, values):
+        return self.apply_batch(values)
+
+    def hash_batch(self, values):
+        return np.fromiter((0 if value is None else self.hash(value) for value in values),
+                           dtype=np.int32, count=len(values))
+
     def hash(self):
         raise NotImplementedError()
 
     def project(self, name, predicate):
         if predicate.op == Operation.EQ:
             return Expressions.predicate(predicate.op, name, self.apply(predicate.lit.value))
+        elif predicate.op == Operation.IN:
+            return ProjectionUtil.transform_set(name, predicate, self)
 
     def project_strict(self, name, predicate):
         if predicate.op == Operation.NOT_EQ:
             return Expressions.predicate(predicate.op, name, self.apply(predicate.lit.value))
+        elif predicate.op == Operation.NOT_IN:
+            return ProjectionUtil.transform_set(name, predicate, self)
 
     def get_result_type(self, source_type):
         return IntegerType.get()
@@ -100,6 +120,9 @@ class BucketInteger(Bucket):
     def hash(self, value):
         return Bucket.MURMUR3.hash(struct.pack("q", value))
 
+    def hash_batch(self, values):
+        return TransformUtil.murmur3_longs(values.astype(np.int64))
+
     def can_transform(self, type_var):
         return type_var.type_id in [TypeID.INTEGER, TypeID.DATE]
 
@@ -111,6 +134,9 @@ class BucketLong(Bucket):
     def hash(self, value):
         return Bucket.MURMUR3.hash(struct.pack("q", value))
 
+    def hash_batch(self, values):
+        return TransformUtil.murmur3_longs(values.astype(np.int64))
+
     def can_transform(self, type_var):
         return type_var.type_id in [TypeID.LONG,
                                     TypeID.TIME,
@@ -124,6 +150,10 @@ class BucketFloat(Bucket):
     def hash(self, value):
         return Bucket.MURMUR3.hash(struct.pack("d", value))
 
+    def hash_batch(self, values):
+        # the bits of the value as a double, like struct.pack("d")
+        return TransformUtil.murmur3_longs(values.astype(np.float64).view(np.int64))
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.FLOAT
 
@@ -135,6 +165,10 @@ class BucketDouble(Bucket):
     def hash(self, value):
         return Bucket.MURMUR3.hash(struct.pack("d", value))
 
+    def hash_batch(self, values):
+        # the bits of the value as a double, like struct.pack("d")
+        return TransformUtil.murmur3_longs(values.astype(np.float64).view(np.int64))
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.DOUBLE
 
@@ -167,14 +201,28 @@ class BucketString(Bucket):
 
 class BucketByteBuffer(Bucket):
     def __init__(self, n):
-        # super(BucketByteBuffer, self).__init__(n)
-        raise NotImplementedError()
+        super(BucketByteBuffer, self).__init__(n)
+
+    def hash(self, value):
+        return Bucket.MURMUR3.hash(bytes(value))
+
+    def can_transform(self, type_var):
+        return type_var.type_id in [TypeID.BINARY, TypeID.FIXED]
 
 
 class BucketUUID(Bucket):
     def __init__(self, n):
-        # super(BucketUUID, self).__init__(n)
-        raise NotImplementedError()
+        super(BucketUUID, self).__init__(n)
+
+    def hash(self, value):
+        # the 16 big-endian bytes of the UUID, which is how Arrow stores it
+        if isinstance(value, uuid.UUID):
+            value = value.bytes
+
+        return Bucket.MURMUR3.hash(bytes(value))
+
+    def can_transform(self, type_var):
+        return type_var.type_id == TypeID.UUID
 
 
 def to_bytes(n, length, byteorder='big'):
@@ -17,6 +17,8 @@
 
 import datetime
 
+import numpy as np
+
 from .projection_util import ProjectionUtil
 from .transform import Transform
 from .transform_util import TransformUtil
@@ -33,6 +35,8 @@ class Dates(Transform):
 
     EPOCH = datetime.datetime.utcfromtimestamp(0)
     SECONDS_IN_DAY = 86400
+    NUMPY_UNITS = {"year": "datetime64[Y]",
+                   "month": "datetime64[M]"}
 
     HUMAN_FUNCS = {"year": lambda x: TransformUtil.human_year(x),
                    "month": lambda x: TransformUtil.human_month(x),
@@ -51,6 +55,14 @@ class Dates(Transform):
             apply_func = getattr(TransformUtil, "diff_{}".format(self.granularity))
             return apply_func(datetime.datetime.utcfromtimestamp(days * Dates.SECONDS_IN_DAY), Dates.EPOCH)
 
+    def apply_array(self, values):
+        array, mask = TransformUtil.to_numpy(values)
+        days = array.astype("datetime64[D]")
+        if self.granularity != Dates.DAY:
+            days = days.astype(Dates.NUMPY_UNITS[self.granularity])
+
+        return TransformUtil.from_numpy(days.astype(np.int64).astype(np.int32), mask, values)
+
     def can_transform(self, type):
         return type.type_id == TypeID.DATE
 
@@ -64,7 +76,10 @@ class Dates(Transform):
         return ProjectionUtil.truncate_integer(name, predicate, self)
 
     def project_strict(self, name, predicate):
-        return None
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_integer_strict(name, predicate, self)
 
     def to_human_string(self, value):
         if value is None:
@@ -15,9 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from .projection_util import ProjectionUtil
 from .transform import Transform
 from .transform_util import TransformUtil
-from ..expressions import Expressions
+from ..expressions import (Expressions,
+                           Operation)
 from ..types import TypeID
 
 
@@ -33,6 +35,9 @@ class Identity(Transform):
     def apply(self, value):
         return value
 
+    def apply_array(self, values):
+        return values
+
     def can_transform(self, type_var):
         return type_var.is_primitive_type()
 
@@ -43,7 +48,9 @@ class Identity(Transform):
         return self.project_strict(name, predicate)
 
     def project_strict(self, name, predicate):
-        if predicate.lit is not None:
+        if predicate.op in (Operation.IN, Operation.NOT_IN):
+            return ProjectionUtil.transform_set(name, predicate, self)
+        elif predicate.lit is not None:
             return Expressions.predicate(predicate.op, name, predicate.lit.value)
         else:
             return Expressions.predicate(predicate.op, name)
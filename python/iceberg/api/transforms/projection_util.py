@@ -20,8 +20,18 @@ import decimal
 
 from iceberg.api.expressions import Expressions, Operation
 
+from .transform_util import TransformUtil
+
 
 class ProjectionUtil(object):
+    @staticmethod
+    def transform_set(name, pred, transform):
+        values = {transform.apply(value) for value in pred.lit.value}
+        if pred.op == Operation.IN:
+            return Expressions.in_(name, values)
+
+        return Expressions.not_in(name, values)
+
     @staticmethod
     def truncate_integer(name, pred, transform):
         boundary = pred.lit.value
@@ -35,26 +45,79 @@ class ProjectionUtil(object):
             return Expressions.predicate(Operation.GT_EQ, name, transform.apply(boundary))
         elif pred.op == Operation.EQ:
             return Expressions.predicate(pred.op, name, transform.apply(boundary))
+        elif pred.op == Operation.IN:
+            return ProjectionUtil.transform_set(name, pred, transform)
 
+    @staticmethod
+    def truncate_integer_strict(name, pred, transform):
+        # a partition only matches strictly when every value that maps to it satisfies the predicate
+        boundary = pred.lit.value
+        if pred.op == Operation.LT:
+            return Expressions.predicate(Operation.LT, name, transform.apply(boundary))
+        elif pred.op == Operation.LT_EQ:
+            return Expressions.predicate(Operation.LT, name, transform.apply(boundary + 1))
+        elif pred.op == Operation.GT:
+            return Expressions.predicate(Operation.GT, name, transform.apply(boundary))
+        elif pred.op == Operation.GT_EQ:
+            return Expressions.predicate(Operation.GT, name, transform.apply(boundary - 1))
+        elif pred.op == Operation.NOT_EQ:
+            return Expressions.predicate(Operation.NOT_EQ, name, transform.apply(boundary))
+        elif pred.op == Operation.NOT_IN:
+            return ProjectionUtil.transform_set(name, pred, transform)
+
+    @staticmethod
     def truncate_long(name, pred, transform):
         return ProjectionUtil.truncate_integer(name, pred, transform)
 
+    @staticmethod
+    def truncate_long_strict(name, pred, transform):
+        return ProjectionUtil.truncate_integer_strict(name, pred, transform)
+
+    @staticmethod
+    def decimal_step(value, step):
+        # adds step units of the last digit, keeping the scale of the value
+        unscaled = TransformUtil.unscale_decimal(value) + step
+        return decimal.Decimal("{}e{}".format(unscaled, value.as_tuple().exponent))
+
+    @staticmethod
     def truncate_decimal(name, pred, transform):
         boundary = pred.lit.value
 
         if pred.op == Operation.LT:
-            minus_one = boundary - decimal.Decimal(1)
+            minus_one = ProjectionUtil.decimal_step(boundary, -1)
             return Expressions.predicate(Operation.LT_EQ, name, transform.apply(minus_one))
         elif pred.op == Operation.LT_EQ:
             return Expressions.predicate(Operation.LT_EQ, name, transform.apply(boundary))
         elif pred.op == Operation.GT:
-            plus_one = boundary + decimal.Decimal(1)
+            plus_one = ProjectionUtil.decimal_step(boundary, 1)
             return Expressions.predicate(Operation.GT_EQ, name, transform.apply(plus_one))
         elif pred.op == Operation.GT_EQ:
             return Expressions.predicate(Operation.GT_EQ, name, transform.apply(boundary))
         elif pred.op == Operation.EQ:
             return Expressions.predicate(pred.op, name, transform.apply(boundary))
+        elif pred.op == Operation.IN:
+            return ProjectionUtil.transform_set(name, pred, transform)
 
+    @staticmethod
+    def truncate_decimal_strict(name, pred, transform):
+        boundary = pred.lit.value
+
+        if pred.op == Operation.LT:
+            return Expressions.predicate(Operation.LT, name, transform.apply(boundary))
+        elif pred.op == Operation.LT_EQ:
+            plus_one = ProjectionUtil.decimal_step(boundary, 1)
+            return Expressions.predicate(Operation.LT, name, transform.apply(plus_one))
+        elif pred.op == Operation.GT:
+            return Expressions.predicate(Operation.GT, name, transform.apply(boundary))
+        elif pred.op == Operation.GT_EQ:
+            minus_one = ProjectionUtil.decimal_step(boundary, -1)
+            return Expressions.predicate(Operation.GT, name, transform.apply(minus_one))
+        elif pred.op == Operation.NOT_EQ:
+            return Expressions.predicate(Operation.NOT_EQ, name, transform.apply(boundary))
+        elif pred.op == Operation.NOT_IN:
+            return ProjectionUtil.transform_set(name, pred, transform)
+
+    @staticmethod
     def truncate_array(name, pred, transform):
         boundary = pred.lit.value
 
@@ -64,3 +127,28 @@ class ProjectionUtil(object):
             return Expressions.predicate(Operation.GT_EQ, name, transform.apply(boundary))
         elif pred.op == Operation.EQ:
             return Expressions.predicate(pred.op, name, transform.apply(boundary))
+        elif pred.op == Operation.IN:
+            return ProjectionUtil.transform_set(name, pred, transform)
+        elif pred.op == Operation.STARTS_WITH:
+            # a prefix longer than the width only fixes the whole truncated value
+            truncated = transform.apply(boundary)
+            if truncated != boundary:
+                return Expressions.predicate(Operation.EQ, name, truncated)
+
+            return Expressions.predicate(Operation.STARTS_WITH, name, boundary)
+
+    @staticmethod
+    def truncate_array_strict(name, pred, transform):
+        boundary = pred.lit.value
+
+        if pred.op == Operation.LT or pred.op == Operation.LT_EQ:
+            return Expressions.predicate(Operation.LT, name, transform.apply(boundary))
+        elif pred.op == Operation.GT or pred.op == Operation.GT_EQ:
+            return Expressions.predicate(Operation.GT, name, transform.apply(boundary))
+        elif pred.op == Operation.NOT_EQ:
+            return Expressions.predicate(Operation.NOT_EQ, name, transform.apply(boundary))
+        elif pred.op == Operation.NOT_IN:
+            return ProjectionUtil.transform_set(name, pred, transform)
+        elif pred.op == Operation.STARTS_WITH and transform.apply(boundary) == boundary:
+            # the prefix is kept whole by the transform, so every value of a matching partition starts with it
+            return Expressions.predicate(Operation.STARTS_WITH, name, boundary)
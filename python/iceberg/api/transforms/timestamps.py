@@ -18,6 +18,9 @@
 
 import datetime
 
+import numpy as np
+
+from .projection_util import ProjectionUtil
 from .transform import Transform
 from .transform_util import TransformUtil
 from ..expressions import (Expressions,
@@ -33,6 +36,10 @@ class Timestamps(Transform):
     HOUR = "hour"
 
     EPOCH = datetime.datetime.utcfromtimestamp(0)
+    MICROS_IN_HOUR = 3600 * 1000000
+    MICROS_IN_DAY = 24 * MICROS_IN_HOUR
+    NUMPY_UNITS = {"year": "datetime64[Y]",
+                   "month": "datetime64[M]"}
     HUMAN_FUNCS = {"year": lambda x: TransformUtil.human_year(x),
                    "month": lambda x: TransformUtil.human_month(x),
                    "day": lambda x: TransformUtil.human_day(x),
@@ -46,8 +53,27 @@ class Timestamps(Transform):
         self.name = name
 
     def apply(self, value):
+        # integer arithmetic keeps the microsecond before a boundary in the previous partition
+        if self.granularity == Timestamps.HOUR:
+            return value // Timestamps.MICROS_IN_HOUR
+        elif self.granularity == Timestamps.DAY:
+            return value // Timestamps.MICROS_IN_DAY
+
         apply_func = getattr(TransformUtil, "diff_{}".format(self.granularity))
-        return apply_func(datetime.datetime.utcfromtimestamp(value / 1000000), Timestamps.EPOCH)
+        return apply_func(Timestamps.EPOCH + datetime.timedelta(microseconds=value), Timestamps.EPOCH)
+
+    def apply_array(self, values):
+        array, mask = TransformUtil.to_numpy(values)
+        micros = array.astype("datetime64[us]").astype(np.int64)
+        if self.granularity == Timestamps.HOUR:
+            result = micros // Timestamps.MICROS_IN_HOUR
+        elif self.granularity == Timestamps.DAY:
+            result = micros // Timestamps.MICROS_IN_DAY
+        else:
+            # NumPy floors to coarser datetime units, like TransformUtil.diff_month and diff_year
+            result = micros.astype("datetime64[us]").astype(Timestamps.NUMPY_UNITS[self.granularity]).astype(np.int64)
+
+        return TransformUtil.from_numpy(result.astype(np.int32), mask, values)
 
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.TIMESTAMP
@@ -57,10 +83,15 @@ class Timestamps(Transform):
 
     def project(self, name, predicate):
         if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
-            return Expressions.predicate(predicate.op, self.name)
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_long(name, predicate, self)
 
     def project_strict(self, name, predicate):
-        return None
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_integer_strict(name, predicate, self)
 
     def to_human_string(self, value):
         if value is None:
@@ -16,6 +16,11 @@
 # under the License.
 
 
+import numpy as np
+
+from .transform_util import TransformUtil
+
+
 class Transform(object):
 
     def __init__(self):
@@ -24,6 +29,18 @@ class Transform(object):
     def apply(self, value):
         raise NotImplementedError()
 
+    def apply_array(self, values):
+        """Applies the transform to every value of a NumPy or Arrow array, keeping Arrow nulls.
+
+        Transforms override this with a vectorized version, this one calls apply for each value."""
+        array, mask = TransformUtil.to_numpy(values)
+        result = np.empty(len(array), dtype=object)
+        for i, value in enumerate(array):
+            if value is not None and (mask is None or not mask[i]):
+                result[i] = self.apply(value)
+
+        return TransformUtil.from_numpy(result, mask, values)
+
     def can_transform(self, type_var):
         raise NotImplementedError()
 
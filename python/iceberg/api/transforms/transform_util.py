@@ -17,12 +17,17 @@
 
 from datetime import datetime, timedelta
 
+import numpy as np
+import pyarrow as pa
 import pytz
 
 
 class TransformUtil(object):
     EPOCH = datetime.utcfromtimestamp(0)
     EPOCH_YEAR = datetime.utcfromtimestamp(0).year
+    MICROS_PER_UNIT = {"s": 1000000, "ms": 1000, "us": 1}
+    UNITS_PER_MICRO = {"ns": 1000}
+    MILLIS_PER_DAY = 86400000
 
     @staticmethod
     def human_year(year_ordinal):
@@ -57,6 +62,78 @@ class TransformUtil(object):
         time = TransformUtil.EPOCH + timedelta(hours=hour_ordinal)
         return "{0:0=4d}-{1:0=2d}-{2:0=2d}-{3:0=2d}".format(time.year, time.month, time.day, time.hour)
 
+    @staticmethod
+    def to_numpy(values):
+        """Returns the values of a NumPy or Arrow array as a NumPy array and a null mask, or None without nulls.
+
+        Temporal Arrow arrays are returned as Iceberg's integer representation: days for dates and
+        microseconds for times and timestamps of any unit, flooring finer units."""
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+
+        if not isinstance(values, pa.Array):
+            return np.asarray(values), None
+
+        mask = values.is_null().to_numpy(zero_copy_only=False) if values.null_count > 0 else None
+        result = TransformUtil._temporal_to_integers(values, values.type)
+        if result is not None:
+            return result, mask
+
+        if mask is not None and (pa.types.is_integer(values.type) or pa.types.is_floating(values.type)):
+            values = values.fill_null(0)
+
+        return values.to_numpy(zero_copy_only=False), mask
+
+    @staticmethod
+    def _temporal_to_integers(values, arrow_type):
+        """Returns the days or microseconds of a temporal Arrow array with nulls as 0, or None for other types."""
+        if pa.types.is_date32(arrow_type):
+            return values.view(pa.int32()).fill_null(0).to_numpy(zero_copy_only=False)
+        elif pa.types.is_date64(arrow_type):
+            millis = values.view(pa.int64()).fill_null(0).to_numpy(zero_copy_only=False)
+            return (millis // TransformUtil.MILLIS_PER_DAY).astype(np.int32)
+        elif pa.types.is_time32(arrow_type):
+            result = values.view(pa.int32()).fill_null(0).to_numpy(zero_copy_only=False).astype(np.int64)
+        elif pa.types.is_timestamp(arrow_type) or pa.types.is_time64(arrow_type):
+            result = values.view(pa.int64()).fill_null(0).to_numpy(zero_copy_only=False)
+        else:
+            return None
+
+        if arrow_type.unit in TransformUtil.UNITS_PER_MICRO:
+            return result // TransformUtil.UNITS_PER_MICRO[arrow_type.unit]
+
+        return result * TransformUtil.MICROS_PER_UNIT[arrow_type.unit] if arrow_type.unit != "us" else result
+
+    @staticmethod
+    def from_numpy(result, mask, like):
+        """Wraps a transform result like the input array: Arrow input gets an Arrow array with its nulls."""
+        if isinstance(like, (pa.Array, pa.ChunkedArray)):
+            return pa.array(result, mask=mask)
+
+        return result
+
+    @staticmethod
+    def murmur3_longs(values):
+        """Murmur3 x86 32-bit hashes of the 8 little-endian bytes of each int64 value, as Bucket.hash computes them."""
+        words = np.ascontiguousarray(values, dtype="<i8").view("<u4").reshape(-1, 2)
+        h = np.zeros(len(words), dtype=np.uint32)
+        for k in (words[:, 0], words[:, 1]):
+            k = k * np.uint32(0xcc9e2d51)
+            k = (k << np.uint32(15)) | (k >> np.uint32(17))
+            k = k * np.uint32(0x1b873593)
+            h ^= k
+            h = (h << np.uint32(13)) | (h >> np.uint32(19))
+            h = h * np.uint32(5) + np.uint32(0xe6546b64)
+
+        h ^= np.uint32(8)
+        h ^= h >> np.uint32(16)
+        h = h * np.uint32(0x85ebca6b)
+        h ^= h >> np.uint32(13)
+        h = h * np.uint32(0xc2b2ae35)
+        h ^= h >> np.uint32(16)
+
+        return h.view(np.int32)
+
     @staticmethod
     def base_64_encode(buffer):
         raise NotImplementedError()
@@ -17,6 +17,10 @@
 
 from decimal import Decimal
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from .projection_util import ProjectionUtil
 from .transform import Transform
 from .transform_util import TransformUtil
@@ -65,6 +69,11 @@ class TruncateInteger(Truncate):
     def apply(self, value):
         return value - (((value % self.W) + self.W) % self.W)
 
+    def apply_array(self, values):
+        array, mask = TransformUtil.to_numpy(values)
+        # NumPy's modulo takes the sign of the divisor, like Python's
+        return TransformUtil.from_numpy(array - array % self.W, mask, values)
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.INTEGER
 
@@ -75,24 +84,10 @@ class TruncateInteger(Truncate):
         return ProjectionUtil.truncate_integer(name, predicate, self)
 
     def project_strict(self, name, predicate):
-        if predicate.op == Operation.LT:
-            _in = predicate.lit.value - 1
-            _out = predicate.lit.value
-            in_image = self.apply(_in)
-            out_image = self.apply(_out)
-            if in_image != out_image:
-                return Expressions.predicate(Operation.LT_EQ, name, in_image)
-            else:
-                return Expressions.predicate(Operation.LT, name, in_image)
-        elif predicate.op == Operation.LT_EQ:
-            _in = predicate.lit.value
-            _out = predicate.lit.value + 1
-            in_image = self.apply(_in)
-            out_image = self.apply(_out)
-            if in_image != out_image:
-                return Expressions.predicate(Operation.LT_EQ, name, in_image)
-            else:
-                return Expressions.predicate(Operation.LT, name, in_image)
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_integer_strict(name, predicate, self)
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -121,6 +116,11 @@ class TruncateLong(Truncate):
     def apply(self, value):
         return value - (((value % self.W) + self.W) % self.W)
 
+    def apply_array(self, values):
+        array, mask = TransformUtil.to_numpy(values)
+        # NumPy's modulo takes the sign of the divisor, like Python's
+        return TransformUtil.from_numpy(array - array % self.W, mask, values)
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.LONG
 
@@ -131,7 +131,10 @@ class TruncateLong(Truncate):
         return ProjectionUtil.truncate_long(name, predicate, self)
 
     def project_strict(self, name, predicate):
-        return None
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_long_strict(name, predicate, self)
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -172,7 +175,10 @@ class TruncateDecimal(Truncate):
         return ProjectionUtil.truncate_decimal(name, predicate, self)
 
     def project_strict(self, name, predicate):
-        return None
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_decimal_strict(name, predicate, self)
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -200,6 +206,12 @@ class TruncateString(Truncate):
     def apply(self, value):
         return value[0:min(self.L, len(value))]
 
+    def apply_array(self, values):
+        if isinstance(values, (pa.Array, pa.ChunkedArray)):
+            return pc.utf8_slice_codeunits(values, 0, self.L)
+
+        return np.array([None if value is None else self.apply(value) for value in values], dtype=object)
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.STRING
 
@@ -210,7 +222,10 @@ class TruncateString(Truncate):
         return ProjectionUtil.truncate_array(name, predicate, self)
 
     def project_strict(self, name, predicate):
-        return None
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_array_strict(name, predicate, self)
 
     def __eq__(self, other):
         if id(self) == id(other):
@@ -42,9 +42,9 @@ class Conversions(object):
     to_byte_buff_mapping = {TypeID.BOOLEAN: lambda type_var, value: struct.pack("<h", 1 if value else 0),
                             TypeID.INTEGER: lambda type_var, value: struct.pack("<i", value),
                             TypeID.DATE: lambda type_var, value: struct.pack("<i", value),
-                            TypeID.LONG: lambda type_var, value: struct.pack("<l", value),
-                            TypeID.TIME: lambda type_var, value: struct.pack("<l", value),
-                            TypeID.TIMESTAMP: lambda type_var, value: struct.pack("<l", value),
+                            TypeID.LONG: lambda type_var, value: struct.pack("<q", value),
+                            TypeID.TIME: lambda type_var, value: struct.pack("<q", value),
+                            TypeID.TIMESTAMP: lambda type_var, value: struct.pack("<q", value),
                             TypeID.FLOAT: lambda type_var, value: struct.pack("<f", value),
                             TypeID.DOUBLE: lambda type_var, value: struct.pack("<d", value),
                             TypeID.STRING: lambda type_var, value: value.encode('UTF-8'),
@@ -62,7 +62,7 @@ class Conversions(object):
                               TypeID.LONG: lambda type_var, value: struct.unpack('<q', value)[0],
                               TypeID.TIME: lambda type_var, value: struct.unpack('<q', value)[0],
                               TypeID.TIMESTAMP: lambda type_var, value: struct.unpack('<q', value)[0],
-                              TypeID.FLOAT: lambda type_var, value: struct.unpack('<f)', value)[0],
+                              TypeID.FLOAT: lambda type_var, value: struct.unpack('<f', value)[0],
                               TypeID.DOUBLE: lambda type_var, value: struct.unpack('<d', value)[0],
                               TypeID.STRING: lambda type_var, value: bytes(value).decode("utf-8"),
                               TypeID.UUID: lambda type_var, value:
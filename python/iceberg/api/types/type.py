@@ -86,6 +86,9 @@ class PrimitiveType(Type):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(type(self))
+
     def is_primitive_type(self):
         return True
 
@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api.expressions import Binder, Expressions, ExpressionVisitors
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .iceberg_to_arrow import IcebergToArrow
+
+
+class ExpressionToArrow(ExpressionVisitors.BoundExpressionVisitor):
+    """
+    Converts an Iceberg expression to a pyarrow compute expression that selects the same rows.
+    """
+
+    @staticmethod
+    def convert(schema, expr, case_sensitive=True):
+        bound = Binder.bind(schema.as_struct(), Expressions.rewrite_not(expr), case_sensitive)
+        return ExpressionVisitors.visit(bound, ExpressionToArrow(schema))
+
+    def __init__(self, schema):
+        super(ExpressionToArrow, self).__init__()
+        self.schema = schema
+
+    def field(self, ref):
+        return pc.field(*self.schema.find_column_name(ref.field_id).split("."))
+
+    def value(self, ref, lit):
+        return pa.scalar(lit.value, type=IcebergToArrow.type_to_arrow(ref.type))
+
+    def always_true(self):
+        return pc.scalar(True)
+
+    def always_false(self):
+        return pc.scalar(False)
+
+    def not_(self, result):
+        return ~result
+
+    def and_(self, left_result, right_result):
+        return left_result & right_result
+
+    def or_(self, left_result, right_result):
+        return left_result | right_result
+
+    def is_null(self, ref):
+        return self.field(ref).is_null()
+
+    def not_null(self, ref):
+        return self.field(ref).is_valid()
+
+    def lt(self, ref, lit):
+        return self.field(ref) < self.value(ref, lit)
+
+    def lt_eq(self, ref, lit):
+        return self.field(ref) <= self.value(ref, lit)
+
+    def gt(self, ref, lit):
+        return self.field(ref) > self.value(ref, lit)
+
+    def gt_eq(self, ref, lit):
+        return self.field(ref) >= self.value(ref, lit)
+
+    def eq(self, ref, lit):
+        return self.field(ref) == self.value(ref, lit)
+
+    def not_eq(self, ref, lit):
+        # null values are not equal to any literal
+        return (self.field(ref) != self.value(ref, lit)) | self.field(ref).is_null()
+
+    def values(self, ref, lit):
+        return pa.array(lit.sorted_values, type=IcebergToArrow.type_to_arrow(ref.type))
+
+    def in_(self, ref, lit):
+        return self.field(ref).isin(self.values(ref, lit))
+
+    def not_in(self, ref, lit):
+        # null values are not in any set of literals
+        return ~self.field(ref).isin(self.values(ref, lit)) | self.field(ref).is_null()
+
+    def starts_with(self, ref, lit):
+        return pc.starts_with(self.field(ref), pattern=lit.value)
@@ -0,0 +1,132 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api.types import TypeID
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+class IcebergToArrow(object):
+    FIELD_ID_KEY = b"PARQUET:field_id"
+
+    PRIMITIVE_TYPE_MAP = {TypeID.BOOLEAN: lambda type_var: pa.bool_(),
+                          TypeID.INTEGER: lambda type_var: pa.int32(),
+                          TypeID.LONG: lambda type_var: pa.int64(),
+                          TypeID.FLOAT: lambda type_var: pa.float32(),
+                          TypeID.DOUBLE: lambda type_var: pa.float64(),
+                          TypeID.DATE: lambda type_var: pa.date32(),
+                          TypeID.TIME: lambda type_var: pa.time64("us"),
+                          TypeID.TIMESTAMP: lambda type_var: pa.timestamp("us",
+                                                                          tz="UTC" if type_var.adjust_to_utc
+                                                                          else None),
+                          TypeID.STRING: lambda type_var: pa.string(),
+                          TypeID.UUID: lambda type_var: pa.binary(16),
+                          TypeID.FIXED: lambda type_var: pa.binary(type_var.length),
+                          TypeID.BINARY: lambda type_var: pa.binary(),
+                          TypeID.DECIMAL: lambda type_var: pa.decimal128(type_var.precision, type_var.scale)}
+
+    @staticmethod
+    def schema_to_arrow(schema):
+        return pa.schema([IcebergToArrow.field_to_arrow(field) for field in schema.as_struct().fields])
+
+    @staticmethod
+    def field_to_arrow(field):
+        return pa.field(field.name,
+                        IcebergToArrow.type_to_arrow(field.type),
+                        nullable=field.is_optional,
+                        metadata={IcebergToArrow.FIELD_ID_KEY: str(field.field_id)})
+
+    @staticmethod
+    def type_to_arrow(type_var):
+        if type_var.is_primitive_type():
+            type_func = IcebergToArrow.PRIMITIVE_TYPE_MAP.get(type_var.type_id)
+            if type_func is None:
+                raise RuntimeError("Cannot convert type to arrow: %s" % type_var)
+            return type_func(type_var)
+
+        if type_var.type_id == TypeID.STRUCT:
+            return pa.struct([IcebergToArrow.field_to_arrow(field) for field in type_var.fields])
+        elif type_var.type_id == TypeID.LIST:
+            return pa.list_(IcebergToArrow.field_to_arrow(type_var.element_field))
+        elif type_var.type_id == TypeID.MAP:
+            return pa.map_(IcebergToArrow.field_to_arrow(type_var.key_field),
+                           IcebergToArrow.field_to_arrow(type_var.value_field))
+
+        raise RuntimeError("Cannot convert type to arrow: %s" % type_var)
+
+    @staticmethod
+    def field_id(arrow_field):
+        if arrow_field.metadata is None or IcebergToArrow.FIELD_ID_KEY not in arrow_field.metadata:
+            return None
+
+        return int(arrow_field.metadata[IcebergToArrow.FIELD_ID_KEY])
+
+    @staticmethod
+    def constant_array(value, arrow_type, length):
+        if length == 0:
+            return pa.RunEndEncodedArray.from_arrays(pa.array([], type=pa.int32()), pa.array([], type=arrow_type))
+
+        return pa.RunEndEncodedArray.from_arrays(pa.array([length], type=pa.int32()),
+                                                 pa.array([value], type=arrow_type))
+
+    @staticmethod
+    def decode_array(array):
+        if pa.types.is_run_end_encoded(array.type):
+            return pc.run_end_decode(array)
+        elif pa.types.is_dictionary(array.type):
+            return array.dictionary_decode()
+
+        return array
+
+    @staticmethod
+    def unify_tables(tables):
+        """
+        Decodes run-end encoded and dictionary columns whose types differ between tables so they can be concatenated.
+        """
+        names = [arrow_field.name for arrow_field in tables[0].schema
+                 if any(table.schema.field(arrow_field.name).type != arrow_field.type for table in tables)]
+        if len(names) == 0:
+            return tables
+
+        return [IcebergToArrow.decode_columns(table, names) for table in tables]
+
+    @staticmethod
+    def decode_columns(table, names):
+        for name in names:
+            index = table.schema.get_field_index(name)
+            arrow_field = table.schema.field(index)
+            column = pa.chunked_array([IcebergToArrow.decode_array(chunk) for chunk in table.column(index).chunks])
+            table = table.set_column(index, arrow_field.with_type(column.type), column)
+
+        return table
+
+    @staticmethod
+    def filter_table(table, expression):
+        """
+        Filters a table by a compute expression, keeping its run-end encoded constant columns encoded.
+        """
+        names = [arrow_field.name for arrow_field in table.schema if pa.types.is_run_end_encoded(arrow_field.type)]
+        filtered = IcebergToArrow.decode_columns(table, names).filter(expression)
+        for name in names:
+            index = table.schema.get_field_index(name)
+            arrow_field = table.schema.field(index)
+            value = filtered.column(index)[0].as_py() if filtered.num_rows > 0 else None
+            filtered = filtered.set_column(index, arrow_field,
+                                           IcebergToArrow.constant_array(value, arrow_field.type.value_type,
+                                                                         filtered.num_rows))
+
+        return filtered
@@ -15,7 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
-__all__ = ["AvroToIceberg", "IcebergToAvro"]
+__all__ = ["AvroReader", "AvroToIceberg", "IcebergToAvro"]
 
+from .avro_reader import AvroReader
 from .avro_to_iceberg import AvroToIceberg
 from .iceberg_to_avro import IcebergToAvro
@@ -0,0 +1,213 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import logging
+from operator import itemgetter
+
+from fastavro import block_reader, parse_schema
+from fastavro.schema import SchemaParseException, UnknownType
+from iceberg.api.types import TypeID
+import pyarrow as pa
+
+from .avro_to_iceberg import AvroToIceberg
+from ..arrow import IcebergToArrow
+
+_logger = logging.getLogger(__name__)
+
+
+class AvroReader(object):
+    """
+    Reads an Avro data file into arrow record batches with the expected Iceberg schema.
+
+    Each Avro block is decoded by fastavro and converted to one record batch. Fields are resolved
+    by the field-id property of the writer schema, falling back to names for files without ids, and
+    fields missing from the file are returned as nulls. fastavro reads with the writer schema pruned
+    to the projected fields, so other fields are skipped instead of decoded. When limit is set, blocks
+    are no longer decoded once that many rows have been produced.
+    """
+
+    def __init__(self, input_file, expected_schema, start=None, length=None, constants=None, limit=None):
+        self._input_file = input_file
+        self._expected_schema = expected_schema
+        self._start = start
+        self._length = length
+        self._constants = constants if constants is not None else dict()
+        self._limit = limit
+
+    def read(self):
+        batches = list(self.read_batches())
+        if len(batches) == 0:
+            batches.append(self.empty_batch())
+
+        return pa.Table.from_batches(batches)
+
+    def read_batches(self):
+        with self._input_file.new_fo() as fo:
+            writer_schema = block_reader(fo).writer_schema
+            projection = AvroReader.projection(self._expected_schema.as_struct().fields,
+                                               AvroReader.record_fields(writer_schema))
+            _logger.debug("Reading fields %s from %s" % ([name for name, _ in projection if name is not None],
+                                                         self._input_file.location()))
+
+            fo.seek(0)
+            reader = block_reader(fo, AvroReader.reader_schema(writer_schema, projection))
+
+            num_rows = 0
+            for block in reader:
+                if self._limit is not None and num_rows >= self._limit:
+                    break
+                if self.in_split(block.offset):
+                    batch = self.to_batch(list(block), projection)
+                    num_rows += batch.num_rows
+                    yield batch
+
+    def in_split(self, offset):
+        if self._start is None or self._length is None:
+            return True
+
+        return self._start <= offset < self._start + self._length
+
+    def empty_batch(self):
+        return self.to_batch(list(), AvroReader.projection(self._expected_schema.as_struct().fields, list()))
+
+    def to_batch(self, records, projection):
+        columns = AvroReader.columns(records, [name for name, _ in projection if name is not None])
+        arrays = list()
+        fields = list()
+        for expected, (name, convert) in zip(self._expected_schema.as_struct().fields, projection):
+            arrow_type = IcebergToArrow.type_to_arrow(expected.type)
+            if expected.field_id in self._constants:
+                array = IcebergToArrow.constant_array(self._constants[expected.field_id], arrow_type, len(records))
+            elif name is None:
+                array = pa.nulls(len(records), type=arrow_type)
+            elif convert is AvroReader.identity:
+                array = pa.array(columns[name], type=arrow_type)
+            else:
+                array = pa.array(list(map(convert, columns[name])), type=arrow_type)
+
+            arrays.append(array)
+            fields.append(IcebergToArrow.field_to_arrow(expected).with_type(array.type))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+    @staticmethod
+    def columns(records, names):
+        """Returns the values of each named field of the records, transposed in one pass over the block."""
+        if len(names) == 0 or len(records) == 0:
+            return {name: list() for name in names}
+        elif len(names) == 1:
+            return {names[0]: list(map(itemgetter(names[0]), records))}
+
+        return dict(zip(names, zip(*map(itemgetter(*names), records))))
+
+    @staticmethod
+    def reader_schema(writer_schema, projection):
+        """
+        Returns the writer schema with only the projected top-level fields, or None to read every field.
+
+        A projected field may refer to a named type defined by a field that is not projected, in which
+        case the pruned schema does not parse and the file is read with its writer schema.
+        """
+        names = {name for name, _ in projection if name is not None}
+        try:
+            return parse_schema(dict(writer_schema,
+                                     fields=[field for field in AvroReader.record_fields(writer_schema)
+                                             if field["name"] in names]))
+        except (SchemaParseException, UnknownType):
+            return None
+
+    @staticmethod
+    def projection(expected_fields, writer_fields):
+        """
+        Returns a (writer field name, value converter) pair for each expected field.
+        """
+        by_id = {writer_field[AvroToIceberg.FIELD_ID_PROP]: writer_field for writer_field in writer_fields
+                 if AvroToIceberg.FIELD_ID_PROP in writer_field}
+        by_name = {writer_field["name"]: writer_field for writer_field in writer_fields}
+
+        projection = list()
+        for expected in expected_fields:
+            writer_field = by_id.get(expected.field_id) if len(by_id) > 0 else by_name.get(expected.name)
+            if writer_field is None:
+                projection.append((None, None))
+            else:
+                projection.append((writer_field["name"],
+                                   AvroReader.converter(expected.type, AvroReader.unwrap_option(writer_field["type"]))))
+
+        return projection
+
+    @staticmethod
+    def converter(expected_type, writer_type):
+        if expected_type.type_id == TypeID.STRUCT:
+            return AvroReader.struct_converter(expected_type, writer_type)
+        elif expected_type.type_id == TypeID.LIST:
+            convert_element = AvroReader.converter(expected_type.element_field.type,
+                                                   AvroReader.unwrap_option(writer_type["items"]))
+            return lambda value: None if value is None else [convert_element(element) for element in value]
+        elif expected_type.type_id == TypeID.MAP:
+            return AvroReader.map_converter(expected_type, writer_type)
+        elif expected_type.type_id == TypeID.UUID:
+            return lambda value: None if value is None else value.bytes if hasattr(value, "bytes") else value
+
+        return AvroReader.identity
+
+    @staticmethod
+    def struct_converter(expected_type, writer_type):
+        projection = AvroReader.projection(expected_type.fields, AvroReader.record_fields(writer_type))
+        names = [(expected.name, name, convert)
+                 for expected, (name, convert) in zip(expected_type.fields, projection)]
+
+        def convert_struct(value):
+            if value is None:
+                return None
+            return {expected_name: None if name is None else convert(value.get(name))
+                    for expected_name, name, convert in names}
+
+        return convert_struct
+
+    @staticmethod
+    def map_converter(expected_type, writer_type):
+        convert_value = AvroReader.converter(expected_type.value_field.type,
+                                             AvroReader.unwrap_option(writer_type["values"]
+                                                                      if writer_type["type"] == "map"
+                                                                      else writer_type["items"]["fields"][1]["type"]))
+        if writer_type["type"] == "map":
+            return lambda value: None if value is None else [(key, convert_value(item))
+                                                             for key, item in value.items()]
+
+        # maps with non-string keys are written as an array of key/value records
+        convert_key = AvroReader.converter(expected_type.key_field.type,
+                                           AvroReader.unwrap_option(writer_type["items"]["fields"][0]["type"]))
+        key_name, value_name = [field["name"] for field in writer_type["items"]["fields"]]
+        return lambda value: None if value is None else [(convert_key(item[key_name]), convert_value(item[value_name]))
+                                                         for item in value]
+
+    @staticmethod
+    def record_fields(writer_type):
+        return writer_type.get("fields", list()) if isinstance(writer_type, dict) else list()
+
+    @staticmethod
+    def unwrap_option(writer_type):
+        if isinstance(writer_type, list):
+            options = [option for option in writer_type if option != "null"]
+            return options[0] if len(options) == 1 else writer_type
+
+        return writer_type
+
+    @staticmethod
+    def identity(value):
+        return value
@@ -120,7 +120,7 @@ class SplitScanTask(FileScanTask):
 
     @property
     def residual(self):
-        return self._file_scan_task.residual()
+        return self._file_scan_task.residual
 
     def split(self):
         raise RuntimeError("Cannot split a task which is already split")
@@ -15,18 +15,18 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import itertools
 import time
 
 from iceberg.api import (Filterable,
                          FilteredSnapshot,
-                         ManifestFile,
                          Snapshot,
                          SnapshotIterable)
 from iceberg.api.expressions import Expressions
 from iceberg.api.io import CloseableGroup
-from iceberg.core.avro import AvroToIceberg
 
 from .generic_manifest_file import GenericManifestFile
+from .manifest_list import ManifestList
 from .manifest_reader import ManifestReader
 
 
@@ -77,8 +77,7 @@ class BaseSnapshot(Snapshot, SnapshotIterable, CloseableGroup):
     def manifests(self):
         if self._manifests is None:
             # if manifest isn't set then the snapshot_file is set and should be read to get the list
-            return (GenericManifestFile.from_avro_record_json(manifest)
-                    for manifest in AvroToIceberg.read_avro_file(ManifestFile.schema(), self._manifest_list))
+            return ManifestList.read(self._manifest_list)
 
         return self._manifests
 
@@ -107,17 +106,39 @@ class BaseSnapshot(Snapshot, SnapshotIterable, CloseableGroup):
         if part_filter is None and row_filter is None and columns is None:
             return self.iterator(Expressions.always_true(), Expressions.always_true(), Filterable.ALL_COLUMNS)
 
-        return iter([self.get_filtered_manifest(path, part_filter, row_filter, columns)
-                     for path in self._manifest_files])
+        return itertools.chain.from_iterable(self.get_filtered_manifest(manifest.manifest_path, part_filter,
+                                                                        row_filter, columns).iterator()
+                                             for manifest in self.manifests)
 
     def added_files(self):
-        raise NotImplementedError()
+        if self._adds is None:
+            self.cache_changes()
+
+        return self._adds
 
     def deleted_files(self):
-        raise NotImplementedError()
+        if self._deletes is None:
+            self.cache_changes()
+
+        return self._deletes
 
     def cache_changes(self):
-        raise NotImplementedError
+        adds = list()
+        deletes = list()
+
+        # only manifests written by this snapshot can hold its changes and a missing count must be read
+        for manifest in self.manifests:
+            if manifest.snapshot_id != self._snapshot_id:
+                continue
+            if manifest.added_files_count == 0 and manifest.deleted_files_count == 0:
+                continue
+
+            reader = self.read_manifest(manifest.manifest_path)
+            adds.extend(entry.file for entry in reader.added_files())
+            deletes.extend(entry.file for entry in reader.deleted_files())
+
+        self._adds = adds
+        self._deletes = deletes
 
     def __repr__(self):
         return "BaseSnapshot(id={id},timestamp_ms={ts_ms},manifests={manifests}".format(id=self._snapshot_id,
@@ -128,6 +149,10 @@ class BaseSnapshot(Snapshot, SnapshotIterable, CloseableGroup):
         return self.__repr__()
 
     def get_filtered_manifest(self, path, part_filter, row_filter, columns):
-        reader = ManifestReader.read(self.ops.new_input_file(path))
+        reader = self.read_manifest(path)
         self.add_closeable(reader)
-        return reader
+        return reader.filter_partitions(part_filter).filter_rows(row_filter).select(columns)
+
+    def read_manifest(self, path):
+        from .filesystem import FileSystemInputFile
+        return ManifestReader.read(FileSystemInputFile.from_location(path, self._ops.conf))
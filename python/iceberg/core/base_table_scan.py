@@ -18,13 +18,16 @@
 from datetime import datetime
 import logging
 
-from iceberg.api import Filterable
+from iceberg.api import FileFormat, Filterable
 from iceberg.api import TableScan
 from iceberg.api.expressions import (Binder,
-                                     Expressions)
+                                     Expressions,
+                                     StrictMetricsEvaluator)
 from iceberg.api.io import CloseableGroup
-from iceberg.api.types import get_projected_ids, select
+from iceberg.api.types import Conversions, get_projected_ids, select, TypeID
 
+from .arrow import ExpressionToArrow, IcebergToArrow
+from .avro import AvroReader
 from .base_combined_scan_task import BaseCombinedScanTask
 from .table_properties import TableProperties
 from .util import PackingIterator
@@ -39,7 +42,7 @@ class BaseTableScan(CloseableGroup, TableScan):
                         "lower_bounds", "upper_bounds")
 
     def new_refined_scan(self, ops, table, schema, snapshot_id, row_filter,
-                         case_sensitive, selected_columns, options, minused_cols):
+                         case_sensitive, selected_columns, options, minused_cols, limit):
         raise NotImplementedError()
 
     def target_split_size(self, ops):
@@ -47,7 +50,7 @@ class BaseTableScan(CloseableGroup, TableScan):
 
     def __init__(self, ops, table, schema, snapshot_id=None, columns=None,
                  row_filter=None, case_sensitive=True, selected_columns=None, options=None,
-                 minused_cols=None):
+                 minused_cols=None, limit=None):
         self.ops = ops
         self.table = table
         self._schema = schema
@@ -55,15 +58,17 @@ class BaseTableScan(CloseableGroup, TableScan):
         self.columns = columns
         self._row_filter = row_filter
         self._case_sensitive = case_sensitive
-        self.selected_columns = selected_columns
+        self.selected_columns = selected_columns if selected_columns is not None else Filterable.ALL_COLUMNS
         self.minused_cols = minused_cols or list()
         self.options = options if options is not None else dict()
+        self._limit = limit
 
         if self.columns is None and self._row_filter is None:
             self.columns = Filterable.ALL_COLUMNS
             self._row_filter = Expressions.always_true()
 
         self._stats = dict()
+        self._planning_filter = None
 
     def is_case_sensitive(self):
         return self.case_sensitive
@@ -77,44 +82,62 @@ class BaseTableScan(CloseableGroup, TableScan):
         return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=snapshot_id,
                                      row_filter=self._row_filter, case_sensitive=self._case_sensitive,
                                      selected_columns=self.selected_columns, options=self.options,
-                                     minused_cols=self.minused_cols)
+                                     minused_cols=self.minused_cols, limit=self._limit)
 
     def as_of_time(self, timestamp_millis):
-        raise NotImplementedError()
+        return self.use_snapshot(self.ops.current().snapshot_id_as_of_time(timestamp_millis))
 
     def project(self, schema):
         return self.new_refined_scan(self.ops, self.table, schema, snapshot_id=self.snapshot_id,
                                      row_filter=self._row_filter, case_sensitive=self._case_sensitive,
                                      selected_columns=self.selected_columns, options=self.options,
-                                     minused_cols=self.minused_cols)
+                                     minused_cols=self.minused_cols, limit=self._limit)
 
     def case_sensitive(self, case_sensitive):
         return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=self.snapshot_id,
                                      row_filter=self._row_filter, case_sensitive=case_sensitive,
                                      selected_columns=self.selected_columns, options=self.options,
-                                     minused_cols=self.minused_cols)
+                                     minused_cols=self.minused_cols, limit=self._limit)
 
     def select(self, columns):
         return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=self.snapshot_id,
                                      row_filter=self._row_filter, case_sensitive=self._case_sensitive,
                                      selected_columns=columns, options=self.options,
-                                     minused_cols=self.minused_cols)
+                                     minused_cols=self.minused_cols, limit=self._limit)
 
     def select_except(self, columns):
         return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=self.snapshot_id,
                                      row_filter=self._row_filter, case_sensitive=self._case_sensitive,
                                      selected_columns=self.selected_columns, options=self.options,
-                                     minused_cols=columns)
+                                     minused_cols=columns, limit=self._limit)
+
+    def limit(self, num_rows):
+        if num_rows < 0:
+            raise RuntimeError("Invalid scan limit: %s" % num_rows)
+
+        return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=self.snapshot_id,
+                                     row_filter=self._row_filter, case_sensitive=self._case_sensitive,
+                                     selected_columns=self.selected_columns, options=self.options,
+                                     minused_cols=self.minused_cols, limit=num_rows)
 
     @property
     def row_filter(self):
         return self._row_filter
 
+    @property
+    def planning_filter(self):
+        # the row filter with redundant predicates merged, normalized once for every evaluator of the scan
+        if self._planning_filter is None:
+            self._planning_filter = Expressions.normalize_filter(self._row_filter, self.table.schema().as_struct(),
+                                                                 self._case_sensitive)
+
+        return self._planning_filter
+
     def filter(self, expr):
         return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=self.snapshot_id,
                                      row_filter=Expressions.and_(self._row_filter, expr),
                                      case_sensitive=self._case_sensitive, selected_columns=self.selected_columns,
-                                     options=self.options, minused_cols=self.minused_cols)
+                                     options=self.options, minused_cols=self.minused_cols, limit=self._limit)
 
     def option(self, property, value):
         builder = dict()
@@ -123,7 +146,7 @@ class BaseTableScan(CloseableGroup, TableScan):
         return self.new_refined_scan(self.ops, self.table, self._schema, snapshot_id=self.snapshot_id,
                                      row_filter=self._row_filter, case_sensitive=self._case_sensitive,
                                      selected_columns=self.selected_columns, options=builder,
-                                     minused_cols=self.minused_cols)
+                                     minused_cols=self.minused_cols, limit=self._limit)
 
     def plan_files(self, ops=None, snapshot=None, row_filter=None):
 
@@ -174,11 +197,198 @@ class BaseTableScan(CloseableGroup, TableScan):
     def schema(self):
         return self._lazy_column_projection()
 
-    def to_arrow_table(self):
-        raise NotImplementedError()
-
-    def to_pandas(self):
-        raise NotImplementedError()
+    def to_arrow_table(self, dictionary_columns=None, dictionary_threshold=None):
+        """
+        Reads the scan into an arrow Table.
+
+        String columns named in dictionary_columns are returned as dictionary arrays. When
+        dictionary_threshold is set, any string column whose distinct value count is at most that
+        fraction of a file's rows is also returned as a dictionary array. Both default to the
+        read.parquet.dictionary-columns and read.parquet.dictionary-threshold scan options or table
+        properties.
+        """
+        import pyarrow as pa
+
+        schema = self.schema
+        dictionary_ids = self.dictionary_ids(schema, dictionary_columns)
+        if dictionary_threshold is None:
+            dictionary_threshold = self.read_option(TableProperties.PARQUET_DICTIONARY_THRESHOLD)
+
+        tables = list()
+        remaining = self._limit
+        for task in self.plan_files() or list():
+            if remaining is not None and remaining <= 0:
+                break
+            if task.residual == Expressions.always_false():
+                continue
+
+            # the reader can only stop early when every row it reads matches
+            filtered = task.residual != Expressions.always_true()
+            table = self.read_task(task, schema, dictionary_ids=dictionary_ids,
+                                   dictionary_threshold=None if dictionary_threshold is None
+                                   else float(dictionary_threshold),
+                                   limit=None if filtered else remaining)
+            if filtered:
+                table = IcebergToArrow.filter_table(table, ExpressionToArrow.convert(schema, task.residual,
+                                                                                     self._case_sensitive))
+
+            if remaining is not None:
+                table = table.slice(0, remaining)
+                remaining -= table.num_rows
+
+            tables.append(table)
+
+        if len(tables) == 0:
+            return IcebergToArrow.schema_to_arrow(schema).empty_table()
+
+        return pa.concat_tables(IcebergToArrow.unify_tables(tables))
+
+    def to_pandas(self, dictionary_columns=None, dictionary_threshold=None):
+        return self.to_arrow_table(dictionary_columns=dictionary_columns,
+                                   dictionary_threshold=dictionary_threshold).to_pandas()
+
+    def read_task(self, task, schema, dictionary_ids=None, dictionary_threshold=None, limit=None):
+        from .filesystem import FileSystemInputFile
+        input_file = FileSystemInputFile.from_location(task.file.path(), self.ops.conf)
+
+        if task.file.format() == FileFormat.PARQUET:
+            from iceberg.parquet import ParquetReader
+            return ParquetReader(input_file, schema, constants=BaseTableScan.identity_constants(task, schema),
+                                 dictionary_ids=dictionary_ids, dictionary_threshold=dictionary_threshold,
+                                 limit=limit).read()
+        elif task.file.format() == FileFormat.AVRO:
+            return AvroReader(input_file, schema, constants=BaseTableScan.identity_constants(task, schema),
+                              limit=limit).read()
+
+        raise NotImplementedError("Cannot read data files with format: %s" % task.file.format())
+
+    def count(self):
+        """
+        Returns the number of rows matching the scan filter.
+
+        Files whose partition or column metrics prove that every row matches are counted from
+        their manifest record counts, only the remaining files are read.
+        """
+        return sum(task.file.record_count() if fully_matches else self.read_residual(task, []).num_rows
+                   for task, fully_matches in self.matching_tasks())
+
+    def min(self, column):
+        """
+        Returns the smallest non-null value of a column in rows matching the scan filter.
+
+        Like count, files that fully match use their column lower bounds instead of being read.
+        String and binary bounds may be truncated, so files are always read for those columns.
+        """
+        return self.bound_aggregate(column, False)
+
+    def max(self, column):
+        """
+        Returns the largest non-null value of a column in rows matching the scan filter.
+        """
+        return self.bound_aggregate(column, True)
+
+    def matching_tasks(self):
+        evaluator = StrictMetricsEvaluator(self.table.schema(), self.planning_filter, self._case_sensitive)
+        for task in self.plan_files() or list():
+            residual = task.residual
+            if residual == Expressions.always_false():
+                continue
+
+            yield task, residual == Expressions.always_true() or evaluator.eval(task.file)
+
+    def bound_aggregate(self, column, upper):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        struct = self.table.schema().as_struct()
+        field = struct.field(name=column) if self._case_sensitive else struct.case_insensitive_field(column.lower())
+        if field is None or not field.type.is_primitive_type():
+            raise RuntimeError("Cannot aggregate column: %s" % column)
+
+        arrow_type = IcebergToArrow.type_to_arrow(field.type)
+        values = list()
+        for task, fully_matches in self.matching_tasks():
+            bound = BaseTableScan.metric_bound(task.file, field, upper) if fully_matches else None
+            if bound is None:
+                array = pa.chunked_array([IcebergToArrow.decode_array(chunk) for chunk
+                                          in self.read_residual(task, [field.field_id]).column(0).chunks],
+                                         type=arrow_type)
+                values.append(pc.min_max(array)["max" if upper else "min"].as_py())
+            elif len(bound) > 0:
+                values.append(pa.scalar(bound[0], type=arrow_type).as_py())
+
+        result = pc.min_max(pa.array(values, type=arrow_type))
+        return result["max" if upper else "min"].as_py()
+
+    @staticmethod
+    def metric_bound(data_file, field, upper):
+        """
+        Returns a list holding the file's bound for a column, an empty list if the column has only
+        nulls, or None if the metrics can't answer.
+        """
+        value_counts = data_file.value_counts() or dict()
+        null_counts = data_file.null_value_counts() or dict()
+        if field.field_id in value_counts and value_counts[field.field_id] == null_counts.get(field.field_id):
+            return list()
+
+        if field.type.type_id in (TypeID.STRING, TypeID.BINARY, TypeID.FIXED):
+            return None
+
+        bounds = data_file.upper_bounds() if upper else data_file.lower_bounds()
+        if bounds is None or bounds.get(field.field_id) is None:
+            return None
+
+        return [Conversions.from_byte_buffer(field.type, bounds.get(field.field_id))]
+
+    def read_residual(self, task, field_ids):
+        """
+        Reads the given fields of a task's file, keeping only rows that match the task's residual.
+
+        The returned table always has the requested fields first.
+        """
+        residual = task.residual
+        schema = self.table.schema()
+        required_ids = list(field_ids) + [field_id for field_id
+                                          in Binder.bound_references(schema.as_struct(), [residual],
+                                                                     self._case_sensitive)
+                                          if field_id not in field_ids]
+        projection = select(schema, set(required_ids))
+        table = self.read_task(task, projection)
+        if residual != Expressions.always_true():
+            table = IcebergToArrow.filter_table(table, ExpressionToArrow.convert(projection, residual,
+                                                                                 self._case_sensitive))
+
+        return table.select([projection.find_column_name(field_id) for field_id in field_ids])
+
+    def read_option(self, property):
+        value = self.options.get(property)
+        if value is None:
+            value = self.ops.current().properties.get(property)
+
+        return value
+
+    def dictionary_ids(self, schema, dictionary_columns):
+        if dictionary_columns is None:
+            option = self.read_option(TableProperties.PARQUET_DICTIONARY_COLUMNS)
+            dictionary_columns = [] if option is None else [name.strip() for name in option.split(",") if name.strip()]
+
+        dictionary_ids = set()
+        for name in dictionary_columns:
+            field = schema.as_struct().field(name=name) if self._case_sensitive \
+                else schema.as_struct().case_insensitive_field(name.lower())
+            if field is None:
+                raise RuntimeError("Cannot find dictionary column in projection: %s" % name)
+            dictionary_ids.add(field.field_id)
+
+        return dictionary_ids
+
+    @staticmethod
+    def identity_constants(task, schema):
+        projected_ids = {field.field_id for field in schema.as_struct().fields}
+        partition = task.file.partition()
+        return {field.source_id: partition.get(pos)
+                for pos, field in enumerate(task.spec.fields)
+                if field.source_id in projected_ids and "identity" == str(field.transform)}
 
     def _lazy_column_projection(self):
         if "*" in self.selected_columns:
@@ -20,11 +20,11 @@ import logging
 from multiprocessing import cpu_count
 from multiprocessing.dummy import Pool
 
-from iceberg.api.expressions import (InclusiveManifestEvaluator,
-                                     ResidualEvaluator)
+from iceberg.api.expressions import Expressions
 
 from .base_file_scan_task import BaseFileScanTask
 from .base_table_scan import BaseTableScan
+from .evaluator_cache import EvaluatorCache
 from .manifest_reader import ManifestReader
 from .partition_spec_parser import PartitionSpecParser
 from .schema_parser import SchemaParser
@@ -42,25 +42,41 @@ class DataTableScan(BaseTableScan):
                         "lower_bounds", "upper_bounds")
 
     def __init__(self, ops, table, schema=None, snapshot_id=None, row_filter=None,
-                 case_sensitive=True, selected_columns=None, options=None, minused_cols=None):
+                 case_sensitive=True, selected_columns=None, options=None, minused_cols=None, limit=None):
         super(DataTableScan, self).__init__(ops, table, schema if schema is not None else table.schema(),
                                             snapshot_id=snapshot_id, row_filter=row_filter,
                                             case_sensitive=case_sensitive, selected_columns=selected_columns,
-                                            options=options, minused_cols=minused_cols)
-        self._cached_evaluators = dict()
+                                            options=options, minused_cols=minused_cols, limit=limit)
 
     def new_refined_scan(self, ops, table, schema, snapshot_id=None, row_filter=None, case_sensitive=None,
-                         selected_columns=None, options=None, minused_cols=None):
+                         selected_columns=None, options=None, minused_cols=None, limit=None):
         return DataTableScan(ops, table, schema,
                              snapshot_id=snapshot_id, row_filter=row_filter, case_sensitive=case_sensitive,
-                             selected_columns=selected_columns, options=options, minused_cols=minused_cols)
+                             selected_columns=selected_columns, options=options, minused_cols=minused_cols,
+                             limit=limit)
+
+    def incremental_scan(self, from_snapshot_id, to_snapshot_id=None):
+        from .incremental_data_table_scan import IncrementalDataTableScan
+        if self.snapshot_id is not None:
+            raise RuntimeError("Cannot scan incrementally, snapshot already set to id=%s" % self.snapshot_id)
+
+        if to_snapshot_id is None:
+            to_snapshot_id = self.ops.current().current_snapshot_id
+
+        return IncrementalDataTableScan(self.ops, self.table, from_snapshot_id, to_snapshot_id, self._schema,
+                                        row_filter=self._row_filter, case_sensitive=self._case_sensitive,
+                                        selected_columns=self.selected_columns, options=self.options,
+                                        minused_cols=self.minused_cols, limit=self._limit)
 
     def plan_files(self, ops=None, snapshot=None, row_filter=None):
         if all(i is None for i in [ops, snapshot, row_filter]):
             return super(DataTableScan, self).plan_files()
 
-        matching_manifests = [manifest for manifest in snapshot.manifests
-                              if self.cache_loader(manifest.spec_id).eval(manifest)]
+        manifest_index = self.ops.current().manifest_index(snapshot)
+        matching_manifests = manifest_index.matching_manifests(self.planning_filter, self._case_sensitive)
+
+        if self._limit is not None and self.planning_filter == Expressions.always_true():
+            return self.plan_files_with_limit(matching_manifests)
 
         if self.ops.conf.get(SCAN_THREAD_POOL_ENABLED):
             with Pool(self.ops.conf.get(WORKER_THREAD_POOL_SIZE_PROP,
@@ -72,19 +88,49 @@ class DataTableScan(BaseTableScan):
             return itertools.chain.from_iterable([self.get_scans_for_manifest(manifest)
                                                   for manifest in matching_manifests])
 
-    def cache_loader(self, spec_id):
-        spec = self.ops.current().spec_id(spec_id)
-        return InclusiveManifestEvaluator(spec, self.row_filter)
+    def plan_files_for_snapshots(self, snapshot_ids):
+        # adjacent snapshots share most of their manifests, so each distinct manifest is planned once
+        metadata = self.ops.current()
+        snapshot_manifests = dict()
+        distinct_manifests = dict()
+        for snapshot_id in snapshot_ids:
+            manifest_index = metadata.manifest_index(metadata.snapshot(snapshot_id))
+            manifests = manifest_index.matching_manifests(self.planning_filter, self._case_sensitive)
+            snapshot_manifests[snapshot_id] = [manifest.manifest_path for manifest in manifests]
+            for manifest in manifests:
+                distinct_manifests.setdefault(manifest.manifest_path, manifest)
+
+        if self.ops.conf.get(SCAN_THREAD_POOL_ENABLED):
+            with Pool(self.ops.conf.get(WORKER_THREAD_POOL_SIZE_PROP,
+                                        cpu_count())) as reader_scan_pool:
+                scans = reader_scan_pool.map(self.get_scans_for_manifest, distinct_manifests.values())
+        else:
+            scans = [self.get_scans_for_manifest(manifest) for manifest in distinct_manifests.values()]
+
+        scans_by_path = dict(zip(distinct_manifests.keys(), scans))
+        return {snapshot_id: list(itertools.chain.from_iterable(scans_by_path[path] for path in paths))
+                for snapshot_id, paths in snapshot_manifests.items()}
+
+    def plan_files_with_limit(self, manifests):
+        # without a row filter every row of a file is returned, so planning can stop once the
+        # record counts of the planned files cover the limit
+        remaining = self._limit
+        for manifest in manifests:
+            for task in self.get_scans_for_manifest(manifest):
+                if remaining <= 0:
+                    return
+                remaining -= task.file.record_count()
+                yield task
 
     def get_scans_for_manifest(self, manifest):
         from .filesystem import FileSystemInputFile
         input_file = FileSystemInputFile.from_location(manifest.manifest_path, self.ops.conf)
-        reader = ManifestReader.read(input_file)
+        reader = ManifestReader.read(input_file, case_sensitive=self._case_sensitive)
         schema_str = SchemaParser.to_json(reader.spec.schema)
         spec_str = PartitionSpecParser.to_json(reader.spec)
-        residuals = ResidualEvaluator(reader.spec, self.row_filter)
+        residuals = EvaluatorCache.residual_evaluator(reader.spec, self.planning_filter, self._case_sensitive)
         return [BaseFileScanTask(file, schema_str, spec_str, residuals)
-                for file in reader.filter_rows(self.row_filter).select(BaseTableScan.SNAPSHOT_COLUMNS).iterator()]
+                for file in reader.filter_rows(self.planning_filter).select(BaseTableScan.SNAPSHOT_COLUMNS).iterator()]
 
     def target_split_size(self, ops):
         scan_split_size_str = self.options.get(TableProperties.SPLIT_SIZE)
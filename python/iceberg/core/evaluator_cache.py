@@ -0,0 +1,71 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api.expressions import (Evaluator,
+                                     inclusive,
+                                     InclusiveManifestEvaluator,
+                                     InclusiveMetricsEvaluator,
+                                     ResidualEvaluator)
+from iceberg.api.util import LRUCache
+
+
+class EvaluatorCache(object):
+    """
+    Evaluators and projections keyed by partition spec, filter and case sensitivity.
+
+    Filters are bound once and the evaluators are shared by every manifest and scan that uses the same
+    filter. Specs read from different manifests compare equal when their fields and schemas match.
+    """
+    CACHE_SIZE = 512
+    _cache = LRUCache(CACHE_SIZE)
+
+    @staticmethod
+    def manifest_evaluator(spec, row_filter, case_sensitive=True):
+        return EvaluatorCache.get((InclusiveManifestEvaluator, EvaluatorCache.spec_key(spec), row_filter, case_sensitive),
+                                  lambda: InclusiveManifestEvaluator(spec, row_filter, case_sensitive))
+
+    @staticmethod
+    def partition_evaluator(spec, part_filter, case_sensitive=True):
+        return EvaluatorCache.get((Evaluator, EvaluatorCache.spec_key(spec), part_filter, case_sensitive),
+                                  lambda: Evaluator(spec.partition_type(), part_filter, case_sensitive))
+
+    @staticmethod
+    def metrics_evaluator(schema, row_filter, case_sensitive=True):
+        return EvaluatorCache.get((InclusiveMetricsEvaluator, schema.as_struct(), row_filter, case_sensitive),
+                                  lambda: InclusiveMetricsEvaluator(schema, row_filter, case_sensitive))
+
+    @staticmethod
+    def residual_evaluator(spec, row_filter, case_sensitive=True):
+        return EvaluatorCache.get((ResidualEvaluator, EvaluatorCache.spec_key(spec), row_filter, case_sensitive),
+                                  lambda: ResidualEvaluator(spec, row_filter, case_sensitive))
+
+    @staticmethod
+    def inclusive_projection(spec, row_filter, case_sensitive=True):
+        return EvaluatorCache.get(("inclusive", EvaluatorCache.spec_key(spec), row_filter, case_sensitive),
+                                  lambda: inclusive(spec, case_sensitive=case_sensitive).project(row_filter))
+
+    @staticmethod
+    def spec_key(spec):
+        return spec.spec_id, spec, spec.schema.as_struct()
+
+    @staticmethod
+    def get(key, loader):
+        return EvaluatorCache._cache.get(key, loader)
+
+    @staticmethod
+    def clear_cache():
+        EvaluatorCache._cache.clear()
@@ -15,8 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from iceberg.api.expressions import Evaluator, Expressions, inclusive, InclusiveMetricsEvaluator
+from iceberg.api.expressions import Expressions
 
+from .evaluator_cache import EvaluatorCache
 from .manifest_entry import Status
 
 
@@ -46,7 +47,7 @@ class FilteredManifest(object):
                                 self.case_sensitive)
 
     def filter_rows(self, expr):
-        projected = inclusive(self.reader.spec).project(expr)
+        projected = EvaluatorCache.inclusive_projection(self.reader.spec, expr, self.case_sensitive)
         return FilteredManifest(self.reader,
                                 Expressions.and_(self.part_filter, projected),
                                 Expressions.and_(self.row_filter, expr),
@@ -94,25 +95,16 @@ class FilteredManifest(object):
 
     def evaluator(self):
         if self.lazy_evaluator is None:
-            if self.part_filter is not None:
-                self.lazy_evaluator = Evaluator(self.reader.spec.partition_type(),
-                                                self.part_filter,
-                                                self.case_sensitive)
-            else:
-                self.lazy_evaluator = Evaluator(self.reader.spec.partition_type(),
-                                                Expressions.always_true(),
-                                                self.case_sensitive)
+            part_filter = self.part_filter if self.part_filter is not None else Expressions.always_true()
+            self.lazy_evaluator = EvaluatorCache.partition_evaluator(self.reader.spec, part_filter,
+                                                                     self.case_sensitive)
 
         return self.lazy_evaluator
 
     def metrics_evaluator(self):
         if self.lazy_metrics_evaluator is None:
-            if self.row_filter is not None:
-                self.lazy_metrics_evaluator = InclusiveMetricsEvaluator(self.reader.spec.schema,
-                                                                        self.row_filter, self.case_sensitive)
-            else:
-                self.lazy_metrics_evaluator = InclusiveMetricsEvaluator(self.reader.spec.schema,
-                                                                        Expressions.always_true(),
-                                                                        self.case_sensitive)
+            row_filter = self.row_filter if self.row_filter is not None else Expressions.always_true()
+            self.lazy_metrics_evaluator = EvaluatorCache.metrics_evaluator(self.reader.spec.schema, row_filter,
+                                                                           self.case_sensitive)
 
         return self.lazy_metrics_evaluator
@@ -56,6 +56,7 @@ class GenericManifestFile(ManifestFile, StructLike):
             self.file = file
             self.manifest_path = file.location()
         else:
+            self.file = None
             self.manifest_path = path
 
         self._length = length
@@ -84,13 +85,10 @@ class GenericManifestFile(ManifestFile, StructLike):
         return self._deleted_files_count
 
     def lazy_length(self):
-        if self._length is None:
-            if self.file is not None:
-                self._length = self.file.get_length()
-            else:
-                return None
-        else:
-            return self._length
+        if self._length is None and self.file is not None:
+            self._length = self.file.get_length()
+
+        return self._length
 
     def size(self):
         return len(ManifestFile.schema().columns())
@@ -134,7 +132,7 @@ class GenericManifestFile(ManifestFile, StructLike):
                                    snapshot_id=self.snapshot_id, added_files_count=self.added_files_count,
                                    existing_files_count=self.existing_files_count,
                                    deleted_files_count=self.deleted_files_count,
-                                   partitions=list(self.partitions))
+                                   partitions=list(self.partitions) if self.partitions is not None else None)
 
     @staticmethod
     def get_schema():
@@ -166,9 +164,10 @@ class GenericManifestFile(ManifestFile, StructLike):
         return GenericManifestFile(path=row.get("manifest_path"),
                                    length=row.get("manifest_length"),
                                    spec_id=row.get("partition_spec_id"),
+                                   snapshot_id=row.get("added_snapshot_id"),
                                    added_files_count=row.get("added_data_files_count"),
                                    existing_files_count=row.get("existing_data_files_count"),
-                                   deleted_files_count=row.get("existing_data_files_count"),
+                                   deleted_files_count=row.get("deleted_data_files_count"),
                                    partitions=partitions)
 
     def __eq__(self, other):
@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import itertools
+from multiprocessing import cpu_count
+from multiprocessing.dummy import Pool
+
+from iceberg.api import DataOperations
+
+from .base_file_scan_task import BaseFileScanTask
+from .base_table_scan import BaseTableScan
+from .data_table_scan import DataTableScan
+from .evaluator_cache import EvaluatorCache
+from .manifest_group import ManifestGroup
+from .partition_spec_parser import PartitionSpecParser
+from .schema_parser import SchemaParser
+from .util import SCAN_THREAD_POOL_ENABLED, WORKER_THREAD_POOL_SIZE_PROP
+
+
+class IncrementalDataTableScan(DataTableScan):
+    """
+    Scans the files appended by the snapshots after from_snapshot_id, up to and including to_snapshot_id.
+
+    Only manifests added by those snapshots are read and only their ADDED entries are returned, so the
+    cost of planning is proportional to the appended data rather than the size of the table.
+    """
+
+    def __init__(self, ops, table, from_snapshot_id, to_snapshot_id, schema=None, row_filter=None,
+                 case_sensitive=True, selected_columns=None, options=None, minused_cols=None, limit=None):
+        super(IncrementalDataTableScan, self).__init__(ops, table, schema, snapshot_id=to_snapshot_id,
+                                                       row_filter=row_filter, case_sensitive=case_sensitive,
+                                                       selected_columns=selected_columns, options=options,
+                                                       minused_cols=minused_cols, limit=limit)
+        self.from_snapshot_id = from_snapshot_id
+        self.to_snapshot_id = to_snapshot_id
+        self.snapshot_ids = IncrementalDataTableScan.appends_between(ops.current(), from_snapshot_id,
+                                                                     to_snapshot_id)
+        self._snapshot_id_set = set(self.snapshot_ids)
+
+    def new_refined_scan(self, ops, table, schema, snapshot_id=None, row_filter=None, case_sensitive=None,
+                         selected_columns=None, options=None, minused_cols=None, limit=None):
+        return IncrementalDataTableScan(ops, table, self.from_snapshot_id, self.to_snapshot_id, schema,
+                                        row_filter=row_filter, case_sensitive=case_sensitive,
+                                        selected_columns=selected_columns, options=options,
+                                        minused_cols=minused_cols, limit=limit)
+
+    def incremental_scan(self, from_snapshot_id, to_snapshot_id=None):
+        raise RuntimeError("Cannot override the snapshot range, already set to (%s, %s]"
+                           % (self.from_snapshot_id, self.to_snapshot_id))
+
+    def plan_files(self, ops=None, snapshot=None, row_filter=None):
+        metadata = self.ops.current()
+        manifests = dict()
+        for snapshot_id in self.snapshot_ids:
+            for manifest in metadata.snapshot(snapshot_id).manifests:
+                # manifests without an added snapshot id are read and filtered by entry
+                if manifest.snapshot_id is None or manifest.snapshot_id in self._snapshot_id_set:
+                    manifests.setdefault(manifest.manifest_path, manifest)
+
+        group = ManifestGroup(self.ops, list(manifests.values()), self.planning_filter, ignore_deleted=True,
+                              ignore_existing=True, columns=BaseTableScan.SNAPSHOT_COLUMNS,
+                              case_sensitive=self._case_sensitive)
+        matching_manifests = [manifest for manifest in manifests.values() if group.matches(manifest)]
+
+        if self.ops.conf.get(SCAN_THREAD_POOL_ENABLED):
+            with Pool(self.ops.conf.get(WORKER_THREAD_POOL_SIZE_PROP,
+                                        cpu_count())) as reader_scan_pool:
+                return itertools.chain.from_iterable(reader_scan_pool.map(lambda manifest:
+                                                                          self.get_added_scans(group, manifest),
+                                                                          matching_manifests))
+
+        return itertools.chain.from_iterable([self.get_added_scans(group, manifest)
+                                              for manifest in matching_manifests])
+
+    def get_added_scans(self, group, manifest):
+        spec = self.ops.current().spec_id(manifest.spec_id)
+        schema_str = SchemaParser.to_json(spec.schema)
+        spec_str = PartitionSpecParser.to_json(spec)
+        residuals = EvaluatorCache.residual_evaluator(spec, self.planning_filter, self._case_sensitive)
+        return [BaseFileScanTask(entry.file, schema_str, spec_str, residuals)
+                for entry in group.read_entries(manifest)
+                if entry.snapshot_id in self._snapshot_id_set]
+
+    @staticmethod
+    def appends_between(metadata, from_snapshot_id, to_snapshot_id):
+        """Returns the ids of the append snapshots in (from_snapshot_id, to_snapshot_id], oldest first."""
+        snapshot_ids = list()
+        for snapshot_id in metadata.ancestry.ancestors_between(from_snapshot_id, to_snapshot_id):
+            snapshot = metadata.snapshot(snapshot_id)
+            if snapshot.operation == DataOperations.OVERWRITE:
+                raise RuntimeError("Found %s operation, cannot read incremental data in snapshots (%s, %s]"
+                                   % (snapshot.operation, from_snapshot_id, to_snapshot_id))
+            # replace only rewrites existing data and delete adds no files
+            if snapshot.operation is None or snapshot.operation == DataOperations.APPEND:
+                snapshot_ids.append(snapshot_id)
+
+        return snapshot_ids
@@ -94,7 +94,7 @@ class ManifestEntry():
                                                     .field(name="partition").type, v.get("partition"))
 
                 v = GenericDataFile(v.get("file_path"),
-                                    FileFormat[v.get("file_format")],
+                                    FileFormat[v.get("file_format")] if v.get("file_format") is not None else None,
                                     v.get("file_size_in_bytes"),
                                     v.get("block_size_in_byte"),
                                     row_count=v.get("record_count"),
@@ -0,0 +1,105 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from multiprocessing import cpu_count
+from multiprocessing.dummy import Pool
+
+from iceberg.api.expressions import Expressions
+
+from .evaluator_cache import EvaluatorCache
+from .manifest_entry import Status
+from .manifest_reader import ManifestReader
+from .util import SCAN_THREAD_POOL_ENABLED, WORKER_THREAD_POOL_SIZE_PROP
+
+
+class ManifestGroup(object):
+    """
+    Reads the entries of a group of manifests, skipping manifests that can't contain matching entries.
+
+    Manifests are read in the worker thread pool when iceberg.scan.plan-in-worker-pool is enabled and
+    entries are returned as each manifest is read.
+    """
+
+    def __init__(self, ops, manifests, data_filter=None, ignore_deleted=False, ignore_existing=False,
+                 columns=None, case_sensitive=True):
+        self.ops = ops
+        self.manifests = manifests
+        self.data_filter = data_filter if data_filter is not None else Expressions.always_true()
+        self._ignore_deleted = ignore_deleted
+        self._ignore_existing = ignore_existing
+        self.columns = columns if columns is not None else ManifestReader.ALL_COLUMNS
+        self._case_sensitive = case_sensitive
+        self._evaluators = dict()
+
+    def filter_data(self, expr):
+        return ManifestGroup(self.ops, self.manifests, Expressions.and_(self.data_filter, expr),
+                             self._ignore_deleted, self._ignore_existing, self.columns, self._case_sensitive)
+
+    def ignore_deleted(self, ignore_deleted=True):
+        return ManifestGroup(self.ops, self.manifests, self.data_filter, ignore_deleted,
+                             self._ignore_existing, self.columns, self._case_sensitive)
+
+    def ignore_existing(self, ignore_existing=True):
+        return ManifestGroup(self.ops, self.manifests, self.data_filter, self._ignore_deleted,
+                             ignore_existing, self.columns, self._case_sensitive)
+
+    def select(self, columns):
+        return ManifestGroup(self.ops, self.manifests, self.data_filter, self._ignore_deleted,
+                             self._ignore_existing, list(columns), self._case_sensitive)
+
+    def case_sensitive(self, case_sensitive):
+        return ManifestGroup(self.ops, self.manifests, self.data_filter, self._ignore_deleted,
+                             self._ignore_existing, self.columns, case_sensitive)
+
+    def entries(self):
+        matching_manifests = [manifest for manifest in self.manifests if self.matches(manifest)]
+
+        if self.ops.conf.get(SCAN_THREAD_POOL_ENABLED):
+            with Pool(self.ops.conf.get(WORKER_THREAD_POOL_SIZE_PROP, cpu_count())) as reader_pool:
+                for entries in reader_pool.imap(self.read_entries, matching_manifests):
+                    for entry in entries:
+                        yield entry
+        else:
+            for manifest in matching_manifests:
+                for entry in self.read_entries(manifest):
+                    yield entry
+
+    def matches(self, manifest):
+        # a missing count means the manifest must be read
+        if self._ignore_deleted and manifest.added_files_count == 0 and manifest.existing_files_count == 0:
+            return False
+
+        if self._ignore_existing and manifest.added_files_count == 0 and manifest.deleted_files_count == 0:
+            return False
+
+        evaluator = self._evaluators.get(manifest.spec_id)
+        if evaluator is None:
+            evaluator = EvaluatorCache.manifest_evaluator(self.ops.current().spec_id(manifest.spec_id),
+                                                          self.data_filter, self._case_sensitive)
+            self._evaluators[manifest.spec_id] = evaluator
+
+        return evaluator.eval(manifest)
+
+    def read_entries(self, manifest):
+        from .filesystem import FileSystemInputFile
+        reader = ManifestReader.read(FileSystemInputFile.from_location(manifest.manifest_path, self.ops.conf),
+                                     self.ops.current().spec_id, self._case_sensitive)
+        filtered = reader.filter_rows(self.data_filter).select(self.columns)
+        entries = filtered.live_entries() if self._ignore_deleted else filtered.all_entries()
+
+        return [entry for entry in entries
+                if not self._ignore_existing or entry.status != Status.EXISTING]
@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api import ManifestFile
+from iceberg.api.util import LRUCache
+from iceberg.core.avro import AvroToIceberg
+
+from .generic_manifest_file import GenericManifestFile
+from .generic_partition_field_summary import GenericPartitionFieldSummary
+
+
+class ManifestList(object):
+    """
+    A decoded manifest list, stored by column so GenericManifestFile objects are only created when accessed.
+
+    Manifest lists are immutable, so decoded lists are kept in a bounded LRU cache keyed by location that is
+    shared by every snapshot and scan in the process.
+    """
+
+    CACHE_SIZE = 128
+    _cache = LRUCache(CACHE_SIZE)
+
+    @staticmethod
+    def read(input_file):
+        return ManifestList._cache.get(input_file.location(),
+                                       lambda: ManifestList(AvroToIceberg.read_avro_file(ManifestFile.schema(),
+                                                                                         input_file)))
+
+    @staticmethod
+    def clear_cache():
+        ManifestList._cache.clear()
+
+    def __init__(self, rows):
+        paths = list()
+        lengths = list()
+        spec_ids = list()
+        snapshot_ids = list()
+        added_counts = list()
+        existing_counts = list()
+        deleted_counts = list()
+        partitions = list()
+        for row in rows:
+            paths.append(row.get("manifest_path"))
+            lengths.append(row.get("manifest_length"))
+            spec_ids.append(row.get("partition_spec_id"))
+            snapshot_ids.append(row.get("added_snapshot_id"))
+            added_counts.append(row.get("added_data_files_count"))
+            existing_counts.append(row.get("existing_data_files_count"))
+            deleted_counts.append(row.get("deleted_data_files_count"))
+            summaries = row.get("partitions")
+            partitions.append(None if summaries is None
+                              else tuple((summary["contains_null"], summary["lower_bound"], summary["upper_bound"])
+                                         for summary in summaries))
+
+        self.paths = tuple(paths)
+        self.lengths = tuple(lengths)
+        self.spec_ids = tuple(spec_ids)
+        self.snapshot_ids = tuple(snapshot_ids)
+        self.added_counts = tuple(added_counts)
+        self.existing_counts = tuple(existing_counts)
+        self.deleted_counts = tuple(deleted_counts)
+        self.partitions = tuple(partitions)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        return (self[pos] for pos in range(len(self.paths)))
+
+    def __getitem__(self, pos):
+        summaries = self.partitions[pos]
+        if summaries is not None:
+            summaries = [GenericPartitionFieldSummary(contains_null=contains_null, lower_bound=lower_bound,
+                                                      upper_bound=upper_bound)
+                         for contains_null, lower_bound, upper_bound in summaries]
+
+        return GenericManifestFile(path=self.paths[pos], length=self.lengths[pos], spec_id=self.spec_ids[pos],
+                                   snapshot_id=self.snapshot_ids[pos], added_files_count=self.added_counts[pos],
+                                   existing_files_count=self.existing_counts[pos],
+                                   deleted_files_count=self.deleted_counts[pos], partitions=summaries)
@@ -0,0 +1,192 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from bisect import bisect_left, bisect_right
+
+from iceberg.api.expressions import Binder, Expressions, ExpressionVisitors
+from iceberg.api.expressions.projections import inclusive
+from iceberg.api.types import Conversions
+
+
+class ManifestPartitionIndex(object):
+    """Decoded partition bounds of a snapshot's manifests, kept in sorted arrays per partition field.
+
+    Pruning manifests for a row filter becomes a set of binary searches over the bounds instead of
+    decoding every manifest's partition summaries with an InclusiveManifestEvaluator.
+    """
+
+    def __init__(self, manifests, spec_lookup):
+        self.manifests = list(manifests)
+        self.spec_lookup = spec_lookup
+        self.unindexed = set()
+        self.spec_indexes = dict()
+
+        by_spec = dict()
+        for pos, manifest in enumerate(self.manifests):
+            if manifest.partitions is None:
+                self.unindexed.add(pos)
+            else:
+                by_spec.setdefault(manifest.spec_id, list()).append(pos)
+
+        for spec_id, positions in by_spec.items():
+            spec = spec_lookup(spec_id)
+            self.spec_indexes[spec_id] = SpecIndex(spec, positions,
+                                                   [self.manifests[pos].partitions for pos in positions])
+
+    def matching_manifests(self, row_filter, case_sensitive=True):
+        if row_filter is None or row_filter == Expressions.always_true():
+            return list(self.manifests)
+
+        matches = set(self.unindexed)
+        for spec_index in self.spec_indexes.values():
+            matches.update(spec_index.matching(row_filter, case_sensitive))
+
+        return [self.manifests[pos] for pos in sorted(matches)]
+
+
+class SpecIndex(object):
+
+    def __init__(self, spec, positions, summaries):
+        self.spec = spec
+        self.positions = frozenset(positions)
+        # manifests from older writers may have fewer summaries than partition fields
+        self.fields = [FieldIndex(field.type, positions,
+                                  [summary[i] if i < len(summary) else None for summary in summaries])
+                       for i, field in enumerate(spec.partition_type().fields)]
+
+    def matching(self, row_filter, case_sensitive=True):
+        expr = Binder.bind(self.spec.partition_type(),
+                           Expressions.rewrite_not(inclusive(self.spec, case_sensitive=case_sensitive)
+                                                   .project(row_filter)),
+                           case_sensitive=case_sensitive)
+        return ExpressionVisitors.visit(expr, IndexEvalVisitor(self))
+
+
+class FieldIndex(object):
+
+    def __init__(self, type_var, positions, summaries):
+        # positions without a summary might contain any value, so every lookup returns them
+        self.unbounded = frozenset(pos for pos, summary in zip(positions, summaries) if summary is None)
+        self.nulls = self.unbounded | frozenset(pos for pos, summary in zip(positions, summaries)
+                                                if summary is not None and summary.contains_null())
+
+        lowers = list()
+        uppers = list()
+        for pos, summary in zip(positions, summaries):
+            if summary is not None and summary.lower_bound() is not None:
+                lowers.append((Conversions.from_byte_buffer(type_var, summary.lower_bound()), pos))
+                uppers.append((Conversions.from_byte_buffer(type_var, summary.upper_bound()), pos))
+
+        self.bounds = {lower[1]: (lower[0], upper[0]) for lower, upper in zip(lowers, uppers)}
+        lowers.sort(key=lambda bound: bound[0])
+        uppers.sort(key=lambda bound: bound[0])
+        self.lower_values = [bound[0] for bound in lowers]
+        self.lower_positions = [bound[1] for bound in lowers]
+        self.upper_values = [bound[0] for bound in uppers]
+        self.upper_positions = [bound[1] for bound in uppers]
+
+    def non_null(self):
+        return set(self.lower_positions) | self.unbounded
+
+    def lower_below(self, value, inclusive=False):
+        end = bisect_right(self.lower_values, value) if inclusive else bisect_left(self.lower_values, value)
+        return set(self.lower_positions[:end]) | self.unbounded
+
+    def upper_above(self, value, inclusive=False):
+        start = bisect_left(self.upper_values, value) if inclusive else bisect_right(self.upper_values, value)
+        return set(self.upper_positions[start:]) | self.unbounded
+
+    def between(self, low, high):
+        # positions whose bounds overlap [low, high], checking only the shorter of the two sorted runs
+        end = bisect_right(self.lower_values, high)
+        start = bisect_left(self.upper_values, low)
+        if end <= len(self.upper_positions) - start:
+            return {pos for pos in self.lower_positions[:end] if self.bounds[pos][1] >= low} | self.unbounded
+
+        return {pos for pos in self.upper_positions[start:] if self.bounds[pos][0] <= high} | self.unbounded
+
+    def overlapping(self, lit):
+        # narrow down with [min, max] of the set before checking the values against each range
+        values = lit.sorted_values
+        return {pos for pos in self.between(values[0], values[-1])
+                if pos in self.unbounded or lit.contains_between(*self.bounds[pos])}
+
+    def starting_with(self, prefix):
+        # an upper bound below the prefix is below every value that starts with it
+        return {pos for pos in self.upper_above(prefix, inclusive=True)
+                if pos in self.unbounded or self.bounds[pos][0][:len(prefix)] <= prefix}
+
+    def single_values_in(self, lit):
+        # positions without nulls whose every value is in the set
+        return {pos for pos, (lower, upper) in self.bounds.items()
+                if lower == upper and lower in lit.value and pos not in self.nulls}
+
+
+class IndexEvalVisitor(ExpressionVisitors.BoundExpressionVisitor):
+
+    def __init__(self, spec_index):
+        self.spec_index = spec_index
+        self.fields = spec_index.fields
+
+    def always_true(self):
+        return set(self.spec_index.positions)
+
+    def always_false(self):
+        return set()
+
+    def not_(self, result):
+        # negations are rewritten before binding, so this is never reached for projected filters
+        return self.always_true()
+
+    def and_(self, left_result, right_result):
+        return left_result & right_result
+
+    def or_(self, left_result, right_result):
+        return left_result | right_result
+
+    def is_null(self, ref):
+        return set(self.fields[ref.pos].nulls)
+
+    def not_null(self, ref):
+        return self.fields[ref.pos].non_null()
+
+    def lt(self, ref, lit):
+        return self.fields[ref.pos].lower_below(lit.value)
+
+    def lt_eq(self, ref, lit):
+        return self.fields[ref.pos].lower_below(lit.value, inclusive=True)
+
+    def gt(self, ref, lit):
+        return self.fields[ref.pos].upper_above(lit.value)
+
+    def gt_eq(self, ref, lit):
+        return self.fields[ref.pos].upper_above(lit.value, inclusive=True)
+
+    def eq(self, ref, lit):
+        return self.fields[ref.pos].between(lit.value, lit.value)
+
+    def not_eq(self, ref, lit):
+        return self.always_true()
+
+    def in_(self, ref, lit):
+        return self.fields[ref.pos].overlapping(lit)
+
+    def not_in(self, ref, lit):
+        return self.always_true() - self.fields[ref.pos].single_values_in(lit)
+
+    def starts_with(self, ref, lit):
+        return self.fields[ref.pos].starting_with(lit.value)
@@ -19,10 +19,11 @@ import logging
 
 import fastavro
 from iceberg.api import FileFormat, Filterable
-from iceberg.api.expressions import Expressions, inclusive
+from iceberg.api.expressions import Expressions
 from iceberg.api.io import CloseableGroup
 
 from .avro import AvroToIceberg
+from .evaluator_cache import EvaluatorCache
 from .filtered_manifest import FilteredManifest
 from .manifest_entry import ManifestEntry, Status
 from .partition_spec_parser import PartitionSpecParser
@@ -37,29 +38,29 @@ class ManifestReader(CloseableGroup, Filterable):
     CHANGE_COLUMNS = ("file_path", "file_format", "partition", "record_count", "file_size_in_bytes")
 
     @staticmethod
-    def read(file, spec_lookup=None):
-        return ManifestReader(file=file, spec_lookup=spec_lookup)
+    def read(file, spec_lookup=None, case_sensitive=True):
+        return ManifestReader(file=file, case_sensitive=case_sensitive, spec_lookup=spec_lookup)
 
     def select(self, columns):
         return FilteredManifest(self,
                                 Expressions.always_true(),
                                 Expressions.always_true(),
                                 list(columns),
-                                self.case_sensitive)
+                                self._case_sensitive)
 
     def filter_partitions(self, expr):
         return FilteredManifest(self,
                                 expr,
                                 Expressions.always_true(),
                                 ManifestReader.ALL_COLUMNS,
-                                self.case_sensitive)
+                                self._case_sensitive)
 
     def filter_rows(self, expr):
         return FilteredManifest(self,
-                                inclusive(self.spec).project(expr),
+                                EvaluatorCache.inclusive_projection(self.spec, expr, self._case_sensitive),
                                 expr,
                                 ManifestReader.ALL_COLUMNS,
-                                self.case_sensitive)
+                                self._case_sensitive)
 
     @staticmethod
     def in_memory(spec, entries):
@@ -112,9 +113,9 @@ class ManifestReader(CloseableGroup, Filterable):
         adds = list()
         deletes = list()
         for entry in self.entries(ManifestReader.CHANGE_COLUMNS):
-            if entry.status == "ADDED":
+            if entry.status == Status.ADDED:
                 adds.append(entry.copy())
-            elif entry.status == "DELETED":
+            elif entry.status == Status.DELETED:
                 deletes.append(entry.copy())
 
         self._adds = adds
@@ -127,7 +128,7 @@ class ManifestReader(CloseableGroup, Filterable):
         return self._adds
 
     def deleted_files(self):
-        if self._adds is None:
+        if self._deletes is None:
             self.cache_changes()
 
         return self._deletes
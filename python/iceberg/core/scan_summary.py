@@ -15,8 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from copy import deepcopy
 import functools
+import heapq
 
 from iceberg.api import DataOperations
 from iceberg.api.expressions import Expressions, Literal, Operation, UnboundPredicate
@@ -38,6 +38,10 @@ class ScanSummary(object):
     IGNORED_OPERATIONS = {DataOperations.DELETE, DataOperations.REPLACE}
     SCAN_SUMMARY_COLUMNS = ["partition", "record_count", "file_size_in_bytes"]
 
+    @staticmethod
+    def of(scan):
+        return ScanSummaryBuilder(scan)
+
 
 class ScanSummaryBuilder(object):
 
@@ -117,15 +121,12 @@ class ScanSummaryBuilder(object):
             return self.from_manifest_scan(self.table.current_snapshot().manifests, row_filter)
 
         min_timestamp, max_timestamp = self.timestamp_range(self.time_filters)
-        oldest_snapshot = self.table.current_snapshot()
-        for key, val in self.snapshot_timestamps.items():
-            if val < oldest_snapshot.timestamp_millis:
-                oldest_snapshot = self.ops.current().snapshot(key)
+        oldest_timestamp = min(self.snapshot_timestamps.values())
 
         # if oldest known snapshot is in the range, then there may be an expired snapshot that has
         # been removed that matched the range. because the timestamp of that snapshot is unknown,
         # it can't be included in the results and the results are not reliable."""
-        if oldest_snapshot.timestamp_millis >= min_timestamp and oldest_snapshot <= max_timestamp:
+        if min_timestamp <= oldest_timestamp <= max_timestamp:
             raise RuntimeError("Cannot satisfy time filters: time range may include expired snapshots")
 
         snapshots = [snapshot for snapshot in ScanSummaryBuilder.snapshots_in_time_range(self.ops.current(),
@@ -133,9 +134,11 @@ class ScanSummaryBuilder(object):
                                                                                          max_timestamp)
                      if snapshot.operation not in ScanSummary.IGNORED_OPERATIONS]
 
-        result = self.from_partition_summaries(snapshots)
-        if result is not None and not self.force_use_manifests:
-            return result
+        # partition summaries can't be filtered by rows, so they are only used without a row filter
+        if row_filter == Expressions.always_true() and not self.force_use_manifests:
+            result = self.from_partition_summaries(snapshots)
+            if result is not None:
+                return result
 
         # filter down to the the set of manifest files that were created in the time range, ignoring
         # the snapshots created by delete or replace operations. this is complete because it finds
@@ -143,17 +146,14 @@ class ScanSummaryBuilder(object):
         # overwrite. if those files are later compacted with a replace or deleted, those changes are
         # ignored.
         manifests_to_scan = list()
-        snapshot_ids = set()
-
         for snap in snapshots:
-            snapshot_ids.add(snap)
             for manifest in snap.manifests:
-                if manifest.snapshot_id is not None or manifest.snapshot_id == snap.snapshot_id:
+                if manifest.snapshot_id is None or manifest.snapshot_id == snap.snapshot_id:
                     manifests_to_scan.append(manifest)
 
-        return self.from_manifest_scan(manifests_to_scan, row_filter, True)
+        return self.from_manifest_scan(manifests_to_scan, row_filter, True, (min_timestamp, max_timestamp))
 
-    def from_manifest_scan(self, manifests, row_filter, ignore_existing=False):
+    def from_manifest_scan(self, manifests, row_filter, ignore_existing=False, timestamp_range=None):
         top_n = TopN(self._limit, self._throw_if_limited, lambda x, y: 0 if x == y else -1 if x < y else 1)
 
         entries = (ManifestGroup(self.ops, manifests)
@@ -166,6 +166,11 @@ class ScanSummaryBuilder(object):
         spec = self.table.spec()
         for entry in entries:
             timestamp = self.snapshot_timestamps.get(entry.snapshot_id)
+            # if filtering, skip entries added outside of the time range
+            if timestamp_range is not None \
+                    and (timestamp is None or not timestamp_range[0] <= timestamp <= timestamp_range[1]):
+                continue
+
             partition = spec.partition_to_path(entry.file.partition())
             top_n.update(partition,
                          lambda metrics: ((metrics if metrics is not None else PartitionMetrics())
@@ -176,22 +181,21 @@ class ScanSummaryBuilder(object):
     def from_partition_summaries(self, snapshots):
         # try to build the result from snapshot metadata, but fall back if:
         # any snapshot has no summary
-        # any snapshot has
+        # any snapshot has a summary without partition-level data
         top_n = TopN(self._limit, self._throw_if_limited, lambda x, y: 0 if x == y else -1 if x < y else 1)
 
         for snap in snapshots:
             if snap.operation is None or snap.summary is None \
-                    or str_as_bool(snap.summary.get(SnapshotSummary.PARTITION_SUMMARY_PROP, "false")):
+                    or not str_as_bool(str(snap.summary.get(SnapshotSummary.PARTITION_SUMMARY_PROP, "false"))):
                 return None
 
-            for key, _ in snap.summary.items():
+            for key, val in snap.summary.items():
                 if key.startswith(SnapshotSummary.CHANGED_PARTITION_PREFIX):
                     part_key = key[len(SnapshotSummary.CHANGED_PARTITION_PREFIX):]
-                    # part = dict(entry.split("=") for entry in val.split(","))
-                    # UPDATE THIS BEFORE FINISHING
-                    added_files = 0
-                    added_records = 0
-                    added_size = 0
+                    part = dict(entry.split("=", 1) for entry in val.split(",") if "=" in entry)
+                    added_files = int(part.get(SnapshotSummary.ADDED_FILES_PROP, 0))
+                    added_records = int(part.get(SnapshotSummary.ADDED_RECORDS_PROP, 0))
+                    added_size = int(part.get(SnapshotSummary.ADDED_FILE_SIZE_PROP, 0))
                     top_n.update(part_key,
                                  lambda metrics: ((PartitionMetrics() if metrics is None else metrics)
                                                   .update_from_counts(added_files,
@@ -203,16 +207,7 @@ class ScanSummaryBuilder(object):
 
     @staticmethod
     def snapshots_in_time_range(meta, min_ts, max_ts):
-        snapshots = []
-        current = meta.current_snapshot()
-        while current is not None and current.timestamp_millis >= min_ts:
-            current = meta.snapshot(current.parent_id)
-
-        if current.timestamp_millis <= max_ts:
-            snapshots.add(current)
-
-        snapshots.reverse()
-        return snapshots
+        return meta.ancestry.snapshots_in_time_range(min_ts, max_ts)
 
     @staticmethod
     def timestamp_range(time_filters):
@@ -220,7 +215,7 @@ class ScanSummaryBuilder(object):
         max_timestamp = float('inf')
 
         for pred in time_filters:
-            value = pred.lit.val
+            value = pred.lit.value
             try:
                 min_timestamp, max_timestamp = TIMESTAMP_RANGE_MAP[pred.op](min_timestamp, max_timestamp, value)
             except KeyError:
@@ -254,6 +249,9 @@ class ScanSummaryBuilder(object):
 
 
 class TopN(object):
+    """
+    Keeps the values of the N smallest keys, tracking the largest kept key with a heap.
+    """
 
     def __init__(self, N, throw_if_limited, key_comparator):
         self.max_size = N
@@ -261,22 +259,37 @@ class TopN(object):
         self.map = dict()
         self.key_comparator = key_comparator
         self.cut = None
+        self._heap = list()
 
     def update(self, key, update_func):
+        # keys at or after the cut were already excluded
         if self.cut is not None and self.key_comparator(self.cut, key) <= 0:
             return
 
+        if key not in self.map:
+            heapq.heappush(self._heap, TopN.ReversedKey(key, self.key_comparator))
+
         self.map[key] = update_func(self.map.get(key))
 
-        while len(map.keys()) > self.max_size:
+        while len(self.map) > self.max_size:
             if self.throw_if_limited:
                 raise RuntimeError("Too many matching keys: more than %s" % self.max_size)
 
-            self.cut = sorted(self.map, key=functools.cmp_to_key(self.key_comparator))[-1]
+            self.cut = heapq.heappop(self._heap).key
             del self.map[self.cut]
 
     def get(self):
-        return deepcopy(self.map)
+        return {key: self.map[key] for key in sorted(self.map, key=functools.cmp_to_key(self.key_comparator))}
+
+    class ReversedKey(object):
+        __slots__ = ["key", "key_comparator"]
+
+        def __init__(self, key, key_comparator):
+            self.key = key
+            self.key_comparator = key_comparator
+
+        def __lt__(self, other):
+            return self.key_comparator(self.key, other.key) > 0
 
 
 class PartitionMetrics(object):
@@ -300,7 +313,7 @@ class PartitionMetrics(object):
     def update_from_file(self, file, timestamp_millis):
         self.file_count += 1
         self.record_count += file.record_count()
-        self.total_size += file.files_size_in_bytes()
+        self.total_size += file.file_size_in_bytes()
 
         if self.data_timestamp_millis is None or self.data_timestamp_millis < timestamp_millis:
             self.data_timestamp_millis = timestamp_millis
@@ -356,14 +369,14 @@ class SnapshotSummaryBuilder(object):
         self.deleted_dupicate_files += 1
 
     def deleted_file(self, spec, data_file):
-        self.update_partitiomns(spec, data_file, False)
+        self.update_partitions(spec, data_file, False)
         self.deleted_files += 1
-        self.deleted_records += data_file.record_count
+        self.deleted_records += data_file.record_count()
 
     def added_file(self, spec, data_file):
-        self.update_partitiomns(spec, data_file, True)
+        self.update_partitions(spec, data_file, True)
         self.added_files += 1
-        self.added_records += data_file.record_count
+        self.added_records += data_file.record_count()
 
     def update_partitions(self, spec, file, is_addition):
         key = spec.partition_to_path(file.partition())
@@ -390,11 +403,11 @@ class SnapshotSummaryBuilder(object):
 
         if len(self.changed_partitions.items()) < 100:
             builder[SnapshotSummary.PARTITION_SUMMARY_PROP] = "true"
-            for key, metrics in self.changed_partitions:
+            for key, metrics in self.changed_partitions.items():
                 metric_dict = {SnapshotSummary.ADDED_FILES_PROP: metrics.file_count,
                                SnapshotSummary.ADDED_RECORDS_PROP: metrics.record_count,
                                SnapshotSummary.ADDED_FILE_SIZE_PROP: metrics.total_size}
-                builder[SnapshotSummary.CHANGED_PARTITION_PREFIX + key] = ",".join(["{}={}".format(key, val)
+                builder[SnapshotSummary.CHANGED_PARTITION_PREFIX + key] = ",".join(["{}={}".format(inner_key, val)
                                                                                     for inner_key, val
                                                                                     in metric_dict.items()])
 
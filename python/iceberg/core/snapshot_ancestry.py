@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from bisect import bisect_left, bisect_right
+
+
+class SnapshotAncestry(object):
+    """
+    Lineage of the snapshots in a table's metadata, computed once so history queries don't walk parent ids.
+
+    Each snapshot gets a pre/post order interval in the parent/child forest, which answers is-ancestor
+    queries by comparing intervals. The ancestors of the current snapshot are kept oldest first along with
+    an array of their timestamps sorted for bisection.
+    """
+
+    def __init__(self, snapshots, current_snapshot_id):
+        self.snapshot_by_id = {snapshot.snapshot_id: snapshot for snapshot in snapshots}
+        self._enter = dict()
+        self._exit = dict()
+        self._depth = dict()
+        self._index_forest(snapshots)
+
+        self.lineage = self.walk(current_snapshot_id)
+        self._lineage_pos = {snapshot_id: pos for pos, snapshot_id in enumerate(self.lineage)}
+
+        by_time = sorted((self.snapshot_by_id[snapshot_id].timestamp_millis, pos)
+                         for pos, snapshot_id in enumerate(self.lineage))
+        self._timestamps = [timestamp for timestamp, _ in by_time]
+        self._ids_by_time = [self.lineage[pos] for _, pos in by_time]
+
+    def _index_forest(self, snapshots):
+        children = dict()
+        roots = list()
+        for snapshot in snapshots:
+            # a snapshot whose parent has expired starts a new tree
+            if snapshot.parent_id is not None and snapshot.parent_id in self.snapshot_by_id:
+                children.setdefault(snapshot.parent_id, list()).append(snapshot.snapshot_id)
+            else:
+                roots.append(snapshot.snapshot_id)
+
+        counter = 0
+        stack = [(root, 0, False) for root in reversed(roots)]
+        while stack:
+            snapshot_id, depth, visited = stack.pop()
+            if visited:
+                self._exit[snapshot_id] = counter
+            else:
+                self._enter[snapshot_id] = counter
+                self._depth[snapshot_id] = depth
+                stack.append((snapshot_id, depth, True))
+                stack.extend((child, depth + 1, False) for child in reversed(children.get(snapshot_id, list())))
+            counter += 1
+
+    def walk(self, snapshot_id):
+        ancestors = list()
+        while snapshot_id is not None and snapshot_id in self.snapshot_by_id:
+            ancestors.append(snapshot_id)
+            snapshot_id = self.snapshot_by_id[snapshot_id].parent_id
+
+        return list(reversed(ancestors))
+
+    def is_ancestor(self, ancestor_id, snapshot_id):
+        """Returns True if ancestor_id is snapshot_id or one of its ancestors."""
+        if ancestor_id not in self._enter or snapshot_id not in self._enter:
+            return False
+
+        return self._enter[ancestor_id] <= self._enter[snapshot_id] and self._exit[snapshot_id] <= self._exit[ancestor_id]
+
+    def ancestor_ids(self, snapshot_id):
+        """Returns the ids of snapshot_id and its ancestors, oldest first."""
+        pos = self._lineage_pos.get(snapshot_id)
+        if pos is not None:
+            return self.lineage[:pos + 1]
+
+        return self.walk(snapshot_id)
+
+    def ancestors_between(self, from_snapshot_id, to_snapshot_id):
+        """Returns the ids of the ancestors of to_snapshot_id after from_snapshot_id, oldest first."""
+        if not self.is_ancestor(from_snapshot_id, to_snapshot_id):
+            raise RuntimeError("Starting snapshot %s is not an ancestor of %s" % (from_snapshot_id, to_snapshot_id))
+
+        return self.ancestor_ids(to_snapshot_id)[self._depth[from_snapshot_id] + 1:]
+
+    def snapshots_in_time_range(self, min_timestamp, max_timestamp):
+        """Returns the ancestors of the current snapshot committed in [min_timestamp, max_timestamp]."""
+        start = bisect_left(self._timestamps, min_timestamp)
+        end = bisect_right(self._timestamps, max_timestamp)
+        return [self.snapshot_by_id[snapshot_id] for snapshot_id in self._ids_by_time[start:end]]
@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from bisect import bisect_right
+import threading
 import time
 
 from iceberg.api import PartitionSpec, Schema
@@ -23,6 +25,9 @@ from iceberg.core.table_operations import TableOperations
 from iceberg.core.util import AtomicInteger
 from iceberg.exceptions import ValidationException
 
+from .manifest_partition_index import ManifestPartitionIndex
+from .snapshot_ancestry import SnapshotAncestry
+
 
 class TableMetadata(object):
     INITIAL_SPEC_ID = 0
@@ -69,6 +74,9 @@ class TableMetadata(object):
 
         self.snapshot_by_id = {version.snapshot_id: version for version in self.snapshots}
         self.specs_by_id = {spec.spec_id: spec for spec in self.specs}
+        self._ancestry = None
+        self._manifest_indexes = dict()
+        self._lock = threading.Lock()
 
         last = None
         for log_entry in snapshot_log:
@@ -76,6 +84,7 @@ class TableMetadata(object):
                 if not (log_entry.timestamp_millis - last.timestamp_millis > 0):
                     raise RuntimeError("[BUG] Expected sorted snapshot log entries.")
             last = log_entry
+        self._snapshot_log_timestamps = [log_entry.timestamp_millis for log_entry in snapshot_log]
 
         if not (len(self.snapshot_by_id) == 0 or self.current_snapshot_id in self.snapshot_by_id):
             raise RuntimeError("Invalid table metadata: Cannot find current version")
@@ -94,43 +103,77 @@ class TableMetadata(object):
         return int(self.properties.get(property_name, default_value))
 
     def current_snapshot(self):
-        return self.snapshot_by_id[self.current_snapshot_id]
+        return self.snapshot_by_id.get(self.current_snapshot_id)
 
     def snapshot(self, snapshot_id):
         return self.snapshot_by_id[snapshot_id]
 
+    @property
+    def ancestry(self):
+        with self._lock:
+            if self._ancestry is None:
+                self._ancestry = SnapshotAncestry(self.snapshots, self.current_snapshot_id)
+
+        return self._ancestry
+
+    def snapshot_id_as_of_time(self, timestamp_millis):
+        # the log is sorted by timestamp, so the last entry at or before the time is found by bisection
+        pos = bisect_right(self._snapshot_log_timestamps, timestamp_millis)
+        if pos == 0:
+            raise RuntimeError("Cannot find a snapshot older than %s" % timestamp_millis)
+
+        return self.snapshot_log[pos - 1].snapshot_id
+
+    def manifest_index(self, snapshot):
+        # metadata is immutable, so an index built for one of its snapshots stays valid for this version
+        with self._lock:
+            index = self._manifest_indexes.get(snapshot.snapshot_id)
+
+        if index is None:
+            # reading the manifest list can be slow, so the index is built outside of the lock and the
+            # first one published wins
+            index = ManifestPartitionIndex(snapshot.manifests, self.spec_id)
+            if snapshot.snapshot_id in self.snapshot_by_id:
+                with self._lock:
+                    index = self._manifest_indexes.setdefault(snapshot.snapshot_id, index)
+
+        return index
+
     def update_metadata_location(self, new_location):
         return TableMetadata(self.ops, None, new_location,
-                             int(time.time() * 1000), self.last_column_id, self.schema, self.spec, self.properties,
+                             int(time.time() * 1000), self.last_column_id, self.schema, self.default_spec_id, self.specs,
+                             self.properties,
                              self.current_snapshot_id, self.snapshots, self.snapshot_log)
 
     def update_schema(self, schema, last_column_id):
         PartitionSpec.check_compatibility(self.spec, schema)
         return TableMetadata(self.ops, None, self.location,
-                             int(time.time() * 1000), last_column_id, schema, self.spec, self.properties,
+                             int(time.time() * 1000), last_column_id, schema, self.default_spec_id, self.specs,
+                             self.properties,
                              self.current_snapshot_id, self.snapshots, self.snapshot_log)
 
     def add_snapshot(self, snapshot):
-        new_snapshots = self.snapshots + snapshot
+        new_snapshots = self.snapshots + [snapshot]
         new_snapshot_log = self.snapshot_log + [SnapshotLogEntry(snapshot.timestamp_millis, snapshot.snapshot_id)]
 
         return TableMetadata(self.ops, None, self.location,
-                             int(time.time() * 1000), self.last_column_id, self.schema, self.spec, self.properties,
-                             self.current_snapshot_id, new_snapshots, new_snapshot_log)
+                             int(time.time() * 1000), self.last_column_id, self.schema, self.default_spec_id, self.specs,
+                             self.properties,
+                             snapshot.snapshot_id, new_snapshots, new_snapshot_log)
 
     def add_staged_snapshot(self, snapshot):
-        self.snapshots.append(snapshot)
         return TableMetadata(self.ops, None, self.location, snapshot.timestamp_millis,
                              self.last_column_id, self.schema, self.default_spec_id, self.specs,
-                             self.current_snapshot_id, self.snapshots, self.snapshot_log)
+                             self.properties,
+                             self.current_snapshot_id, self.snapshots + [snapshot], self.snapshot_log)
 
     def replace_current_snapshot(self, snapshot):
-        self.snapshots.append(snapshot)
-        self.snapshot_log.append(SnapshotLogEntry(snapshot.timestamp_millis, snapshot.snapshot_id))
+        new_snapshot_log = self.snapshot_log + [SnapshotLogEntry(snapshot.timestamp_millis, snapshot.snapshot_id)]
 
         return TableMetadata(self.ops, None, self.location, snapshot.timestamp_millis,
                              self.last_column_id, self.schema, self.default_spec_id, self.specs,
-                             self.current_snapshot_id, self.snapshots, self.snapshot_log)
+                             self.properties,
+                             snapshot.snapshot_id, self.snapshots + [snapshot], new_snapshot_log)
 
     def remove_snapshots_if(self, remove_if):
         filtered = list()
@@ -148,25 +191,28 @@ class TableMetadata(object):
                 new_snapshot_log.clear()
 
         return TableMetadata(self.ops, None, self.location,
-                             int(time.time() * 1000), self.last_column_id, self.schema, self.spec, self.properties,
+                             int(time.time() * 1000), self.last_column_id, self.schema, self.default_spec_id, self.specs,
+                             self.properties,
                              self.current_snapshot_id, filtered, new_snapshot_log)
 
     def rollback_to(self, snapshot):
-        ValidationException.check(snapshot.snapshot_id not in self.snapshot_by_id,
+        ValidationException.check(snapshot.snapshot_id in self.snapshot_by_id,
                                   "Cannot set current snapshot to unknown: %s", (snapshot.snapshot_id,))
 
         now_millis = int(time.time() * 1000)
         new_snapshot_log = self.snapshot_log + [SnapshotLogEntry(now_millis, snapshot.snapshot_id)]
 
         return TableMetadata(self.ops, None, self.location,
-                             now_millis, self.last_column_id, self.schema, self.spec, self.properties,
+                             now_millis, self.last_column_id, self.schema, self.default_spec_id, self.specs,
+                             self.properties,
                              snapshot.snapshot_id, self.snapshots, new_snapshot_log)
 
     def replace_properties(self, new_properties):
-        ValidationException.check(new_properties is not None, "Cannot set properties to null")
+        ValidationException.check(new_properties is not None, "Cannot set properties to null", ())
 
         return TableMetadata(self.ops, None, self.location,
-                             int(time.time() * 1000), self.last_column_id, self.schema, self.spec, new_properties,
+                             int(time.time() * 1000), self.last_column_id, self.schema, self.default_spec_id, self.specs,
+                             new_properties,
                              self.current_snapshot_id, self.snapshots, self.snapshot_log)
 
     def remove_snapshot_log_entries(self, snapshot_ids):
@@ -181,7 +227,8 @@ class TableMetadata(object):
                                   "Cannot set invalid snapshot log: latest entry is not the current snapshot")
 
         return TableMetadata(self.ops, None, self.location,
-                             int(time.time() * 1000), self.last_column_id, self.schema, self.spec, self.properties,
+                             int(time.time() * 1000), self.last_column_id, self.schema, self.default_spec_id, self.specs,
+                             self.properties,
                              self.current_snapshot_id, self.snapshots, new_snapshot_log)
 
 
@@ -62,6 +62,10 @@ class TableProperties(object):
     SPLIT_OPEN_FILE_COST = "read.split.open-file-cost"
     SPLIT_OPEN_FILE_COST_DEFAULT = 4 * 1024 * 1024
 
+    PARQUET_DICTIONARY_COLUMNS = "read.parquet.dictionary-columns"
+
+    PARQUET_DICTIONARY_THRESHOLD = "read.parquet.dictionary-threshold"
+
     OBJECT_STORE_ENABLED = "write.object-storage.enabled"
     OBJECT_STORE_ENABLED_DEFAULT = False
 
@@ -0,0 +1,212 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import logging
+
+from iceberg.api.types import TypeID
+from iceberg.core.arrow import IcebergToArrow
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+_logger = logging.getLogger(__name__)
+
+
+class ParquetReader(object):
+    """
+    Reads a Parquet data file into an arrow Table with the expected Iceberg schema.
+
+    Columns are resolved by field id, so renamed columns are read from their original physical
+    column and only the column chunks needed by the projection are requested from the file.
+    Files written without field ids fall back to matching columns by name.
+
+    Top-level fields with a value in constants (such as identity partition values) are never read
+    from the file and are returned as run-end encoded arrays.
+
+    Top-level string and binary fields in dictionary_ids keep their Parquet dictionary encoding and
+    are returned as arrow dictionary arrays. When dictionary_threshold is set, every top-level
+    string or binary column is read that way and kept only if its number of distinct values is at
+    most that fraction of the rows read.
+
+    When limit is set, only the leading row groups needed to produce that many rows are read.
+    """
+
+    def __init__(self, input_file, expected_schema, start=None, length=None, constants=None,
+                 dictionary_ids=None, dictionary_threshold=None, limit=None):
+        self._input_file = input_file
+        self._expected_schema = expected_schema
+        self._start = start
+        self._length = length
+        self._constants = constants if constants is not None else dict()
+        self._dictionary_ids = set(dictionary_ids) if dictionary_ids is not None else set()
+        self._dictionary_threshold = dictionary_threshold
+        self._limit = limit
+
+    def read(self):
+        with self._input_file.new_fo() as fo:
+            parquet_file = pq.ParquetFile(fo)
+            file_schema = parquet_file.schema_arrow
+            dictionary_columns = self.dictionary_columns(file_schema)
+            if len(dictionary_columns) > 0:
+                parquet_file = pq.ParquetFile(fo, metadata=parquet_file.metadata, read_dictionary=dictionary_columns)
+
+            columns = ParquetReader.column_paths([field for field in self._expected_schema.as_struct().fields
+                                                  if field.field_id not in self._constants],
+                                                 ParquetReader.index_fields(file_schema))
+            _logger.debug("Reading columns %s from %s" % (columns, self._input_file.location()))
+
+            row_groups = self.limit_row_groups(parquet_file.metadata, self.row_groups(parquet_file.metadata))
+            num_rows = sum(parquet_file.metadata.row_group(i).num_rows for i in row_groups)
+            table = parquet_file.read_row_groups(row_groups, columns=columns)
+
+        return self.project(table, ParquetReader.index_fields(file_schema), num_rows)
+
+    def dictionary_columns(self, file_schema):
+        if len(self._dictionary_ids) == 0 and self._dictionary_threshold is None:
+            return list()
+
+        file_index = ParquetReader.index_fields(file_schema)
+        columns = list()
+        for expected in self._expected_schema.as_struct().fields:
+            file_field = ParquetReader.find_field(file_index, expected)
+            if file_field is None or expected.field_id in self._constants \
+                    or expected.type.type_id not in (TypeID.STRING, TypeID.BINARY):
+                continue
+
+            if expected.field_id in self._dictionary_ids or self._dictionary_threshold is not None:
+                columns.append(file_field.name)
+
+        return columns
+
+    def row_groups(self, metadata):
+        if self._start is None or self._length is None:
+            return list(range(metadata.num_row_groups))
+
+        end = self._start + self._length
+        return [i for i in range(metadata.num_row_groups)
+                if self._start <= ParquetReader.row_group_offset(metadata.row_group(i)) < end]
+
+    def limit_row_groups(self, metadata, row_groups):
+        if self._limit is None:
+            return row_groups
+
+        selected = list()
+        num_rows = 0
+        for i in row_groups:
+            if num_rows >= self._limit:
+                break
+            selected.append(i)
+            num_rows += metadata.row_group(i).num_rows
+
+        return selected
+
+    def project(self, table, file_index, num_rows):
+        arrays = list()
+        fields = list()
+        for expected in self._expected_schema.as_struct().fields:
+            arrow_type = IcebergToArrow.type_to_arrow(expected.type)
+            file_field = ParquetReader.find_field(file_index, expected)
+
+            if expected.field_id in self._constants:
+                arrays.append(pa.chunked_array([IcebergToArrow.constant_array(self._constants[expected.field_id],
+                                                                              arrow_type, num_rows)]))
+            elif file_field is None or file_field.name not in table.column_names:
+                arrays.append(pa.chunked_array([pa.nulls(num_rows, type=arrow_type)], type=arrow_type))
+            else:
+                arrays.append(self.project_column(table.column(file_field.name), expected, arrow_type))
+
+            fields.append(IcebergToArrow.field_to_arrow(expected).with_type(arrays[-1].type))
+
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    def project_column(self, column, expected, arrow_type):
+        if pa.types.is_dictionary(column.type) and column.type.value_type == arrow_type:
+            if expected.field_id in self._dictionary_ids or self.below_threshold(column):
+                return column
+            column = pa.chunked_array([chunk.dictionary_decode() for chunk in column.chunks], type=arrow_type)
+
+        return pa.chunked_array([ParquetReader.project_array(chunk, expected) for chunk in column.chunks],
+                                type=arrow_type)
+
+    def below_threshold(self, column):
+        if self._dictionary_threshold is None:
+            return False
+
+        distinct = max([len(chunk.dictionary) for chunk in column.chunks] or [0])
+        return distinct <= self._dictionary_threshold * len(column)
+
+    @staticmethod
+    def project_array(array, expected):
+        arrow_type = IcebergToArrow.type_to_arrow(expected.type)
+        if expected.type.type_id != TypeID.STRUCT or not pa.types.is_struct(array.type):
+            return array if array.type == arrow_type else array.cast(arrow_type)
+
+        file_index = ParquetReader.index_fields(list(array.type))
+        file_children = array.flatten()
+        children = list()
+        for child in expected.type.fields:
+            file_child = ParquetReader.find_field(file_index, child)
+            if file_child is None:
+                children.append(pa.nulls(len(array), type=IcebergToArrow.type_to_arrow(child.type)))
+            else:
+                child_array = file_children[array.type.get_field_index(file_child.name)]
+                children.append(ParquetReader.project_array(child_array, child))
+
+        return pa.StructArray.from_arrays(children, fields=list(arrow_type), mask=array.is_null())
+
+    @staticmethod
+    def column_paths(expected_fields, file_index, prefix=""):
+        paths = list()
+        for expected in expected_fields:
+            file_field = ParquetReader.find_field(file_index, expected)
+            if file_field is None:
+                continue
+
+            path = prefix + file_field.name
+            if expected.type.type_id == TypeID.STRUCT and pa.types.is_struct(file_field.type):
+                paths.extend(ParquetReader.column_paths(expected.type.fields,
+                                                        ParquetReader.index_fields(list(file_field.type)),
+                                                        path + "."))
+            else:
+                paths.append(path)
+
+        return paths
+
+    @staticmethod
+    def index_fields(file_fields):
+        by_id = dict()
+        for file_field in file_fields:
+            field_id = IcebergToArrow.field_id(file_field)
+            if field_id is not None:
+                by_id[field_id] = file_field
+
+        return by_id, {file_field.name: file_field for file_field in file_fields}
+
+    @staticmethod
+    def find_field(index, expected):
+        by_id, by_name = index
+        if len(by_id) > 0:
+            return by_id.get(expected.field_id)
+
+        return by_name.get(expected.name)
+
+    @staticmethod
+    def row_group_offset(row_group):
+        first_column = row_group.column(0)
+        if first_column.has_dictionary_page and first_column.dictionary_page_offset is not None:
+            return min(first_column.dictionary_page_offset, first_column.data_page_offset)
+
+        return first_column.data_page_offset
@@ -227,6 +227,21 @@ def strict_file():
                         )
 
 
+@pytest.fixture(scope="session")
+def string_file():
+    return MockDataFile("file.avro", TestHelpers.Row.of(), 50,
+                        # value counts
+                        {5: 50, 6: 50},
+                        # null value counts
+                        {5: 10, 6: 0},
+                        # lower bounds
+                        {5: Conversions.to_byte_buffer(StringType.get(), "apple"),
+                         6: Conversions.to_byte_buffer(StringType.get(), "apple")},
+                        # upper bounds
+                        {5: Conversions.to_byte_buffer(StringType.get(), "apricot"),
+                         6: Conversions.to_byte_buffer(StringType.get(), "apricot")})
+
+
 @pytest.fixture(scope="session")
 def missing_stats():
     return MockDataFile("file.parquet", TestHelpers.Row.of(), 50)
@@ -146,3 +146,32 @@ def test_char_seq_value(row_of):
     evaluator = exp.evaluator.Evaluator(struct, exp.expressions.Expressions.equal("s", "abc"))
     assert evaluator.eval(row_of(("abc",)))
     assert not evaluator.eval(row_of(("abcd",)))
+
+
+def test_in(row_of):
+    evaluator = exp.evaluator.Evaluator(STRUCT, exp.expressions.Expressions.in_("x", [7, 8, 9]))
+    assert evaluator.eval(row_of((7, 8, None)))
+    assert not evaluator.eval(row_of((6, 8, None)))
+
+    evaluator = exp.evaluator.Evaluator(STRUCT, exp.expressions.Expressions.in_("z", [7, 8, 9]))
+    assert not evaluator.eval(row_of((7, 8, None)))
+
+
+def test_not_in(row_of):
+    evaluator = exp.evaluator.Evaluator(STRUCT, exp.expressions.Expressions.not_in("x", [7, 8, 9]))
+    assert not evaluator.eval(row_of((7, 8, None)))
+    assert evaluator.eval(row_of((6, 8, None)))
+
+    evaluator = exp.evaluator.Evaluator(STRUCT,
+                                        exp.expressions.Expressions.not_(exp.expressions.Expressions.in_("x", [7, 8])))
+    assert evaluator.eval(row_of((6, 8, None)))
+
+
+def test_starts_with(row_of):
+    struct = StructType.of([NestedField.optional(34, "s", StringType.get())])
+    evaluator = exp.evaluator.Evaluator(struct, exp.expressions.Expressions.starts_with("s", "ab"))
+    assert evaluator.eval(row_of(("abc",)))
+    assert evaluator.eval(row_of(("ab",)))
+    assert not evaluator.eval(row_of(("a",)))
+    assert not evaluator.eval(row_of(("xabc",)))
+    assert not evaluator.eval(row_of((None,)))
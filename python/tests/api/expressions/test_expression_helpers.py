@@ -15,7 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from decimal import Decimal
+
 from iceberg.api.expressions.expressions import Expressions
+from iceberg.api.types import DecimalType, IntegerType, NestedField, StructType
 from pytest import raises
 
 pred = Expressions.less_than("x", 7)
@@ -45,3 +48,52 @@ def test_simplify_not():
 def test_null_name():
     with raises(RuntimeError):
         Expressions.equal(None, 5)
+
+
+def test_equal_expressions_hash_equal():
+    expr = Expressions.and_(Expressions.not_(Expressions.equal("x", 5)), Expressions.in_("y", ["a", "b"]))
+    same = Expressions.and_(Expressions.not_(Expressions.equal("x", 5)), Expressions.in_("y", ["b", "a"]))
+
+    assert hash(expr) == hash(same)
+    assert {expr: True}[same]
+    assert len({Expressions.always_true(), Expressions.always_true(), Expressions.always_false()}) == 2
+
+
+def test_negate_constants():
+    assert Expressions.always_true().negate() == Expressions.always_false()
+    assert Expressions.always_false().negate() == Expressions.always_true()
+
+
+def test_expressions_are_interned():
+    assert Expressions.less_than("x", 7) is pred
+    assert Expressions.and_(pred, Expressions.equal("y", 1)) is Expressions.and_(pred, Expressions.equal("y", 1))
+    assert Expressions.rewrite_not(Expressions.not_(pred)) is Expressions.greater_than_or_equal("x", 7)
+
+    # equal literals of different types are kept apart
+    assert Expressions.less_than("x", 7.0) is not pred
+    assert Expressions.in_("x", [1.0, 2.0]) is not Expressions.in_("x", [1, 2])
+    assert Expressions.in_("x", [True, False]) is not Expressions.in_("x", [1, 0])
+    assert Expressions.equal("d", Decimal("1.0")) is not Expressions.equal("d", Decimal("1.00"))
+    assert Expressions.in_("x", [1, 2]) is Expressions.in_("x", [2, 1])
+
+
+def test_interned_literals_bind_to_their_type():
+    struct = StructType.of([NestedField.required(1, "x", IntegerType.get()),
+                            NestedField.required(2, "d", DecimalType.of(9, 2))])
+
+    # keep the first predicates alive so they stay interned
+    floats = Expressions.in_("x", [1.0, 2.0])
+    assert Expressions.in_("x", [1, 2]).bind(struct).lit.value == {1, 2}
+
+    decimal = Expressions.equal("d", Decimal("1.0"))
+    assert Expressions.equal("d", Decimal("1.00")).bind(struct).lit.value == Decimal("1.00")
+    assert floats.lit.value == {1.0, 2.0}
+    assert decimal.lit.value.as_tuple().exponent == -1
+
+
+def test_expressions_are_immutable():
+    expr = Expressions.and_(pred, Expressions.equal("y", 1))
+    with raises(AttributeError):
+        expr.left = Expressions.equal("y", 2)
+    with raises(AttributeError):
+        pred.lit = None
@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api.expressions import (Binder,
+                                     Evaluator,
+                                     Expressions,
+                                     Literal,
+                                     Operation)
+from iceberg.api.types import IntegerType, NestedField, StructType, TimestampType
+
+STRUCT = StructType.of([NestedField.required(1, "x", IntegerType.get()),
+                        NestedField.optional(2, "y", IntegerType.get())])
+
+
+def bind(expr):
+    return Binder.bind(STRUCT, expr)
+
+
+def normalize(expr):
+    return Expressions.normalize(expr, STRUCT)
+
+
+def values(pred):
+    return sorted(lit.value for lit in pred.lit.literals)
+
+
+def test_constant_folding():
+    expr = Expressions.or_(Expressions.and_(Expressions.less_than("x", 5), Expressions.always_false()),
+                           Expressions.not_(Expressions.not_(Expressions.equal("y", 1))))
+
+    assert Expressions.normalize(expr) == Expressions.equal("y", 1)
+    assert Expressions.normalize(Expressions.not_(Expressions.always_true())) == Expressions.always_false()
+
+
+def test_dedupe_terms():
+    pred = Expressions.equal("y", 1)
+    expr = Expressions.and_(Expressions.and_(pred, Expressions.is_null("x")), Expressions.and_(pred, Expressions.is_null("x")))
+
+    assert Expressions.normalize(expr) == Expressions.and_(pred, Expressions.is_null("x"))
+
+
+def test_and_tightest_bounds():
+    expr = Expressions.and_(Expressions.and_(Expressions.greater_than("x", 3), Expressions.greater_than_or_equal("x", 5)),
+                            Expressions.and_(Expressions.less_than("x", 10), Expressions.less_than_or_equal("x", 10)))
+
+    assert normalize(expr) == bind(Expressions.and_(Expressions.greater_than_or_equal("x", 5),
+                                                    Expressions.less_than("x", 10)))
+
+
+def test_and_collapsed_range():
+    expr = Expressions.and_(Expressions.greater_than_or_equal("x", 5), Expressions.less_than_or_equal("x", 5))
+    assert normalize(expr) == bind(Expressions.equal("x", 5))
+
+    expr = Expressions.and_(Expressions.greater_than("x", 5), Expressions.less_than_or_equal("x", 5))
+    assert normalize(expr) == Expressions.always_false()
+
+    expr = Expressions.and_(Expressions.greater_than("x", 7), Expressions.less_than("x", 3))
+    assert normalize(expr) == Expressions.always_false()
+
+
+def test_and_equality_with_bounds():
+    expr = Expressions.and_(Expressions.equal("x", 5), Expressions.greater_than("x", 3))
+    assert normalize(expr) == bind(Expressions.equal("x", 5))
+
+    expr = Expressions.and_(Expressions.equal("x", 5), Expressions.equal("x", 6))
+    assert normalize(expr) == Expressions.always_false()
+
+    expr = Expressions.and_(Expressions.in_("x", [1, 4, 7, 9]), Expressions.less_than("x", 8))
+    result = normalize(expr)
+    assert result.op == Operation.IN
+    assert values(result) == [1, 4, 7]
+
+
+def test_and_null_conflict():
+    expr = Expressions.and_(Expressions.is_null("y"), Expressions.not_null("y"))
+    assert normalize(expr) == Expressions.always_false()
+
+
+def test_or_equalities_to_in():
+    expr = Expressions.or_(Expressions.or_(Expressions.equal("x", 1), Expressions.equal("x", 2)),
+                           Expressions.or_(Expressions.equal("y", 3), Expressions.equal("x", 3)))
+    result = normalize(expr)
+
+    assert result.left.op == Operation.IN
+    assert values(result.left) == [1, 2, 3]
+    assert result.right == bind(Expressions.equal("y", 3))
+
+
+def test_or_loosest_bounds():
+    expr = Expressions.or_(Expressions.or_(Expressions.less_than("x", 3), Expressions.less_than_or_equal("x", 3)),
+                           Expressions.or_(Expressions.equal("x", 2), Expressions.equal("x", 8)))
+    assert normalize(expr) == bind(Expressions.or_(Expressions.equal("x", 8), Expressions.less_than_or_equal("x", 3)))
+
+    expr = Expressions.or_(Expressions.is_null("y"), Expressions.not_null("y"))
+    assert normalize(expr) == Expressions.always_true()
+
+
+def test_normalize_bound_expression():
+    expr = Binder.bind(STRUCT, Expressions.or_(Expressions.equal("x", 1), Expressions.equal("x", 2)))
+    result = Expressions.normalize(expr)
+
+    assert result.op == Operation.IN
+    assert result.ref.field_id == 1
+    assert values(result) == [1, 2]
+
+
+def test_in_predicate():
+    assert Expressions.in_("x", []) == Expressions.always_false()
+    assert Expressions.not_in("x", []) == Expressions.always_true()
+    assert Expressions.in_("x", [4]) == Expressions.equal("x", 4)
+
+    bound = Expressions.in_("x", [1, 2, 3]).bind(STRUCT)
+    assert bound.op == Operation.IN
+    assert values(bound) == [1, 2, 3]
+
+    bound = Expressions.not_in("x", [1, 2]).bind(STRUCT)
+    assert bound.op == Operation.NOT_IN
+    assert bound.negate().op == Operation.IN
+
+
+def test_unbound_bounds_are_not_merged(row_of):
+    # the strings sort the other way around from the timestamps they hold
+    struct = StructType.of([NestedField.required(1, "ts", TimestampType.with_timezone())])
+    expr = Expressions.and_(Expressions.greater_than_or_equal("ts", "2020-01-01T00:00:00-05:00"),
+                            Expressions.greater_than_or_equal("ts", "2020-01-01T01:00:00+00:00"))
+
+    assert Expressions.normalize(expr) == expr
+    assert Expressions.normalize(expr, struct) == \
+        Binder.bind(struct, Expressions.greater_than_or_equal("ts", "2020-01-01T00:00:00-05:00"))
+
+    # a row at 02:00 UTC is before 05:00 UTC, so it does not match
+    row = row_of((Literal.of("2020-01-01T02:00:00+00:00").to(TimestampType.with_timezone()).value,))
+    assert not Evaluator(struct, expr).eval(row)
+    assert not Evaluator(struct, Expressions.normalize(expr)).eval(row)
+
+
+def test_normalize_filter_is_unbound():
+    expr = Expressions.and_(Expressions.greater_than("X", 5), Expressions.greater_than("x", 3))
+    result = Expressions.normalize_filter(expr, STRUCT, case_sensitive=False)
+
+    assert result == Expressions.greater_than("x", 5)
+    assert Expressions.normalize_filter(Expressions.in_("y", [1, 2]), STRUCT) == Expressions.in_("y", [1, 2])
+    assert Expressions.normalize_filter(Expressions.is_null("x"), STRUCT) == Expressions.always_false()
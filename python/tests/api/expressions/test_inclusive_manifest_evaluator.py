@@ -180,3 +180,32 @@ def test_case_sensitive_int_not_eq_rewritten(inc_man_spec, inc_man_file, val, ex
         InclusiveManifestEvaluator(inc_man_spec,
                                    Expressions.not_(Expressions.equal("ID", val)),
                                    case_sensitive=True).eval(inc_man_file) == expected
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([5, 25, 80, 100], False),
+    ([5, 30], True),
+    ([50, 100], True),
+    ([79, 85], True)])
+def test_int_in(inc_man_spec, inc_man_file, values, expected):
+    assert InclusiveManifestEvaluator(inc_man_spec, Expressions.in_("id", values)).eval(inc_man_file) == expected
+
+
+@pytest.mark.parametrize("values", [
+    [5, 25],
+    [30, 50, 79]])
+def test_int_not_in(inc_man_spec, inc_man_file, values):
+    assert InclusiveManifestEvaluator(inc_man_spec, Expressions.not_in("id", values)).eval(inc_man_file)
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("a", True),
+    ("m", True),
+    ("z", True),
+    ("za", False),
+    ("", True),
+    ("0", False),
+    ("{", False)])
+def test_string_starts_with(inc_man_spec, inc_man_file, prefix, expected):
+    assert InclusiveManifestEvaluator(inc_man_spec,
+                                      Expressions.starts_with("some_nulls", prefix)).eval(inc_man_file) == expected
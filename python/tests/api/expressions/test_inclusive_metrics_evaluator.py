@@ -128,3 +128,34 @@ def test_case_sensitive_int_not_eq_rewritten(schema, file, not_eq_uc):
     with raises(ValidationException):
         assert InclusiveMetricsEvaluator(schema, Expressions.not_(not_eq_uc),
                                          case_sensitive=True).eval(file)
+
+
+def test_integer_in(schema, file):
+    # Should skip: all values are outside of the bounds [30, 79]
+    assert not InclusiveMetricsEvaluator(schema, Expressions.in_("id", [5, 25, 80, 100])).eval(file)
+    # Should read: one value falls between the bounds
+    assert InclusiveMetricsEvaluator(schema, Expressions.in_("id", [5, 50, 100])).eval(file)
+    assert InclusiveMetricsEvaluator(schema, Expressions.in_("id", [29, 30])).eval(file)
+    assert InclusiveMetricsEvaluator(schema, Expressions.in_("id", [79, 80])).eval(file)
+    # Should read: no stats
+    assert InclusiveMetricsEvaluator(schema, Expressions.in_("no_stats", [1, 2])).eval(file)
+
+
+def test_integer_not_in(schema, file):
+    # Should read: the bounds do not prove every value is in the set
+    assert InclusiveMetricsEvaluator(schema, Expressions.not_in("id", [30, 79])).eval(file)
+    assert InclusiveMetricsEvaluator(schema, Expressions.not_(Expressions.in_("id", [5, 50]))).eval(file)
+
+
+def test_string_starts_with(schema, string_file):
+    # Should read: the prefix of the bounds [apple, apricot] or a prefix of it
+    assert InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "ap")).eval(string_file)
+    assert InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "appl")).eval(string_file)
+    assert InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "apr")).eval(string_file)
+    assert InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "a")).eval(string_file)
+    # Should skip: every value is above or below the prefix
+    assert not InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "aa")).eval(string_file)
+    assert not InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "aq")).eval(string_file)
+    assert not InclusiveMetricsEvaluator(schema, Expressions.starts_with("no_nulls", "b")).eval(string_file)
+    # Should read: no stats
+    assert InclusiveMetricsEvaluator(schema, Expressions.starts_with("required", "b")).eval(string_file)
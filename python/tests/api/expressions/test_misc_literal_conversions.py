@@ -19,7 +19,8 @@ from decimal import Decimal
 import sys
 import uuid
 
-from iceberg.api.expressions import Literal
+from iceberg.api.expressions import Literal, Literals
+from iceberg.api.expressions.literals import TimestampLiteral
 from iceberg.api.types import (BinaryType,
                                BooleanType,
                                DateType,
@@ -261,3 +262,30 @@ def test_invalid_binary_conversions():
 def assert_invalid_conversions(lit, types=None):
     for type_var in types:
         assert lit.to(type_var) is None
+
+
+def test_from_interns_equal_values():
+    assert Literals.from_(34) is Literals.from_(34)
+    assert Literals.from_("abc") is Literals.from_("abc")
+    assert Literals.from_(True) is not Literals.from_(1)
+    assert Literals.from_(1.0) is not Literals.from_(1)
+    assert Literals.from_(Decimal("1.0")) is not Literals.from_(Decimal("1.00"))
+    assert Literals.from_(bytearray(b"ab")) is not Literals.from_(bytearray(b"ab"))
+
+
+def test_conversion_cache():
+    assert Literal.of("2017-08-18").to(DateType.get()) is Literal.of("2017-08-18").to(DateType.get())
+
+    # equal values of different literal classes or scales convert differently
+    assert Literal.of(5).to(DateType.get()).value == 5
+    assert Literal.of(5.0).to(DateType.get()) is None
+    assert Literal.of(Decimal("1.0")).to(DecimalType.of(9, 1)) is not None
+    assert Literal.of(Decimal("1.00")).to(DecimalType.of(9, 1)) is None
+    assert Literal.of("2017-08-18T14:21:01").to(TimestampType.without_timezone()) is not None
+    with pytest.raises(RuntimeError):
+        Literal.of("2017-08-18T14:21:01").to(TimestampType.with_timezone())
+
+
+@pytest.mark.parametrize("micros,expected", [(0, 0), (-1, -1), (86400000000, 1), (-86400000000, -1)])
+def test_timestamp_to_date(micros, expected):
+    assert TimestampLiteral(micros).to(DateType.get()).value == expected
@@ -28,6 +28,7 @@ from iceberg.api.types import (DecimalType,
                                StringType,
                                StructType)
 from iceberg.exceptions import ValidationException
+import pytest
 
 
 def test_multiple_fields(assert_and_unwrap):
@@ -197,3 +198,15 @@ def test_not_null(assert_and_unwrap):
 
     required = StructType.of([NestedField.required(22, "s", StringType.get())])
     assert Expressions.always_true() == unbound.bind(required)
+
+
+def test_starts_with(assert_and_unwrap):
+    struct = StructType.of([NestedField.required(23, "s", StringType.get()),
+                            NestedField.required(24, "i", IntegerType.get())])
+    bound = assert_and_unwrap(Expressions.starts_with("s", "ab").bind(struct))
+    assert Operation.STARTS_WITH == bound.op
+    assert 23 == bound.ref.field_id
+    assert "ab" == bound.lit.value
+
+    with pytest.raises(ValidationException):
+        Expressions.starts_with("i", "1").bind(struct)
@@ -0,0 +1,50 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api import PartitionSpec, Schema
+from iceberg.api.expressions import (Expressions,
+                                     ResidualEvaluator)
+from iceberg.api.types import (IntegerType,
+                               NestedField,
+                               StringType)
+import pytest
+
+from ..test_helpers import TestHelpers
+
+
+@pytest.fixture(scope="module")
+def residual_spec():
+    schema = Schema(NestedField.required(1, "id", IntegerType.get()),
+                    NestedField.optional(2, "category", StringType.get()))
+    return PartitionSpec.builder_for(schema).identity("category").build()
+
+
+def test_identity_partition_residuals(residual_spec):
+    evaluator = ResidualEvaluator(residual_spec, Expressions.equal("category", "a"))
+
+    assert evaluator.residual_for(TestHelpers.Row.of(["a"])) == Expressions.always_true()
+    assert evaluator.residual_for(TestHelpers.Row.of(["b"])) == Expressions.always_false()
+    assert evaluator.residual_for(TestHelpers.Row.of([None])) == Expressions.always_false()
+
+
+def test_unpartitioned_column_residuals(residual_spec):
+    expr = Expressions.and_(Expressions.equal("category", "a"), Expressions.less_than("id", 5))
+    evaluator = ResidualEvaluator(residual_spec, expr)
+
+    residual = evaluator.residual_for(TestHelpers.Row.of(["a"]))
+    assert str(residual) == str(Expressions.less_than("id", 5))
+    assert evaluator.residual_for(TestHelpers.Row.of(["b"])) == Expressions.always_false()
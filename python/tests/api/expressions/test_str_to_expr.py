@@ -14,6 +14,11 @@
 # limitations under the License.
 
 from iceberg.api.expressions import Expressions
+from iceberg.api.expressions.expression_parser import (ExpressionStringParser,
+                                                       get_expr_tree,
+                                                       whereExpression)
+from pyparsing import ParseException
+import pytest
 
 
 def test_equal():
@@ -159,3 +164,52 @@ def test_complex_expansion():
                                     Expressions.is_null("d"))
     conv_expr = Expressions.convert_string_to_expr("(a=1 and b=2 and c<>3) or d is null")
     assert expected_expr == conv_expr
+
+
+def test_float():
+    expected_expr = Expressions.greater_than("col_a", -1.5)
+    conv_expr = Expressions.convert_string_to_expr("col_a > -1.5")
+    assert expected_expr == conv_expr
+
+
+def test_word_operators():
+    expected_expr = Expressions.and_(Expressions.not_equal("col_a", 1), Expressions.less_than_or_equal("col_b", 2))
+    conv_expr = Expressions.convert_string_to_expr("col_a ne 1 and col_b le 2")
+    assert expected_expr == conv_expr
+
+
+def test_parsed_expressions_are_cached():
+    assert Expressions.convert_string_to_expr("col_a=1 and col_b=2") is \
+        Expressions.convert_string_to_expr("col_a=1 and col_b=2")
+
+
+def test_parse_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(Expressions._parsed, "max_size", 1)
+    Expressions.convert_string_to_expr("col_a=1")
+    Expressions.convert_string_to_expr("col_a=2")
+    assert len(Expressions._parsed) == 1
+
+    Expressions.clear_cache()
+    assert len(Expressions._parsed) == 0
+
+
+@pytest.mark.parametrize("predicate_string", [
+    "a = 'x y'",
+    "a = b.c",
+    "not a=1 and b=2",
+    "((a=1))",
+    "a in (1, 2, 'x')",
+    "A IS NOT NULL",
+    "a=1 AND b=2 OR c=3 and d=4",
+    "a between 1 and 2 and b=3",
+    "a=1 or (b=2 and (c=3 or d=4))",
+    "x.y.z lt 4 or x.y.z ge .5"])
+def test_matches_pyparsing_grammar(predicate_string):
+    expected = get_expr_tree(whereExpression.parseString(predicate_string, parseAll=True))
+    assert ExpressionStringParser(predicate_string).parse() == expected
+
+
+@pytest.mark.parametrize("predicate_string", ["", "a=1 and", "(a=1", "a=1)", "not not a", "a EQ 1", "a in ()"])
+def test_invalid_strings(predicate_string):
+    with pytest.raises(ParseException):
+        Expressions.convert_string_to_expr(predicate_string)
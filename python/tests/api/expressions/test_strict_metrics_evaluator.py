@@ -157,3 +157,34 @@ def test_not_eq_rewritten(strict_schema, strict_file):
     assert not StrictMetricsEvaluator(strict_schema, Expressions.not_(Expressions.equal("id", 79))).eval(strict_file)
     assert StrictMetricsEvaluator(strict_schema, Expressions.not_(Expressions.equal("id", 80))).eval(strict_file)
     assert StrictMetricsEvaluator(strict_schema, Expressions.not_(Expressions.equal("id", 85))).eval(strict_file)
+
+
+def test_case_insensitive_not_eq_rewritten(strict_schema, strict_file):
+    assert StrictMetricsEvaluator(strict_schema, Expressions.not_(Expressions.equal("ID", 5)),
+                                  case_sensitive=False).eval(strict_file)
+
+    with raises(ValidationException):
+        StrictMetricsEvaluator(strict_schema, Expressions.not_(Expressions.equal("ID", 5))).eval(strict_file)
+
+
+def test_integer_in(strict_schema, strict_file):
+    assert StrictMetricsEvaluator(strict_schema, Expressions.in_("always_5", [1, 5, 9])).eval(strict_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.in_("always_5", [1, 9])).eval(strict_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.in_("id", [30, 79])).eval(strict_file)
+
+
+def test_integer_not_in(strict_schema, strict_file):
+    assert StrictMetricsEvaluator(strict_schema, Expressions.not_in("id", [5, 29, 80, 85])).eval(strict_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.not_in("id", [5, 30])).eval(strict_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.not_in("id", [50, 85])).eval(strict_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.not_in("always_5", [4, 5])).eval(strict_file)
+
+
+def test_string_starts_with(strict_schema, string_file):
+    # Should match: both bounds of [apple, apricot] start with the prefix
+    assert StrictMetricsEvaluator(strict_schema, Expressions.starts_with("no_nulls", "ap")).eval(string_file)
+    assert StrictMetricsEvaluator(strict_schema, Expressions.starts_with("no_nulls", "")).eval(string_file)
+    # Should not match: one bound does not start with the prefix, or there are nulls
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.starts_with("no_nulls", "app")).eval(string_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.starts_with("some_nulls", "ap")).eval(string_file)
+    assert not StrictMetricsEvaluator(strict_schema, Expressions.starts_with("required", "ap")).eval(string_file)
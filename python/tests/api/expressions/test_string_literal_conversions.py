@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 import uuid
 
@@ -28,7 +28,9 @@ from iceberg.api.types import (DateType,
                                TimestampType,
                                TimeType,
                                UUIDType)
+import pytest
 from pytest import raises
+import pytz
 
 
 def test_string_to_string_literal():
@@ -100,3 +102,34 @@ def test_string_to_decimal_literal():
 
     assert decimal_str.to(DecimalType.of(9, 2)) is None
     assert decimal_str.to(DecimalType.of(9, 4)) is None
+
+
+@pytest.mark.parametrize("value", [
+    "2017-08-18T14:21:01.919194",
+    "2017-08-18 14:21:01",
+    "2017-08-18T14:21",
+    "1969-12-31T23:59:59.999999",
+    "1900-02-28T01:02:03.5"])
+def test_iso_timestamps_match_dateutil(value):
+    expected = (dateutil.parser.parse(value) - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+    assert expected == Literal.of(value).to(TimestampType.without_timezone()).value
+
+
+@pytest.mark.parametrize("value", [
+    "2017-08-18T14:21:01.919194Z",
+    "2017-08-18T14:21:01+05:30",
+    "2017-08-18T14:21:01.1-0800",
+    "1969-12-31T23:59:59-03"])
+def test_iso_timestamps_with_zone_match_dateutil(value):
+    expected = (dateutil.parser.parse(value) - datetime(1970, 1, 1, tzinfo=pytz.UTC)) // timedelta(microseconds=1)
+    assert expected == Literal.of(value).to(TimestampType.with_timezone()).value
+
+
+@pytest.mark.parametrize("value", ["1969-12-31", "1900-03-01", "2017-08-18", "Aug 18 2017"])
+def test_dates_match_dateutil(value):
+    assert (dateutil.parser.parse(value) - datetime(1970, 1, 1)).days == Literal.of(value).to(DateType.get()).value
+
+
+def test_invalid_iso_date():
+    with raises(ValueError):
+        Literal.of("2017-02-30").to(DateType.get())
@@ -15,18 +15,30 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import datetime
 from decimal import Decimal, getcontext
+import uuid
 
-from iceberg.api.expressions import Literal
+from iceberg.api.expressions import (Expressions,
+                                     Literal,
+                                     Operation)
 from iceberg.api.transforms import (Bucket,
                                     BucketDouble,
                                     BucketFloat)
-from iceberg.api.types import (DateType,
+from iceberg.api.types import (BinaryType,
+                               DateType,
                                DecimalType,
+                               FixedType,
                                IntegerType,
                                LongType,
+                               NestedField,
+                               StringType,
+                               StructType,
                                TimestampType,
-                               TimeType)
+                               TimeType,
+                               UUIDType)
+import numpy as np
+import pyarrow as pa
 import pytest
 
 
@@ -62,3 +74,59 @@ def test_spec_values_dec(test_input, test_type, scale_factor, expected):
      TimestampType.with_timezone(), -2047944441)])
 def test_spec_values_datetime_uuid(test_input, test_type, expected):
     assert Bucket.get(test_type, 100).hash(test_input.value) == expected
+
+
+def test_project_in():
+    struct = StructType.of([NestedField.required(1, "id", IntegerType.get())])
+    bucket = Bucket.get(IntegerType.get(), 16)
+
+    projected = bucket.project("id_bucket", Expressions.in_("id", [1, 34, 100]).bind(struct))
+    assert projected.op == Operation.IN
+    assert projected.lit.value == {bucket.apply(1), bucket.apply(34), bucket.apply(100)}
+    assert bucket.project_strict("id_bucket", Expressions.in_("id", [1, 34]).bind(struct)) is None
+
+    projected = bucket.project_strict("id_bucket", Expressions.not_in("id", [1, 34]).bind(struct))
+    assert projected.op == Operation.NOT_IN
+    assert projected.lit.value == {bucket.apply(1), bucket.apply(34)}
+
+
+@pytest.mark.parametrize("test_input,test_type,expected", [
+    (uuid.UUID("f79c3e09-677c-4bbd-a479-3f349cb785e7"), UUIDType.get(), 1488055340),
+    (b"\x00\x01\x02\x03", BinaryType.get(), -188683207),
+    (bytearray(b"\x00\x01\x02\x03"), FixedType.of_length(4), -188683207)])
+def test_spec_values_binary_uuid(test_input, test_type, expected):
+    assert Bucket.get(test_type, 100).hash(test_input) == expected
+
+
+@pytest.mark.parametrize("test_type,values", [
+    (IntegerType.get(), np.array([0, 1, -1, 34, 2 ** 31 - 1, -2 ** 31], dtype=np.int32)),
+    (LongType.get(), np.array([0, 1, -1, 34, 2 ** 63 - 1, -2 ** 63], dtype=np.int64)),
+    (StringType.get(), np.array(["", "iceberg", "\u00e9t\u00e9"], dtype=object))])
+def test_apply_batch_matches_apply(test_type, values):
+    bucket = Bucket.get(test_type, 100)
+    assert bucket.apply_batch(values).tolist() == [bucket.apply(value) for value in values.tolist()]
+
+
+def test_apply_batch_floating():
+    values = np.array([0.0, -0.0, 1.5, -34.25, float("inf")])
+    assert BucketDouble(16).apply_batch(values).tolist() == [BucketDouble(16).apply(value) for value in values]
+    assert BucketFloat(16).apply_batch(values.astype(np.float32)).tolist() == \
+        [BucketFloat(16).apply(value) for value in values]
+
+
+def test_apply_batch_arrow():
+    bucket = Bucket.get(DateType.get(), 100)
+    dates = pa.chunked_array([pa.array([datetime.date(2017, 11, 16), None])])
+    assert bucket.apply_batch(dates).to_pylist() == [bucket.apply(Literal.of("2017-11-16").to(DateType.get()).value), None]
+
+    bucket = Bucket.get(TimestampType.without_timezone(), 100)
+    micros = Literal.of("2017-11-16T22:31:08").to(TimestampType.without_timezone()).value
+    timestamps = pa.array([micros, None], type=pa.timestamp("us"))
+    assert bucket.apply_batch(timestamps).to_pylist() == [bucket.apply(micros), None]
+
+    nanos = pa.array([micros * 1000 + 999, None], type=pa.timestamp("ns"))
+    assert bucket.apply_batch(nanos).to_pylist() == [bucket.apply(micros), None]
+
+    bucket = Bucket.get(DateType.get(), 100)
+    days = Literal.of("2017-11-16").to(DateType.get()).value
+    assert bucket.apply_batch(pa.array([days * 86400000], type=pa.date64())).to_pylist() == [bucket.apply(days)]
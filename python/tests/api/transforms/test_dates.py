@@ -16,9 +16,17 @@
 # under the License.
 
 
-from iceberg.api.expressions import Literal
+from iceberg.api import PartitionSpec, Schema
+from iceberg.api.expressions import (Expressions,
+                                     inclusive,
+                                     Literal,
+                                     Operation,
+                                     strict)
 from iceberg.api.transforms import Transforms
-from iceberg.api.types import DateType
+from iceberg.api.types import (DateType,
+                               NestedField)
+import numpy as np
+import pyarrow as pa
 import pytest
 
 
@@ -42,3 +50,31 @@ def test_date_to_human_string(transform_gran, expected):
 def test_null_human_string(transform_gran):
     type_var = DateType.get()
     assert transform_gran(type_var).to_human_string(None) == "null"
+
+
+@pytest.mark.parametrize("expr,inclusive_op,inclusive_value,strict_op,strict_value", [
+    (Expressions.less_than_or_equal("d", "2017-12-31"), Operation.LT_EQ, 575, Operation.LT, 576),
+    (Expressions.less_than("d", "2017-12-01"), Operation.LT_EQ, 574, Operation.LT, 575),
+    (Expressions.greater_than_or_equal("d", "2017-12-01"), Operation.GT_EQ, 575, Operation.GT, 574),
+    (Expressions.greater_than("d", "2017-11-30"), Operation.GT_EQ, 575, Operation.GT, 574)])
+def test_month_projection(expr, inclusive_op, inclusive_value, strict_op, strict_value):
+    spec = PartitionSpec.builder_for(Schema(NestedField.required(1, "d", DateType.get()))).month("d").build()
+
+    projected = inclusive(spec).project(expr)
+    assert projected.op == inclusive_op
+    assert projected.lit.value == inclusive_value
+
+    projected = strict(spec).project(expr)
+    assert projected.op == strict_op
+    assert projected.lit.value == strict_value
+
+
+@pytest.mark.parametrize("transform_gran", [Transforms.year, Transforms.month, Transforms.day])
+def test_apply_array_matches_apply(transform_gran):
+    transform = transform_gran(DateType.get())
+    days = np.array([-719162, -366, -365, -32, -31, -1, 0, 1, 31, 365, 17501, 2932896], dtype=np.int64)
+
+    assert transform.apply_array(days).tolist() == [transform.apply(int(day)) for day in days]
+
+    result = transform.apply_array(pa.array([-1, None, 17501], type=pa.date32()))
+    assert result.to_pylist() == [transform.apply(-1), None, transform.apply(17501)]
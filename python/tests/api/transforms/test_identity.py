@@ -17,15 +17,19 @@
 
 from decimal import Decimal
 
-from iceberg.api.expressions import Literal
+from iceberg.api.expressions import (Expressions,
+                                     Literal)
 from iceberg.api.transforms import (Identity,
                                     Transforms)
 from iceberg.api.types import (DateType,
                                DecimalType,
                                LongType,
+                               NestedField,
                                StringType,
+                               StructType,
                                TimestampType,
                                TimeType)
+import pyarrow as pa
 
 
 def test_null_human_string():
@@ -91,3 +95,17 @@ def test_big_decimal_to_human_string():
     dec_var = Decimal(dec_str)
 
     assert identity.to_human_string(dec_var) == dec_str
+
+
+def test_project_in():
+    struct = StructType.of([NestedField.required(1, "id", LongType.get())])
+    identity = Identity(LongType.get())
+
+    assert identity.project("id", Expressions.in_("id", [1, 2]).bind(struct)) == Expressions.in_("id", [1, 2])
+    assert identity.project_strict("id", Expressions.not_in("id", [1, 2]).bind(struct)) == Expressions.not_in("id", [1, 2])
+
+
+def test_apply_array():
+    values = pa.array([1, None, 3])
+
+    assert Identity.get(LongType.get()).apply_array(values) is values
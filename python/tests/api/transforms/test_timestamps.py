@@ -15,11 +15,21 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from iceberg.api.expressions import Literal
+from iceberg.api import PartitionSpec, Schema
+from iceberg.api.expressions import (Expressions,
+                                     inclusive,
+                                     Literal,
+                                     Operation,
+                                     strict)
 from iceberg.api.transforms import Transforms
-from iceberg.api.types import TimestampType
+from iceberg.api.types import (NestedField,
+                               TimestampType)
+import numpy as np
+import pyarrow as pa
 import pytest
 
+SCHEMA = Schema(NestedField.required(1, "ts", TimestampType.without_timezone()))
+
 
 @pytest.mark.parametrize("lit,type_var", [
     (Literal.of("2017-12-01T10:12:55.038194-08:00"), TimestampType.with_timezone()),
@@ -44,3 +54,86 @@ def test_ts_to_human_string(lit, type_var, transform_gran, expected):
 def test_null_human_string(transform_gran):
     type_var = TimestampType.with_timezone()
     assert "null" == transform_gran(type_var).to_human_string(None)
+
+
+@pytest.mark.parametrize("transform_gran,value,expected", [
+    (Transforms.hour, "2017-12-01T17:59:59.999999", 420041),
+    (Transforms.hour, "2017-12-01T18:00:00", 420042),
+    (Transforms.day, "2017-11-30T23:59:59.999999", 17500),
+    (Transforms.day, "2017-12-01T00:00:00", 17501),
+    (Transforms.day, "1969-12-31T23:59:59.999999", -1),
+    (Transforms.month, "2017-11-30T23:59:59.999999", 574),
+    (Transforms.month, "1969-12-31T23:59:59.999999", -1),
+    (Transforms.year, "2017-12-31T23:59:59.999999", 47),
+    (Transforms.year, "2018-01-01T00:00:00", 48)])
+def test_apply_at_boundaries(transform_gran, value, expected):
+    type_var = TimestampType.without_timezone()
+    assert transform_gran(type_var).apply(Literal.of(value).to(type_var).value) == expected
+
+
+@pytest.mark.parametrize("expr,op,expected", [
+    (Expressions.less_than("ts", "2017-12-01T00:00:00"), Operation.LT_EQ, 17500),
+    (Expressions.less_than_or_equal("ts", "2017-12-01T00:00:00"), Operation.LT_EQ, 17501),
+    (Expressions.greater_than("ts", "2017-11-30T23:59:59.999999"), Operation.GT_EQ, 17501),
+    (Expressions.greater_than_or_equal("ts", "2017-12-01T00:00:00"), Operation.GT_EQ, 17501),
+    (Expressions.equal("ts", "2017-12-01T10:00:00"), Operation.EQ, 17501)])
+def test_day_inclusive_projection(expr, op, expected):
+    spec = PartitionSpec.builder_for(SCHEMA).day("ts").build()
+    projected = inclusive(spec).project(expr)
+
+    assert projected.op == op
+    assert projected.ref.name == "ts_day"
+    assert projected.lit.value == expected
+
+
+@pytest.mark.parametrize("expr,op,expected", [
+    (Expressions.less_than("ts", "2017-12-01T00:00:00"), Operation.LT, 17501),
+    (Expressions.less_than_or_equal("ts", "2017-11-30T23:59:59.999999"), Operation.LT, 17501),
+    (Expressions.greater_than("ts", "2017-11-30T23:59:59.999999"), Operation.GT, 17500),
+    (Expressions.greater_than_or_equal("ts", "2017-12-01T00:00:00"), Operation.GT, 17500),
+    (Expressions.not_equal("ts", "2017-12-01T10:00:00"), Operation.NOT_EQ, 17501)])
+def test_day_strict_projection(expr, op, expected):
+    spec = PartitionSpec.builder_for(SCHEMA).day("ts").build()
+    projected = strict(spec).project(expr)
+
+    assert projected.op == op
+    assert projected.lit.value == expected
+
+
+def test_month_in_projection():
+    spec = PartitionSpec.builder_for(SCHEMA).month("ts").build()
+    expr = Expressions.in_("ts", ["2017-12-01T10:00:00", "2017-12-20T10:00:00", "2018-01-01T00:00:00"])
+
+    projected = inclusive(spec).project(expr)
+    assert projected.op == Operation.IN
+    assert projected.lit.value == {575, 576}
+    assert strict(spec).project(expr) == Expressions.always_false()
+
+    projected = strict(spec).project(Expressions.not_in("ts", ["2017-12-01T10:00:00", "2018-01-01T00:00:00"]))
+    assert projected.op == Operation.NOT_IN
+    assert projected.lit.value == {575, 576}
+
+
+@pytest.mark.parametrize("transform_gran", [Transforms.year, Transforms.month, Transforms.day, Transforms.hour])
+def test_apply_array_matches_apply(transform_gran):
+    transform = transform_gran(TimestampType.without_timezone())
+    micros = np.array([-62135596800000000, -86400000001, -3600000000, -1, 0, 1,
+                       3599999999, 86400000000, 1512151975038194, 253402300799999999], dtype=np.int64)
+
+    assert transform.apply_array(micros).tolist() == [transform.apply(int(value)) for value in micros]
+
+    result = transform.apply_array(pa.array([-1, None, 1512151975038194], type=pa.timestamp("us")))
+    assert result.to_pylist() == [transform.apply(-1), None, transform.apply(1512151975038194)]
+
+
+@pytest.mark.parametrize("transform_gran", [Transforms.year, Transforms.month, Transforms.day, Transforms.hour])
+def test_apply_array_converts_units_to_micros(transform_gran):
+    transform = transform_gran(TimestampType.with_timezone())
+    micros = [-86400000001, -1, 0, 1512151975038194]
+
+    nanos = pa.array([value * 1000 + 999 for value in micros] + [None], type=pa.timestamp("ns", tz="UTC"))
+    assert transform.apply_array(nanos).to_pylist() == [transform.apply(value) for value in micros] + [None]
+
+    seconds = pa.array([-86401, 1512151975], type=pa.timestamp("s"))
+    assert transform.apply_array(seconds).to_pylist() == [transform.apply(-86401000000),
+                                                          transform.apply(1512151975000000)]
@@ -17,11 +17,17 @@
 
 from decimal import Decimal
 
+from iceberg.api.expressions import (Expressions,
+                                     Operation)
 from iceberg.api.transforms import Truncate
 from iceberg.api.types import (DecimalType,
                                IntegerType,
                                LongType,
-                               StringType)
+                               NestedField,
+                               StringType,
+                               StructType)
+import numpy as np
+import pyarrow as pa
 import pytest
 
 
@@ -57,3 +63,78 @@ def test_truncate_decimal(input_var, expected):
 def test_truncate_string(input_var, expected):
     trunc = Truncate.get(StringType.get(), 5)
     assert trunc.apply(input_var) == expected
+
+
+def test_project_in():
+    struct = StructType.of([NestedField.required(1, "id", IntegerType.get()),
+                            NestedField.optional(2, "s", StringType.get())])
+
+    truncate = Truncate.get(IntegerType.get(), 10)
+    projected = truncate.project("id_trunc", Expressions.in_("id", [1, 5, 12]).bind(struct))
+    assert projected.op == Operation.IN
+    assert projected.lit.value == {0, 10}
+
+    projected = Truncate.get(StringType.get(), 2).project("s_trunc", Expressions.in_("s", ["abc", "abd"]).bind(struct))
+    assert projected.op == Operation.EQ
+    assert projected.lit.value == "ab"
+
+
+@pytest.mark.parametrize("type_var", [IntegerType.get(), LongType.get()])
+def test_truncate_integer_array(type_var):
+    trunc = Truncate.get(type_var, 10)
+    values = np.arange(-25, 25, dtype=np.int64)
+
+    assert trunc.apply_array(values).tolist() == [trunc.apply(int(value)) for value in values]
+    assert trunc.apply_array(pa.array([-1, None, 15])).to_pylist() == [-10, None, 10]
+
+
+def test_truncate_decimal_array():
+    trunc = Truncate.get(DecimalType.of(9, 2), 10)
+    values = [Decimal("12.34"), Decimal("-0.05"), None]
+
+    assert trunc.apply_array(pa.array(values)).to_pylist() == [Decimal("12.30"), Decimal("-0.10"), None]
+
+
+def test_truncate_string_array():
+    trunc = Truncate.get(StringType.get(), 2)
+    values = ["abc", "\u00e9t\u00e9", "a", None]
+    expected = ["ab", "\u00e9t", "a", None]
+
+    assert trunc.apply_array(pa.array(values)).to_pylist() == expected
+    assert trunc.apply_array(np.array(values, dtype=object)).tolist() == expected
+
+
+PROJECTION_STRUCT = StructType.of([NestedField.required(1, "id", LongType.get()),
+                                   NestedField.required(2, "d", DecimalType.of(9, 2)),
+                                   NestedField.required(3, "s", StringType.get())])
+
+
+@pytest.mark.parametrize("pred,inclusive_expected,strict_expected", [
+    (Expressions.less_than("id", 20), (Operation.LT_EQ, 10), (Operation.LT, 20)),
+    (Expressions.less_than_or_equal("id", 19), (Operation.LT_EQ, 10), (Operation.LT, 20)),
+    (Expressions.greater_than("id", 9), (Operation.GT_EQ, 10), (Operation.GT, 0)),
+    (Expressions.greater_than_or_equal("id", 10), (Operation.GT_EQ, 10), (Operation.GT, 0)),
+    (Expressions.equal("id", 15), (Operation.EQ, 10), None),
+    (Expressions.not_equal("id", 15), None, (Operation.NOT_EQ, 10)),
+    (Expressions.less_than("d", Decimal("1.00")), (Operation.LT_EQ, Decimal("0.90")), (Operation.LT, Decimal("1.00"))),
+    (Expressions.less_than_or_equal("d", Decimal("1.09")), (Operation.LT_EQ, Decimal("1.00")), (Operation.LT, Decimal("1.10"))),
+    (Expressions.greater_than("d", Decimal("1.09")), (Operation.GT_EQ, Decimal("1.10")), (Operation.GT, Decimal("1.00"))),
+    (Expressions.greater_than_or_equal("d", Decimal("1.10")), (Operation.GT_EQ, Decimal("1.10")), (Operation.GT, Decimal("1.00"))),
+    (Expressions.less_than("d", Decimal("-0.01")), (Operation.LT_EQ, Decimal("-0.10")), (Operation.LT, Decimal("-0.10"))),
+    (Expressions.less_than("s", "abcdef"), (Operation.LT_EQ, "abcd"), (Operation.LT, "abcd")),
+    (Expressions.greater_than("s", "abcdef"), (Operation.GT_EQ, "abcd"), (Operation.GT, "abcd")),
+    (Expressions.not_equal("s", "abcdef"), None, (Operation.NOT_EQ, "abcd")),
+    (Expressions.starts_with("s", "ab"), (Operation.STARTS_WITH, "ab"), (Operation.STARTS_WITH, "ab")),
+    (Expressions.starts_with("s", "abcd"), (Operation.STARTS_WITH, "abcd"), (Operation.STARTS_WITH, "abcd")),
+    (Expressions.starts_with("s", "abcdef"), (Operation.EQ, "abcd"), None)])
+def test_project(pred, inclusive_expected, strict_expected):
+    bound = pred.bind(PROJECTION_STRUCT)
+    field = PROJECTION_STRUCT.field(id=bound.ref.field_id)
+    trunc = Truncate.get(field.type, 4 if field.type == StringType.get() else 10)
+
+    for projected, expected in ((trunc.project("part", bound), inclusive_expected),
+                                (trunc.project_strict("part", bound), strict_expected)):
+        if expected is None:
+            assert projected is None
+        else:
+            assert (projected.op, projected.lit.value) == expected
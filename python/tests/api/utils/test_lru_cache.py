@@ -0,0 +1,48 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api.util import LRUCache
+
+
+def test_loads_missing_keys_once():
+    cache = LRUCache(2)
+    loads = list()
+
+    assert cache.get("a", lambda: loads.append("a")) is None
+    assert cache.get("a", lambda: loads.append("a")) is None
+    assert loads == ["a"]
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 3)
+    cache.get("c", lambda: 4)
+
+    assert len(cache) == 2
+    assert cache.get("a", lambda: 5) == 1
+    assert cache.get("b", lambda: 6) == 6
+
+
+def test_clear():
+    cache = LRUCache(2)
+    cache.get("a", lambda: 1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a", lambda: 2) == 2
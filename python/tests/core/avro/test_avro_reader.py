@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import datetime
+
+from fastavro import parse_schema, writer
+from iceberg.api import Schema
+from iceberg.api.types import (DateType,
+                               IntegerType,
+                               LongType,
+                               MapType,
+                               NestedField,
+                               StringType,
+                               StructType)
+from iceberg.core.avro import AvroReader
+from iceberg.core.filesystem import FileSystemInputFile
+import pytest
+
+WRITE_SCHEMA = {"type": "record", "name": "test",
+                "fields": [{"name": "id", "type": "long", "field-id": 1},
+                           {"name": "data", "type": ["null", "string"], "default": None, "field-id": 2},
+                           {"name": "day", "type": {"type": "int", "logicalType": "date"}, "field-id": 3},
+                           {"name": "location", "field-id": 4,
+                            "type": ["null", {"type": "record", "name": "r4",
+                                              "fields": [{"name": "x", "type": "int", "field-id": 5},
+                                                         {"name": "y", "type": "int", "field-id": 6}]}]},
+                           {"name": "props", "field-id": 7,
+                            "type": {"type": "map", "values": "string", "key-id": 8, "value-id": 9}}]}
+
+
+@pytest.fixture(scope="module")
+def avro_file(tmpdir_factory):
+    location = str(tmpdir_factory.mktemp("avro").join("data.avro"))
+    records = [{"id": i, "data": None if i % 2 else "d%s" % i, "day": datetime.date(2020, 1, 1 + i),
+                "location": {"x": i, "y": -i}, "props": {"k": str(i)}}
+               for i in range(10)]
+    with open(location, "wb") as fo:
+        writer(fo, parse_schema(WRITE_SCHEMA), records, sync_interval=64)
+
+    return FileSystemInputFile.from_location(location, dict())
+
+
+def test_read_all_columns(avro_file):
+    schema = Schema([NestedField.required(1, "id", LongType.get()),
+                     NestedField.optional(2, "data", StringType.get()),
+                     NestedField.required(3, "day", DateType.get()),
+                     NestedField.optional(7, "props", MapType.of_required(8, 9, StringType.get(),
+                                                                          StringType.get()))])
+    table = AvroReader(avro_file, schema).read()
+
+    assert table.column_names == ["id", "data", "day", "props"]
+    assert table.column("id").to_pylist() == list(range(10))
+    assert table.column("data").to_pylist()[:3] == ["d0", None, "d2"]
+    assert table.column("day").to_pylist()[1] == datetime.date(2020, 1, 2)
+    assert table.column("props").to_pylist()[3] == [("k", "3")]
+
+
+def test_projection_by_field_id(avro_file):
+    schema = Schema([NestedField.optional(4, "loc", StructType.of([NestedField.optional(6, "y_renamed",
+                                                                                        IntegerType.get()),
+                                                                   NestedField.optional(10, "z",
+                                                                                        IntegerType.get())])),
+                     NestedField.optional(11, "added", StringType.get())])
+    table = AvroReader(avro_file, schema).read()
+
+    assert table.column_names == ["loc", "added"]
+    assert table.column("loc").to_pylist()[2] == {"y_renamed": -2, "z": None}
+    assert table.column("added").null_count == 10
+
+
+def test_read_batches_per_block(avro_file):
+    schema = Schema([NestedField.required(1, "id", LongType.get())])
+    batches = list(AvroReader(avro_file, schema).read_batches())
+
+    assert len(batches) > 1
+    assert sum(batch.num_rows for batch in batches) == 10
+
+
+def test_limit_stops_decoding_blocks(avro_file):
+    schema = Schema([NestedField.required(1, "id", LongType.get())])
+    table = AvroReader(avro_file, schema, limit=1).read()
+
+    assert 1 <= table.num_rows < 10
+    assert table.column("id").to_pylist()[0] == 0
+
+
+def test_unprojected_fields_are_not_decoded(avro_file, monkeypatch):
+    decoded = list()
+    to_batch = AvroReader.to_batch
+
+    def record_fields(reader, records, projection):
+        decoded.extend(set(record) for record in records)
+        return to_batch(reader, records, projection)
+
+    monkeypatch.setattr(AvroReader, "to_batch", record_fields)
+    schema = Schema([NestedField.optional(2, "data", StringType.get()),
+                     NestedField.required(1, "id", LongType.get())])
+    table = AvroReader(avro_file, schema).read()
+
+    assert table.column("id").to_pylist() == list(range(10))
+    assert table.column("data").to_pylist()[:2] == ["d0", None]
+    assert decoded == [{"id", "data"}] * 10
+
+
+def test_reader_schema_keeps_referenced_named_types():
+    named = {"type": "record", "name": "r", "fields": [{"name": "x", "type": "int"}]}
+    writer_schema = {"type": "record", "name": "test",
+                     "fields": [{"name": "a", "type": named}, {"name": "b", "type": ["null", "r"]}]}
+
+    assert [field["name"] for field in AvroReader.reader_schema(writer_schema, [("a", None)])["fields"]] == ["a"]
+    assert AvroReader.reader_schema(writer_schema, [("b", None)]) is None
@@ -15,23 +15,34 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import json
 import os
 import random
 import tempfile
 import time
 
-from iceberg.api import Files, PartitionSpec, PartitionSpecBuilder, Schema
-from iceberg.api.types import BooleanType, IntegerType, LongType, NestedField, StringType
+from fastavro import parse_schema, writer
+from iceberg.api import FileFormat, Files, PartitionSpec, PartitionSpecBuilder, Schema
+from iceberg.api.types import BooleanType, Conversions, IntegerType, LongType, NestedField, StringType
 from iceberg.core import (BaseSnapshot,
                           BaseTable,
                           ConfigProperties,
+                          GenericDataFile,
                           GenericManifestFile,
+                          ManifestEntry,
+                          PartitionData,
+                          PartitionSpecParser,
+                          SchemaParser,
                           SnapshotLogEntry,
                           TableMetadata,
                           TableMetadataParser,
                           TableOperations,
                           TableProperties)
+from iceberg.core.avro import IcebergToAvro
+from iceberg.core.scan_summary import SnapshotSummaryBuilder
 from iceberg.exceptions import AlreadyExistsException, CommitFailedException
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 SCHEMA = Schema([NestedField.optional(1, "b", BooleanType.get())])
@@ -94,6 +105,7 @@ class TestTableOperations(TableOperations):
         self.last_snapshot_id = 0
         self._fail_commits = 0
         self.table_name = table_name
+        self.conf = dict()
         self.metadata = os.path.join(location, "metadata")
         os.makedirs(self.metadata)
         self._current = None
@@ -153,6 +165,45 @@ class TestTables(object):
         return TestTable(ops, name)
 
 
+def write_manifest(location, spec, entries):
+    avro_schema = IcebergToAvro.type_to_schema(ManifestEntry.get_schema(spec.partition_type()).as_struct(),
+                                               "manifest_entry")
+    records = list()
+    for entry in entries:
+        data_file = {"file_ordinal": None, "sort_columns": None, "block_size_in_bytes": 64 * 1024 * 1024,
+                     "file_format": "PARQUET", "column_sizes": [], "value_counts": [], "null_value_counts": [],
+                     "lower_bounds": [], "upper_bounds": []}
+        data_file.update(entry["data_file"])
+        records.append({"status": entry.get("status", 1), "snapshot_id": entry["snapshot_id"],
+                        "data_file": data_file})
+
+    with open(location, "wb") as fo:
+        writer(fo, parse_schema(avro_schema), records,
+               metadata={"schema": SchemaParser.to_json(spec.schema),
+                         "partition-spec": json.dumps(PartitionSpecParser.to_json_fields(spec)),
+                         "partition-spec-id": str(spec.spec_id)})
+
+    return location
+
+
+def write_data_file(location, partition, snapshot_id, arrays, names, metrics=None):
+    pq.write_table(pa.Table.from_arrays(arrays, names=names), location)
+    data_file = {"file_path": location, "partition": partition,
+                 "record_count": len(arrays[0]), "file_size_in_bytes": os.path.getsize(location)}
+    for metric, values in (metrics or dict()).items():
+        data_file[metric] = [{"key": field_id, "value": value} for field_id, value in values.items()]
+
+    return {"snapshot_id": snapshot_id, "data_file": data_file}
+
+
+def int_metrics(field_id, values):
+    present = [value for value in values if value is not None]
+    return {"value_counts": {field_id: len(values)},
+            "null_value_counts": {field_id: len(values) - len(present)},
+            "lower_bounds": {field_id: Conversions.to_byte_buffer(IntegerType.get(), min(present))},
+            "upper_bounds": {field_id: Conversions.to_byte_buffer(IntegerType.get(), max(present))}}
+
+
 @pytest.fixture(scope="session")
 def expected():
     return TableMetadata.new_table_metadata(None, SCHEMA, PartitionSpec.unpartitioned(), "file://tmp/db/table")
@@ -306,3 +357,98 @@ def split_planning_table(base_scan_schema):
                                    TableProperties.SPLIT_LOOKBACK: "{}".format(2 ** 31 - 1)})
 
         return table
+
+
+@pytest.fixture(scope="session")
+def data_table(tmpdir_factory):
+    location = str(tmpdir_factory.mktemp("data_table"))
+    schema = Schema([NestedField.required(1, "id", IntegerType.get()),
+                     NestedField.optional(2, "data", StringType.get()),
+                     NestedField.optional(3, "category", StringType.get())])
+    spec = PartitionSpecBuilder(schema).add(3, 1000, "category", "identity").build()
+
+    # data files don't contain the identity partition column, it is only stored in the manifest
+    entries = [write_data_file(os.path.join(location, "a.parquet"), {"category": "a"}, 1,
+                               [pa.array([1, 2, 3], pa.int32()), pa.array(["x", "y", "z"])], ["id", "data"],
+                               metrics=int_metrics(1, [1, 2, 3])),
+               write_data_file(os.path.join(location, "b.parquet"), {"category": "b"}, 1,
+                               [pa.array([4, 5], pa.int32()), pa.array(["x", None])], ["id", "data"],
+                               metrics=int_metrics(1, [4, 5]))]
+    manifest = write_manifest(os.path.join(location, "manifest.avro"), spec, entries)
+
+    ops = TestTableOperations("data_table", location)
+    timestamp = int(time.time() * 1000)
+    snapshot = BaseSnapshot(ops, 1, manifests=[GenericManifestFile(path=manifest, spec_id=spec.spec_id,
+                                                                   snapshot_id=1, added_files_count=2)],
+                            timestamp_millis=timestamp)
+    ops.commit(None, TableMetadata(ops, None, location, timestamp, 3, schema, spec.spec_id, [spec], dict(),
+                                   1, [snapshot], [SnapshotLogEntry(timestamp, 1)]))
+
+    return TestTable(ops, "data_table")
+
+
+@pytest.fixture(scope="session")
+def summary_table(tmpdir_factory):
+    location = str(tmpdir_factory.mktemp("summary_table"))
+    schema = Schema([NestedField.required(1, "id", IntegerType.get()),
+                     NestedField.optional(2, "category", StringType.get())])
+    spec = PartitionSpecBuilder(schema).add(2, 1000, "category", "identity").build()
+    ops = TestTableOperations("summary_table", location)
+
+    snapshots = list()
+    for snapshot_id, categories in enumerate([["a"], ["a", "b"], ["b", "c"]], 1):
+        summary = SnapshotSummaryBuilder()
+        for category in categories:
+            summary.added_file(spec, GenericDataFile("%s-%s.parquet" % (category, snapshot_id), FileFormat.PARQUET,
+                                                     100, 64 * 1024 * 1024, row_count=10,
+                                                     partition=PartitionData.from_json(spec.partition_type(),
+                                                                                       {"category": category})))
+
+        # manifests don't exist, so any attempt to read them fails
+        manifest = GenericManifestFile(path=os.path.join(location, "missing-%s.avro" % snapshot_id), spec_id=0,
+                                       snapshot_id=snapshot_id, added_files_count=len(categories))
+        snapshots.append(BaseSnapshot(ops, snapshot_id, snapshot_id - 1 if snapshot_id > 1 else None,
+                                      manifests=[manifest], timestamp_millis=1000 * snapshot_id,
+                                      operation="append", summary=summary.build()))
+
+    ops.commit(None, TableMetadata(ops, None, location, 3000, 2, schema, spec.spec_id, [spec], dict(), 3, snapshots,
+                                   [SnapshotLogEntry(snap.timestamp_millis, snap.snapshot_id) for snap in snapshots]))
+    return TestTable(ops, "summary_table")
+
+
+@pytest.fixture(scope="session")
+def append_table(tmpdir_factory):
+    location = str(tmpdir_factory.mktemp("append_table"))
+    schema = Schema([NestedField.required(1, "id", IntegerType.get()),
+                     NestedField.optional(2, "category", StringType.get())])
+    spec = PartitionSpecBuilder(schema).add(2, 1000, "category", "identity").build()
+    ops = TestTableOperations("append_table", location)
+
+    def data_file(snapshot_id, category, ids, status=1):
+        entry = write_data_file(os.path.join(location, "%s.parquet" % snapshot_id), {"category": category},
+                                snapshot_id, [pa.array(ids, pa.int32())], ["id"])
+        entry["status"] = status
+        return entry
+
+    def manifest(name, snapshot_id, entries):
+        path = write_manifest(os.path.join(location, name), spec, entries)
+        return GenericManifestFile(path=path, spec_id=spec.spec_id, snapshot_id=snapshot_id,
+                                   added_files_count=len([entry for entry in entries if entry["status"] == 1]),
+                                   existing_files_count=len([entry for entry in entries if entry["status"] == 0]),
+                                   deleted_files_count=len([entry for entry in entries if entry["status"] == 2]))
+
+    # snapshot 3 merges the manifests of snapshots 1 and 2, their files become EXISTING entries
+    m1 = manifest("m1.avro", 1, [data_file(1, "a", [1, 2])])
+    m2 = manifest("m2.avro", 2, [data_file(2, "b", [3])])
+    m3 = manifest("m3.avro", 3, [data_file(1, "a", [1, 2], status=0), data_file(2, "b", [3], status=0),
+                                 data_file(3, "a", [4, 5])])
+    m4 = manifest("m4.avro", 4, [data_file(1, "a", [1, 2], status=2), data_file(4, "b", [6])])
+
+    snapshots = [BaseSnapshot(ops, 1, None, manifests=[m1], timestamp_millis=1000, operation="append"),
+                 BaseSnapshot(ops, 2, 1, manifests=[m1, m2], timestamp_millis=2000, operation="append"),
+                 BaseSnapshot(ops, 3, 2, manifests=[m3], timestamp_millis=3000, operation="append"),
+                 BaseSnapshot(ops, 4, 3, manifests=[m3, m4], timestamp_millis=4000, operation="overwrite",
+                              summary={"deleted-data-files": "1"})]
+    ops.commit(None, TableMetadata(ops, None, location, 4000, 2, schema, spec.spec_id, [spec], dict(), 4, snapshots,
+                                   [SnapshotLogEntry(snap.timestamp_millis, snap.snapshot_id) for snap in snapshots]))
+    return TestTable(ops, "append_table")
@@ -0,0 +1,47 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+
+from iceberg.api.expressions import Expressions
+
+
+def file_names(files):
+    return sorted(os.path.basename(data_file.path()) for data_file in files)
+
+
+def test_added_files(append_table):
+    metadata = append_table.ops.current()
+
+    assert file_names(metadata.snapshot(1).added_files()) == ["1.parquet"]
+    assert file_names(metadata.snapshot(2).added_files()) == ["2.parquet"]
+    assert file_names(metadata.snapshot(3).added_files()) == ["3.parquet"]
+    assert metadata.snapshot(3).deleted_files() == []
+
+
+def test_deleted_files(append_table):
+    snapshot = append_table.ops.current().snapshot(4)
+
+    assert file_names(snapshot.added_files()) == ["4.parquet"]
+    assert file_names(snapshot.deleted_files()) == ["1.parquet"]
+
+
+def test_iterator(append_table):
+    snapshot = append_table.ops.current().snapshot(3)
+
+    assert file_names(snapshot.iterator()) == ["1.parquet", "2.parquet", "3.parquet"]
+    assert file_names(snapshot.filter_partitions(Expressions.equal("category", "b")).iterator()) == ["2.parquet"]
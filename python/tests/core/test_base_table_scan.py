@@ -16,7 +16,13 @@
 # under the License.
 
 from iceberg.api import Schema
+from iceberg.api.expressions import Binder, Expressions
 from iceberg.api.types import IntegerType, NestedField
+from iceberg.core import TableProperties
+from iceberg.core.data_table_scan import DataTableScan
+import pandas as pd
+import pyarrow as pa
+import pytest
 
 
 def test_table_scan_honors_select(ts_table):
@@ -36,3 +42,161 @@ def test_table_scan_honors_select_without_case_sensitivity(ts_table):
 
     assert scan1.schema.as_struct() == expected_schema.as_struct()
     assert scan2.schema.as_struct() == expected_schema.as_struct()
+
+
+def test_plan_files_without_case_sensitivity(data_table):
+    scan = data_table.new_scan().case_sensitive(False).filter(Expressions.greater_than("ID", 3))
+
+    assert sorted(task.file.record_count() for task in scan.plan_files()) == [2]
+    assert sorted(scan.select(["id"]).to_arrow_table().column("id").to_pylist()) == [4, 5]
+
+
+def test_scan_binds_normalized_filter(data_table):
+    scan = data_table.new_scan().filter(Expressions.greater_than("id", 5)).filter(Expressions.greater_than("id", 3))
+    struct = data_table.schema().as_struct()
+
+    assert scan.planning_filter == Expressions.greater_than("id", 5)
+    assert list(scan.plan_files()) == []
+
+    scan = data_table.new_scan().filter(Expressions.and_(Expressions.greater_than("id", 3),
+                                                         Expressions.greater_than("id", 1)))
+    tasks = list(scan.plan_files())
+    assert Binder.bind(struct, tasks[0]._residuals._expr) == Binder.bind(struct, Expressions.greater_than("id", 3))
+    assert sorted(scan.select(["id"]).to_arrow_table().column("id").to_pylist()) == [4, 5]
+
+
+def test_table_scan_to_arrow_table(data_table):
+    table = data_table.new_scan().select(["id", "category"]).to_arrow_table()
+
+    assert table.column_names == ["id", "category"]
+    assert sorted(zip(table.column("id").to_pylist(), table.column("category").to_pylist())) == \
+        [(1, "a"), (2, "a"), (3, "a"), (4, "b"), (5, "b")]
+
+
+def test_identity_partition_columns_are_not_read(data_table):
+    table = data_table.new_scan().select(["category"]).to_arrow_table()
+
+    assert pa.types.is_run_end_encoded(table.schema.field("category").type)
+    assert sorted(table.column("category").to_pandas()) == ["a", "a", "a", "b", "b"]
+
+
+def test_to_pandas_with_dictionary_columns(data_table):
+    frame = data_table.new_scan().select(["id", "data"]).to_pandas(dictionary_columns=["data"])
+
+    assert isinstance(frame["data"].dtype, pd.CategoricalDtype)
+    assert sorted(frame["data"].dropna()) == ["x", "x", "y", "z"]
+
+
+def test_dictionary_columns_from_scan_option(data_table):
+    scan = data_table.new_scan().select(["data"]).option(TableProperties.PARQUET_DICTIONARY_COLUMNS, "data")
+
+    assert pa.types.is_dictionary(scan.to_arrow_table().schema.field("data").type)
+
+
+def test_limit_stops_planning(data_table):
+    assert len(list(data_table.new_scan().limit(2).plan_files())) == 1
+    assert len(list(data_table.new_scan().limit(4).plan_files())) == 2
+    assert len(list(data_table.new_scan().limit(0).plan_files())) == 0
+
+
+def test_limit_does_not_stop_planning_with_filter(data_table):
+    scan = data_table.new_scan().filter(Expressions.greater_than("id", 0)).limit(1)
+
+    assert len(list(scan.plan_files())) == 2
+
+
+def test_limit_to_arrow_table(data_table):
+    assert data_table.new_scan().limit(4).to_arrow_table().num_rows == 4
+    assert data_table.new_scan().select(["id"]).limit(2).to_arrow_table().column("id").to_pylist() == [1, 2]
+
+
+def test_limit_with_filter_to_arrow_table(data_table):
+    scan = data_table.new_scan().filter(Expressions.greater_than("id", 1)).select(["id"])
+
+    assert scan.limit(2).to_arrow_table().column("id").to_pylist() == [2, 3]
+    assert scan.limit(3).to_arrow_table().column("id").to_pylist() == [2, 3, 4]
+    assert scan.limit(10).to_arrow_table().column("id").to_pylist() == [2, 3, 4, 5]
+
+
+def test_to_arrow_table_applies_residuals(data_table):
+    table = data_table.new_scan().filter(Expressions.greater_than("id", 1)).to_arrow_table()
+    assert sorted(table.column("id").to_pylist()) == [2, 3, 4, 5]
+
+    table = data_table.new_scan().filter(Expressions.equal("data", "x")).select(["id", "category"]).to_arrow_table()
+    assert sorted(zip(table.column("id").to_pylist(), table.column("category").to_pylist())) == [(1, "a"), (4, "b")]
+
+
+def metadata_only(scan):
+    def fail(*args, **kwargs):
+        raise AssertionError("Data files should not be read")
+
+    scan.read_task = fail
+    return scan
+
+
+def test_count_from_metadata(data_table):
+    assert metadata_only(data_table.new_scan()).count() == 5
+    assert metadata_only(data_table.new_scan().filter(Expressions.greater_than_or_equal("id", 4))).count() == 2
+    assert metadata_only(data_table.new_scan().filter(Expressions.equal("category", "a"))).count() == 3
+
+
+def test_count_reads_partially_matching_files(data_table):
+    assert data_table.new_scan().filter(Expressions.greater_than("id", 1)).count() == 4
+    assert data_table.new_scan().filter(Expressions.not_null("data")).count() == 4
+
+
+def test_aggregates_without_case_sensitivity(data_table):
+    scan = data_table.new_scan().case_sensitive(False)
+
+    assert metadata_only(scan.filter(Expressions.greater_than_or_equal("ID", 4))).count() == 2
+    assert scan.filter(Expressions.greater_than("ID", 1)).count() == 4
+    assert scan.filter(Expressions.less_than("ID", 5)).max("ID") == 4
+    assert metadata_only(scan.filter(Expressions.equal("CATEGORY", "b"))).min("ID") == 4
+
+
+def test_min_max_from_metadata(data_table):
+    assert metadata_only(data_table.new_scan()).min("id") == 1
+    assert metadata_only(data_table.new_scan()).max("id") == 5
+
+
+def test_min_max_reads_partially_matching_files(data_table):
+    assert data_table.new_scan().filter(Expressions.less_than("id", 5)).max("id") == 4
+    assert data_table.new_scan().max("data") == "z"
+    assert data_table.new_scan().filter(Expressions.greater_than("id", 3)).min("data") == "x"
+    assert data_table.new_scan().filter(Expressions.greater_than("id", 1)).min("category") == "a"
+
+
+def test_as_of_time(append_table):
+    assert append_table.new_scan().as_of_time(2000).snapshot_id == 2
+    assert append_table.new_scan().as_of_time(2999).snapshot_id == 2
+    assert append_table.new_scan().as_of_time(10000).snapshot_id == 4
+
+
+def test_as_of_time_before_first_snapshot(append_table):
+    with pytest.raises(RuntimeError):
+        append_table.new_scan().as_of_time(999)
+
+
+def test_plan_files_for_snapshots(append_table, monkeypatch):
+    planned = list()
+    get_scans_for_manifest = DataTableScan.get_scans_for_manifest
+
+    def counting_get_scans(scan, manifest):
+        planned.append(manifest.manifest_path)
+        return get_scans_for_manifest(scan, manifest)
+
+    monkeypatch.setattr(DataTableScan, "get_scans_for_manifest", counting_get_scans)
+    tasks = append_table.new_scan().plan_files_for_snapshots([1, 2, 3])
+
+    assert {snapshot_id: sorted(task.file.path().split("/")[-1] for task in snapshot_tasks)
+            for snapshot_id, snapshot_tasks in tasks.items()} == {1: ["1.parquet"],
+                                                                  2: ["1.parquet", "2.parquet"],
+                                                                  3: ["1.parquet", "2.parquet", "3.parquet"]}
+    assert sorted(path.split("/")[-1] for path in planned) == ["m1.avro", "m2.avro", "m3.avro"]
+
+
+def test_plan_files_for_snapshots_with_filter(append_table):
+    tasks = append_table.new_scan().filter(Expressions.equal("category", "b")).plan_files_for_snapshots([2, 4])
+
+    assert [task.file.path().split("/")[-1] for task in tasks[2]] == ["2.parquet"]
+    assert sorted(task.file.path().split("/")[-1] for task in tasks[4]) == ["2.parquet", "4.parquet"]
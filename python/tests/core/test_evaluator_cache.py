@@ -0,0 +1,61 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api import PartitionSpec, Schema
+from iceberg.api.expressions import Expressions
+from iceberg.api.types import IntegerType, NestedField, StringType
+from iceberg.core.evaluator_cache import EvaluatorCache
+
+SCHEMA = Schema(NestedField.required(1, "id", IntegerType.get()),
+                NestedField.optional(2, "category", StringType.get()))
+
+
+def spec():
+    return PartitionSpec.builder_for(SCHEMA).identity("category").build()
+
+
+def test_evaluators_shared_by_equal_filters_and_specs():
+    first = EvaluatorCache.manifest_evaluator(spec(), Expressions.equal("category", "a"))
+    second = EvaluatorCache.manifest_evaluator(spec(), Expressions.equal("category", "a"))
+
+    assert first is second
+    assert EvaluatorCache.partition_evaluator(spec(), Expressions.equal("category", "a")) \
+        is EvaluatorCache.partition_evaluator(spec(), Expressions.equal("category", "a"))
+    assert EvaluatorCache.metrics_evaluator(SCHEMA, Expressions.less_than("id", 5)) \
+        is EvaluatorCache.metrics_evaluator(SCHEMA, Expressions.less_than("id", 5))
+
+
+def test_evaluators_keyed_by_filter_and_case_sensitivity():
+    evaluator = EvaluatorCache.manifest_evaluator(spec(), Expressions.equal("category", "a"))
+
+    assert evaluator is not EvaluatorCache.manifest_evaluator(spec(), Expressions.equal("category", "b"))
+    assert evaluator is not EvaluatorCache.manifest_evaluator(spec(), Expressions.equal("category", "a"),
+                                                              case_sensitive=False)
+
+
+def test_clear_cache():
+    evaluator = EvaluatorCache.residual_evaluator(spec(), Expressions.equal("category", "a"))
+    EvaluatorCache.clear_cache()
+
+    assert evaluator is not EvaluatorCache.residual_evaluator(spec(), Expressions.equal("category", "a"))
+
+
+def test_scans_share_evaluators(data_table):
+    first = list(data_table.new_scan().filter(Expressions.equal("category", "a")).plan_files())
+    second = list(data_table.new_scan().filter(Expressions.equal("category", "a")).plan_files())
+
+    assert first[0]._residuals is second[0]._residuals
@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+
+from iceberg.api.expressions import Expressions
+import pytest
+
+
+def planned_files(scan):
+    return sorted(os.path.basename(task.file.path()) for task in scan.plan_files())
+
+
+def test_incremental_scan_returns_added_files(append_table):
+    scan = append_table.new_scan().incremental_scan(1, 3)
+
+    assert scan.snapshot_ids == [2, 3]
+    assert planned_files(scan) == ["2.parquet", "3.parquet"]
+
+
+def test_incremental_scan_single_snapshot(append_table):
+    assert planned_files(append_table.new_scan().incremental_scan(2, 3)) == ["3.parquet"]
+    assert planned_files(append_table.new_scan().incremental_scan(3, 3)) == []
+
+
+def test_incremental_scan_refinements(append_table):
+    scan = append_table.new_scan().incremental_scan(1, 3).filter(Expressions.equal("category", "a"))
+
+    assert planned_files(scan) == ["3.parquet"]
+    assert scan.select(["id"]).to_arrow_table().column("id").to_pylist() == [4, 5]
+
+
+def test_incremental_scan_requires_ancestor(append_table):
+    with pytest.raises(RuntimeError):
+        append_table.new_scan().incremental_scan(3, 2)
+
+
+def test_incremental_scan_rejects_overwrite(append_table):
+    with pytest.raises(RuntimeError):
+        append_table.new_scan().incremental_scan(1)
+
+
+def test_incremental_scan_range_is_fixed(append_table):
+    with pytest.raises(RuntimeError):
+        append_table.new_scan().incremental_scan(1, 3).incremental_scan(2, 3)
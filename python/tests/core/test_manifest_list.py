@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+
+from fastavro import parse_schema, writer
+from iceberg.api import ManifestFile
+from iceberg.api.types import Conversions, IntegerType
+from iceberg.core import BaseSnapshot
+from iceberg.core.avro import IcebergToAvro
+from iceberg.core.filesystem import FileSystemInputFile
+from iceberg.core.manifest_list import ManifestList
+import pytest
+
+
+def write_manifest_list(location, count):
+    schema = parse_schema(IcebergToAvro.type_to_schema(ManifestFile.schema().as_struct(), "manifest_file"))
+    records = [{"manifest_path": "m%s.avro" % i, "manifest_length": 100 + i, "partition_spec_id": 0,
+                "added_snapshot_id": i, "added_data_files_count": 1, "existing_data_files_count": 2,
+                "deleted_data_files_count": 3,
+                "partitions": [{"contains_null": False,
+                                "lower_bound": Conversions.to_byte_buffer(IntegerType.get(), i),
+                                "upper_bound": Conversions.to_byte_buffer(IntegerType.get(), i + 1)}]}
+               for i in range(count)]
+    with open(location, "wb") as fo:
+        writer(fo, schema, records)
+
+    return FileSystemInputFile.from_location(location, dict())
+
+
+@pytest.fixture
+def manifest_list_file(tmpdir):
+    ManifestList.clear_cache()
+    yield write_manifest_list(os.path.join(str(tmpdir), "snap-1.avro"), 3)
+    ManifestList.clear_cache()
+
+
+def test_decodes_manifest_files(manifest_list_file):
+    manifests = list(ManifestList.read(manifest_list_file))
+
+    assert [manifest.manifest_path for manifest in manifests] == ["m0.avro", "m1.avro", "m2.avro"]
+    manifest = manifests[1]
+    assert manifest.length == 101
+    assert manifest.snapshot_id == 1
+    assert (manifest.added_files_count, manifest.existing_files_count, manifest.deleted_files_count) == (1, 2, 3)
+    assert Conversions.from_byte_buffer(IntegerType.get(), manifest.partitions[0].upper_bound()) == 2
+
+
+def test_snapshot_reads_manifest_list_once(manifest_list_file):
+    snapshot = BaseSnapshot(None, 1, manifest_list=manifest_list_file)
+
+    assert snapshot.manifests is snapshot.manifests
+    assert len(snapshot.manifests) == 3
+
+
+def test_cache_is_bounded(manifest_list_file, tmpdir, monkeypatch):
+    monkeypatch.setattr(ManifestList._cache, "max_size", 2)
+    first = ManifestList.read(manifest_list_file)
+    for i in range(2):
+        ManifestList.read(write_manifest_list(os.path.join(str(tmpdir), "snap-%s.avro" % (i + 2)), 1))
+
+    assert ManifestList.read(manifest_list_file) is not first
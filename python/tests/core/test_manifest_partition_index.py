@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api import PartitionSpec, Schema
+from iceberg.api.expressions import Expressions, InclusiveManifestEvaluator
+from iceberg.api.types import Conversions, IntegerType, NestedField, StringType
+from iceberg.core import GenericManifestFile
+from iceberg.core.generic_partition_field_summary import GenericPartitionFieldSummary
+from iceberg.core.manifest_partition_index import ManifestPartitionIndex
+import pytest
+
+SCHEMA = Schema(NestedField.required(1, "id", IntegerType.get()),
+                NestedField.optional(2, "category", StringType.get()))
+SPEC = PartitionSpec.builder_for(SCHEMA).identity("id").identity("category").build()
+
+
+def summary(type_var, lower, upper, contains_null=False):
+    return GenericPartitionFieldSummary(contains_null=contains_null,
+                                        lower_bound=None if lower is None else Conversions.to_byte_buffer(type_var, lower),
+                                        upper_bound=None if upper is None else Conversions.to_byte_buffer(type_var, upper))
+
+
+def manifest(name, ids, categories, contains_null=False):
+    return GenericManifestFile(path=name, spec_id=SPEC.spec_id,
+                               partitions=[summary(IntegerType.get(), *ids),
+                                           summary(StringType.get(), *categories, contains_null=contains_null)])
+
+
+@pytest.fixture(scope="module")
+def manifests():
+    return [manifest("m1", (0, 9), ("a", "c")),
+            manifest("m2", (10, 19), ("b", "d")),
+            manifest("m3", (5, 15), (None, None), contains_null=True),
+            manifest("m4", (20, 29), ("x", "z"), contains_null=True),
+            manifest("m6", (30, 39), ("a", "a")),
+            GenericManifestFile(path="m5", spec_id=SPEC.spec_id)]
+
+
+@pytest.mark.parametrize("row_filter", [
+    Expressions.always_true(),
+    Expressions.always_false(),
+    Expressions.less_than("id", 5),
+    Expressions.less_than_or_equal("id", 5),
+    Expressions.greater_than("id", 19),
+    Expressions.greater_than_or_equal("id", 19),
+    Expressions.equal("id", 15),
+    Expressions.equal("id", 100),
+    Expressions.equal("id", 1),
+    Expressions.equal("id", 38),
+    Expressions.not_equal("id", 15),
+    Expressions.in_("id", [3, 100]),
+    Expressions.in_("id", [-5, 16, 17, 40]),
+    Expressions.in_("id", [36, 38]),
+    Expressions.not_in("category", ["a", "c"]),
+    Expressions.is_null("category"),
+    Expressions.not_null("category"),
+    Expressions.equal("category", "c"),
+    Expressions.starts_with("category", "a"),
+    Expressions.starts_with("category", "cc"),
+    Expressions.starts_with("category", "e"),
+    Expressions.starts_with("category", "y"),
+    Expressions.and_(Expressions.greater_than("id", 8), Expressions.less_than("category", "c")),
+    Expressions.or_(Expressions.equal("id", 25), Expressions.equal("category", "a")),
+    Expressions.not_(Expressions.greater_than_or_equal("id", 10))])
+def test_matches_manifest_evaluator(manifests, row_filter):
+    index = ManifestPartitionIndex(manifests, lambda spec_id: SPEC)
+    evaluator = InclusiveManifestEvaluator(SPEC, row_filter)
+
+    assert index.matching_manifests(row_filter) == [m for m in manifests if evaluator.eval(m)]
+
+
+def test_keeps_manifest_order(manifests):
+    index = ManifestPartitionIndex(manifests, lambda spec_id: SPEC)
+
+    matched = index.matching_manifests(Expressions.greater_than("id", 12))
+    assert [m.manifest_path for m in matched] == ["m2", "m3", "m4", "m6", "m5"]
+
+
+def test_cached_per_snapshot(data_table):
+    metadata = data_table.ops.current()
+    snapshot = metadata.current_snapshot()
+
+    assert metadata.manifest_index(snapshot) is metadata.manifest_index(snapshot)
+
+
+@pytest.mark.parametrize("row_filter,expected", [
+    (Expressions.equal("id", 100), ["empty"]),
+    (Expressions.equal("id", 5), ["m1", "empty", "partial"]),
+    (Expressions.is_null("category"), ["empty", "partial"]),
+    (Expressions.not_null("category"), ["m1", "empty", "partial"]),
+    (Expressions.in_("category", ["a", "q"]), ["m1", "empty", "partial"]),
+    (Expressions.starts_with("category", "c"), ["m1", "empty", "partial"]),
+    (Expressions.less_than("category", "a"), ["empty", "partial"]),
+    (Expressions.not_in("category", ["a", "b"]), ["m1", "empty", "partial"])])
+def test_missing_summaries_might_match(row_filter, expected):
+    manifests = [manifest("m1", (0, 9), ("a", "c")),
+                 GenericManifestFile(path="empty", spec_id=SPEC.spec_id, partitions=list()),
+                 GenericManifestFile(path="partial", spec_id=SPEC.spec_id,
+                                     partitions=[summary(IntegerType.get(), 5, 5)])]
+    index = ManifestPartitionIndex(manifests, lambda spec_id: SPEC)
+
+    assert [m.manifest_path for m in index.matching_manifests(row_filter)] == expected
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import random
+
+from iceberg.api.expressions import Expressions
+from iceberg.core.scan_summary import ScanSummary, TopN
+import pytest
+
+
+def test_scan_summary_from_manifests(data_table):
+    summary = ScanSummary.of(data_table.new_scan()).build()
+
+    assert list(summary.keys()) == ["category=a", "category=b"]
+    assert summary["category=a"].file_count == 1
+    assert summary["category=a"].record_count == 3
+    assert summary["category=b"].record_count == 2
+    assert summary["category=b"].total_size > 0
+
+
+def test_scan_summary_with_filter_and_limit(data_table):
+    filtered = ScanSummary.of(data_table.new_scan().filter(Expressions.equal("category", "b"))).build()
+    assert list(filtered.keys()) == ["category=b"]
+
+    assert list(ScanSummary.of(data_table.new_scan()).limit(1).build().keys()) == ["category=a"]
+
+    with pytest.raises(RuntimeError):
+        ScanSummary.of(data_table.new_scan()).limit(1).throw_if_limited().build()
+
+
+def test_top_n_keeps_smallest_keys():
+    top_n = TopN(10, False, lambda x, y: 0 if x == y else -1 if x < y else 1)
+    keys = [random.randint(0, 1000) for _ in range(5000)]
+    for key in keys:
+        top_n.update(key, lambda count: 1 if count is None else count + 1)
+
+    expected = sorted(set(keys))[:10]
+    assert list(top_n.get().keys()) == expected
+    assert [top_n.get()[key] for key in expected] == [keys.count(key) for key in expected]
+
+
+def test_scan_summary_from_partition_summaries(summary_table):
+    summary = ScanSummary.of(summary_table.new_scan()).after(2000).build()
+
+    assert list(summary.keys()) == ["category=a", "category=b", "category=c"]
+    assert summary["category=a"].file_count == 1
+    assert summary["category=b"].file_count == 2
+    assert summary["category=b"].record_count == 20
+    assert summary["category=b"].total_size == 200
+    assert summary["category=b"].data_timestamp_millis == 3000
+    assert summary["category=c"].data_timestamp_millis == 3000
+
+
+def test_scan_summary_time_range_with_expired_snapshots(summary_table):
+    with pytest.raises(RuntimeError):
+        ScanSummary.of(summary_table.new_scan()).after(500).build()
@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api import PartitionSpec, Schema
+from iceberg.api.types import IntegerType, NestedField
+from iceberg.core import BaseSnapshot, SnapshotLogEntry, TableMetadata
+from iceberg.core.snapshot_ancestry import SnapshotAncestry
+import pytest
+
+
+def snapshot(snapshot_id, parent_id, timestamp_millis):
+    return BaseSnapshot(None, snapshot_id, parent_id, manifests=list(), timestamp_millis=timestamp_millis)
+
+
+@pytest.fixture(scope="module")
+def ancestry():
+    # 1 <- 2 <- 3 <- 5 is the current lineage, 4 branches from 2 and 7's parent has expired
+    return SnapshotAncestry([snapshot(1, None, 100), snapshot(2, 1, 200), snapshot(3, 2, 300),
+                             snapshot(4, 2, 400), snapshot(5, 3, 500), snapshot(7, 6, 700)], 5)
+
+
+def test_lineage(ancestry):
+    assert ancestry.lineage == [1, 2, 3, 5]
+    assert ancestry.ancestor_ids(3) == [1, 2, 3]
+    assert ancestry.ancestor_ids(4) == [1, 2, 4]
+    assert ancestry.ancestor_ids(7) == [7]
+
+
+def test_is_ancestor(ancestry):
+    assert ancestry.is_ancestor(1, 5)
+    assert ancestry.is_ancestor(2, 4)
+    assert ancestry.is_ancestor(5, 5)
+    assert not ancestry.is_ancestor(3, 4)
+    assert not ancestry.is_ancestor(5, 3)
+    assert not ancestry.is_ancestor(1, 7)
+    assert not ancestry.is_ancestor(6, 7)
+
+
+def test_ancestors_between(ancestry):
+    assert ancestry.ancestors_between(1, 5) == [2, 3, 5]
+    assert ancestry.ancestors_between(2, 4) == [4]
+    assert ancestry.ancestors_between(5, 5) == []
+
+    with pytest.raises(RuntimeError):
+        ancestry.ancestors_between(3, 4)
+
+
+def test_snapshots_in_time_range(ancestry):
+    assert [snap.snapshot_id for snap in ancestry.snapshots_in_time_range(150, 500)] == [2, 3, 5]
+    assert [snap.snapshot_id for snap in ancestry.snapshots_in_time_range(float("-inf"), 200)] == [1, 2]
+    assert ancestry.snapshots_in_time_range(600, float("inf")) == []
+
+
+def test_add_snapshot_updates_ancestry():
+    schema = Schema([NestedField.required(1, "id", IntegerType.get())])
+    spec = PartitionSpec.unpartitioned()
+    metadata = TableMetadata(None, None, "file:/tmp/table", 100, 1, schema, spec.spec_id, [spec], dict(), 1,
+                             [snapshot(1, None, 100)], [SnapshotLogEntry(100, 1)])
+
+    updated = metadata.add_snapshot(snapshot(2, 1, 200))
+
+    assert updated.current_snapshot().snapshot_id == 2
+    assert updated.ancestry.lineage == [1, 2]
+    assert metadata.ancestry.lineage == [1]
+
+
+def test_add_staged_snapshot_keeps_current():
+    schema = Schema([NestedField.required(1, "id", IntegerType.get())])
+    spec = PartitionSpec.unpartitioned()
+    metadata = TableMetadata(None, None, "file:/tmp/table", 100, 1, schema, spec.spec_id, [spec], {"k": "v"}, 1,
+                             [snapshot(1, None, 100)], [SnapshotLogEntry(100, 1)])
+    lineage = metadata.ancestry.lineage
+
+    updated = metadata.add_staged_snapshot(snapshot(2, 1, 200))
+
+    assert updated.current_snapshot().snapshot_id == 1
+    assert updated.snapshot(2).snapshot_id == 2
+    assert updated.properties["k"] == "v"
+    assert updated.snapshot_log == [SnapshotLogEntry(100, 1)]
+    assert [snap.snapshot_id for snap in metadata.snapshots] == [1]
+    assert metadata.ancestry.lineage is lineage
+
+
+def test_replace_current_snapshot():
+    schema = Schema([NestedField.required(1, "id", IntegerType.get())])
+    spec = PartitionSpec.unpartitioned()
+    metadata = TableMetadata(None, None, "file:/tmp/table", 100, 1, schema, spec.spec_id, [spec], {"k": "v"}, 1,
+                             [snapshot(1, None, 100)], [SnapshotLogEntry(100, 1)])
+
+    updated = metadata.replace_current_snapshot(snapshot(2, 1, 200))
+
+    assert updated.current_snapshot().snapshot_id == 2
+    assert updated.properties["k"] == "v"
+    assert updated.ancestry.lineage == [1, 2]
+    assert updated.snapshot_log == [SnapshotLogEntry(100, 1), SnapshotLogEntry(200, 2)]
+    assert [snap.snapshot_id for snap in metadata.snapshots] == [1]
+    assert len(metadata.snapshot_log) == 1
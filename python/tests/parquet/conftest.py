@@ -0,0 +1,71 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+from iceberg.api import Schema
+from iceberg.api.types import (IntegerType,
+                               LongType,
+                               NestedField,
+                               StringType,
+                               StructType)
+from iceberg.core.filesystem import FileSystemInputFile
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+
+def field(name, arrow_type, field_id, nullable=True):
+    return pa.field(name, arrow_type, nullable=nullable, metadata={b"PARQUET:field_id": str(field_id)})
+
+
+@pytest.fixture(scope="session")
+def parquet_file(tmpdir_factory):
+    location = str(tmpdir_factory.mktemp("parquet").join("data.parquet"))
+    location_struct = pa.struct([field("x", pa.int64(), 4), field("y", pa.string(), 5)])
+    arrow_schema = pa.schema([field("id", pa.int32(), 1, nullable=False),
+                              field("data", pa.string(), 2),
+                              field("location", location_struct, 3)])
+
+    table = pa.Table.from_arrays([pa.array([1, 2, 3], pa.int32()),
+                                  pa.array(["a", "b", None]),
+                                  pa.array([{"x": 1, "y": "p"}, None, {"x": 3, "y": "r"}], location_struct)],
+                                 schema=arrow_schema)
+    pq.write_table(table, location, row_group_size=1)
+    return location
+
+
+@pytest.fixture(scope="session")
+def parquet_file_without_ids(tmpdir_factory):
+    location = str(tmpdir_factory.mktemp("parquet").join("no_ids.parquet"))
+    pq.write_table(pa.table({"id": pa.array([1, 2], pa.int32()), "data": ["a", "b"]}), location)
+    return location
+
+
+@pytest.fixture(scope="session")
+def input_file():
+    def open_file(location):
+        return FileSystemInputFile.from_location(location, dict())
+    return open_file
+
+
+@pytest.fixture(scope="session")
+def renamed_schema():
+    return Schema([NestedField.required(1, "renamed_id", LongType.get()),
+                   NestedField.optional(3, "loc", StructType.of([NestedField.optional(5, "y_renamed",
+                                                                                      StringType.get()),
+                                                                 NestedField.optional(6, "z", IntegerType.get())])),
+                   NestedField.optional(7, "added", StringType.get())])
@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api import Schema
+from iceberg.api.types import (IntegerType,
+                               NestedField,
+                               StringType)
+from iceberg.parquet import ParquetReader
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def test_projection_by_field_id(parquet_file, input_file, renamed_schema):
+    table = ParquetReader(input_file(parquet_file), renamed_schema).read()
+
+    assert table.column_names == ["renamed_id", "loc", "added"]
+    assert table.column("renamed_id").to_pylist() == [1, 2, 3]
+    assert table.column("loc").to_pylist() == [{"y_renamed": "p", "z": None},
+                                               None,
+                                               {"y_renamed": "r", "z": None}]
+    assert table.column("added").to_pylist() == [None, None, None]
+
+
+def test_column_paths_only_include_projected_leaves(parquet_file, renamed_schema):
+    file_schema = pq.ParquetFile(parquet_file).schema_arrow
+
+    assert ParquetReader.column_paths(renamed_schema.as_struct().fields,
+                                      ParquetReader.index_fields(file_schema)) == ["id", "location.y"]
+
+
+def test_projection_falls_back_to_names(parquet_file_without_ids, input_file):
+    schema = Schema([NestedField.optional(10, "data", StringType.get())])
+    table = ParquetReader(input_file(parquet_file_without_ids), schema).read()
+
+    assert table.column_names == ["data"]
+    assert table.column("data").to_pylist() == ["a", "b"]
+
+
+def test_split_reads_row_groups_in_range(parquet_file, input_file):
+    schema = Schema([NestedField.required(1, "id", IntegerType.get())])
+    metadata = pq.ParquetFile(parquet_file).metadata
+    second_offset = ParquetReader.row_group_offset(metadata.row_group(1))
+
+    first = ParquetReader(input_file(parquet_file), schema, start=0, length=second_offset).read()
+    rest = ParquetReader(input_file(parquet_file), schema, start=second_offset, length=1 << 30).read()
+
+    assert first.column("id").to_pylist() == [1]
+    assert rest.column("id").to_pylist() == [2, 3]
+
+
+def test_constant_columns_are_not_read(parquet_file, input_file):
+    schema = Schema([NestedField.required(1, "id", IntegerType.get()),
+                     NestedField.optional(2, "data", StringType.get())])
+    table = ParquetReader(input_file(parquet_file), schema, constants={2: "const"}).read()
+
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert pa.types.is_run_end_encoded(table.schema.field("data").type)
+    assert table.column("data").chunk(0).values.to_pylist() == ["const"]
+    assert table.to_pandas()["data"].tolist() == ["const", "const", "const"]
+
+
+def test_dictionary_columns(parquet_file, input_file):
+    schema = Schema([NestedField.optional(2, "data", StringType.get())])
+    table = ParquetReader(input_file(parquet_file), schema, dictionary_ids=[2]).read()
+
+    assert table.schema.field("data").type == pa.dictionary(pa.int32(), pa.string())
+    assert table.column("data").to_pylist() == ["a", "b", None]
+
+
+def test_dictionary_threshold(parquet_file, input_file):
+    schema = Schema([NestedField.optional(2, "data", StringType.get())])
+
+    low_cardinality = ParquetReader(input_file(parquet_file), schema, dictionary_threshold=1.0).read()
+    high_cardinality = ParquetReader(input_file(parquet_file), schema, dictionary_threshold=0.1).read()
+
+    assert pa.types.is_dictionary(low_cardinality.schema.field("data").type)
+    assert high_cardinality.schema.field("data").type == pa.string()
+    assert high_cardinality.column("data").to_pylist() == ["a", "b", None]
+
+
+def test_limit_skips_trailing_row_groups(parquet_file, input_file):
+    schema = Schema([NestedField.required(1, "id", IntegerType.get())])
+    table = ParquetReader(input_file(parquet_file), schema, limit=2).read()
+
+    assert table.column("id").to_pylist() == [1, 2]